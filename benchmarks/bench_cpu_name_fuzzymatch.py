@@ -0,0 +1,57 @@
+"""
+Micro-benchmark of the CPU name fuzzy match: former pandas implementation against CPUNameIndex.
+
+    python -m benchmarks.bench_cpu_name_fuzzymatch
+"""
+import os
+import timeit
+
+import pandas as pd
+from rapidfuzz import fuzz
+
+from boaviztapi import config
+from boaviztapi.utils.fuzzymatch import CPUNameIndex
+
+CPU_SPECS = os.path.join(os.path.dirname(__file__), '../boaviztapi/data/crowdsourcing/cpu_specs.csv')
+
+CPU_NAMES = [
+    "Intel(R) Xeon(R) CPU E5-2660 0 @ 2.20GHz",
+    "AMD EPYC 7R32 48-Core Processor",
+    "Intel(R) Core(TM) i7-8550U CPU @ 1.80GHz",
+    "AMD Ryzen 9 5900X 12-Core Processor",
+    "Intel(R) Xeon(R) Platinum 8175M CPU @ 2.50GHz",
+    "unknown cpu",
+]
+
+
+def legacy_fuzzymatch_attr_from_cpu_name(cpu_name: str, df: pd.DataFrame):
+    cpu_name = cpu_name.lower()
+    score = df["name"].str.lower().apply(lambda x: fuzz.token_set_ratio(x, cpu_name))
+    if score.max() <= config["cpu_name_fuzzymatch_threshold"]:
+        return None
+    return df.iloc[score.idxmax()]
+
+
+def bench(label, function, number, unit=f"{len(CPU_NAMES)} names"):
+    seconds = min(timeit.repeat(function, number=number, repeat=5)) / number
+    print(f"{label:<40} {seconds * 1000:8.3f} ms / {unit}")
+    return seconds
+
+
+def main():
+    df = pd.read_csv(CPU_SPECS)
+    bench("CPUNameIndex build (once per process)", lambda: CPUNameIndex(df), 5, unit="build")
+    index = CPUNameIndex(df)
+
+    legacy = bench("legacy pandas apply", lambda: [legacy_fuzzymatch_attr_from_cpu_name(n, df) for n in CPU_NAMES], 5)
+    single = bench("CPUNameIndex.match", lambda: [index.match(n) for n in CPU_NAMES], 20)
+    bulk = bench("CPUNameIndex.match_many", lambda: index.match_many(CPU_NAMES), 20)
+    bulk_parallel = bench("CPUNameIndex.match_many (workers=-1)", lambda: index.match_many(CPU_NAMES, workers=-1), 20)
+
+    print(f"\n{len(index)} CPU names in the index")
+    for label, seconds in (("match", single), ("match_many", bulk), ("match_many workers=-1", bulk_parallel)):
+        print(f"speedup {label:<22} x{legacy / seconds:.1f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,129 @@
+"""
+Latency under concurrent load for each execution strategy of the compute path.
+
+A uvicorn server is started for each strategy. Concurrent clients send compute requests (server with a CPU name,
+verbose) while a probe sends light requests (archetype listing, not computed). With the inline strategy the light
+requests wait behind the computations running on the event loop.
+
+    python -m benchmarks.bench_execution_strategy
+"""
+import asyncio
+import multiprocessing
+import os
+import statistics
+import time
+
+import httpx
+
+PORT = 5077
+WORKERS = 4
+COMPUTE_CLIENTS = 16
+COMPUTE_REQUESTS_PER_CLIENT = 16
+LIGHT_REQUESTS = 200
+LIGHT_INTERVAL = 0.005
+STRATEGIES = ["inline", "thread", "process"]
+
+CPU_NAMES = [
+    "intel xeon gold 6134",
+    "intel xeon platinum 8175m",
+    "amd epyc 7r32",
+    "intel xeon e5-2660",
+]
+
+
+def serve(strategy: str):
+    os.environ["BOAVIZTAPI_EXECUTION_STRATEGY"] = strategy
+    os.environ["BOAVIZTAPI_WORKERS"] = str(WORKERS)
+    os.environ["BOAVIZTAPI_QUEUE_DEPTH"] = str(COMPUTE_CLIENTS)
+
+    from boaviztapi import config
+    # the background build of the cloud table would compete with the measured requests
+    config["cloud_impact_table_precompute"] = False
+
+    import uvicorn
+    uvicorn.run("boaviztapi.main:app", host="127.0.0.1", port=PORT, log_level="warning")
+
+
+def compute_request(client: httpx.AsyncClient, i: int):
+    return client.post('/v1/server/?verbose=true', json={
+        "configuration": {"cpu": {"units": 2, "name": CPU_NAMES[i % len(CPU_NAMES)], "tdp": 100 + i}},
+        "usage": {"time_workload": i % 100}
+    })
+
+
+def light_request(client: httpx.AsyncClient):
+    return client.get('/v1/server/archetypes')
+
+
+async def timed(request):
+    start = time.perf_counter()
+    response = await request
+    response.raise_for_status()
+    return time.perf_counter() - start
+
+
+async def compute_client(client: httpx.AsyncClient, client_id: int):
+    return [await timed(compute_request(client, client_id * COMPUTE_REQUESTS_PER_CLIENT + i))
+            for i in range(COMPUTE_REQUESTS_PER_CLIENT)]
+
+
+async def light_probe(client: httpx.AsyncClient):
+    latencies = []
+    for _ in range(LIGHT_REQUESTS):
+        latencies.append(await timed(light_request(client)))
+        await asyncio.sleep(LIGHT_INTERVAL)
+    return latencies
+
+
+def percentile(latencies, p):
+    latencies = sorted(latencies)
+    return latencies[min(len(latencies) - 1, int(len(latencies) * p / 100))] * 1000
+
+
+async def wait_ready(client: httpx.AsyncClient, timeout: float = 60):
+    deadline = time.perf_counter() + timeout
+    while time.perf_counter() < deadline:
+        try:
+            if (await client.get('/v1/server/archetypes')).status_code == 200:
+                return
+        except httpx.TransportError:
+            pass
+        await asyncio.sleep(0.2)
+    raise TimeoutError("server did not start")
+
+
+async def load(strategy: str):
+    limits = httpx.Limits(max_connections=COMPUTE_CLIENTS + 1)
+    async with httpx.AsyncClient(base_url=f"http://127.0.0.1:{PORT}", limits=limits, timeout=60) as client:
+        await wait_ready(client)
+        # warm up (worker processes, fits, name matching) outside of the measure
+        await asyncio.gather(*[compute_request(client, i) for i in range(2 * WORKERS)])
+
+        start = time.perf_counter()
+        compute = asyncio.gather(*[compute_client(client, i) for i in range(COMPUTE_CLIENTS)])
+        light_latencies = await light_probe(client)
+        compute_latencies = [latency for client_latencies in await compute for latency in client_latencies]
+        elapsed = time.perf_counter() - start
+
+    for label, latencies in (("compute", compute_latencies), ("light", light_latencies)):
+        print(f"{strategy:<8} {label:<8} p50 {statistics.median(latencies) * 1000:8.1f} ms   "
+              f"p99 {percentile(latencies, 99):8.1f} ms")
+    print(f"{strategy:<8} {len(compute_latencies) / elapsed:.0f} compute requests/s\n")
+
+
+def main():
+    print(f"{WORKERS} workers, {COMPUTE_CLIENTS} concurrent compute clients, "
+          f"1 light request every {LIGHT_INTERVAL * 1000:.0f} ms\n")
+    context = multiprocessing.get_context("spawn")
+    for strategy in STRATEGIES:
+        server = context.Process(target=serve, args=(strategy,))
+        server.start()
+        try:
+            asyncio.run(load(strategy))
+        finally:
+            server.terminate()
+            server.join()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,76 @@
+"""
+Impacts of a fleet of servers: columnar engine against the object engine (one DeviceServer per server), for the
+default criteria.
+
+    python -m benchmarks.bench_fleet
+"""
+import time
+
+import numpy as np
+import pandas as pd
+
+from boaviztapi import config
+from boaviztapi.model.device.server import DeviceServer
+from boaviztapi.model.impact import IMPACT_PHASES
+from boaviztapi.service.fleet_computation import compute_fleet_impacts
+from boaviztapi.service.impacts_computation import compute_single_impact
+
+FLEET_SIZES = [1000, 10000, 100000]
+OBJECT_ENGINE_SERVERS = 1000
+
+
+def fleet(size: int) -> pd.DataFrame:
+    rng = np.random.default_rng(0)
+    return pd.DataFrame({
+        "CPU.units": rng.integers(1, 4, size),
+        "CPU.die_size": rng.uniform(50, 800, size),
+        "RAM.units": rng.integers(1, 24, size),
+        "RAM.capacity": rng.choice([16, 32, 64], size),
+        "RAM.density": rng.uniform(0.5, 2.5, size),
+        "SSD.units": rng.integers(0, 4, size),
+        "SSD.capacity": rng.choice([400, 1000, 4000], size),
+        "SSD.density": rng.uniform(20, 120, size),
+        "CASE.case_type": rng.choice(["rack", "blade"], size),
+        "USAGE.avg_power": rng.uniform(100, 800, size),
+        "USAGE.usage_location": rng.choice(["FRA", "USA", "DEU"], size),
+    })
+
+
+def object_engine(servers: pd.DataFrame):
+    for row in servers.itertuples(index=False):
+        server = DeviceServer()
+        server.cpu.units.set_input(row[0])
+        server.cpu.die_size.set_input(row[1])
+        server.ram[0].units.set_input(row[2])
+        server.ram[0].capacity.set_input(row[3])
+        server.ram[0].density.set_input(row[4])
+        server.disk[0].units.set_input(row[5])
+        server.disk[0].capacity.set_input(row[6])
+        server.disk[0].density.set_input(row[7])
+        server.case.case_type.set_input(row[8])
+        server.usage.avg_power.set_input(row[9])
+        server.usage.usage_location.set_input(row[10])
+        for criteria in config["default_criteria"]:
+            for phase in IMPACT_PHASES:
+                compute_single_impact(server, phase, criteria, 35040)
+
+
+def timed(function, *args) -> float:
+    start = time.perf_counter()
+    function(*args)
+    return time.perf_counter() - start
+
+
+def main():
+    object_engine(fleet(10))  # warm up: data files and fits
+    per_server = timed(object_engine, fleet(OBJECT_ENGINE_SERVERS)) / OBJECT_ENGINE_SERVERS
+    print(f"object engine   {per_server * 1e6:8.1f} us per server")
+    for size in FLEET_SIZES:
+        servers = fleet(size)
+        elapsed = timed(compute_fleet_impacts, servers, config["default_criteria"], 35040)
+        print(f"columnar engine {size:>7} servers {elapsed * 1000:8.1f} ms   {elapsed / size * 1e6:6.2f} us per server   "
+              f"object engine ~{per_server * size:6.1f} s")
+
+
+if __name__ == '__main__':
+    main()
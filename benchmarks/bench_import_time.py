@@ -0,0 +1,84 @@
+"""
+Cold start of the API: import of the ASGI app, and import plus first invocation of the Mangum handler, each in a
+fresh interpreter. The modules with the largest import time are taken from python -X importtime.
+
+    python -m benchmarks.bench_import_time
+"""
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+RUNS = 5
+TOP_MODULES = 15
+HEAVY_MODULES = ["pandas", "numpy", "scipy", "rapidfuzz", "markdown", "toml", "yaml"]
+
+ROOT = os.path.join(os.path.dirname(__file__), '..')
+
+IMPORT_APP = """
+import json, sys, time
+start = time.perf_counter()
+from boaviztapi.main import app
+elapsed = time.perf_counter() - start
+print(json.dumps({"seconds": elapsed, "modules": [m for m in %r if m in sys.modules]}))
+""" % HEAVY_MODULES
+
+INVOKE_HANDLER = """
+import json, sys, time
+start = time.perf_counter()
+from boaviztapi.main import handler
+imported = time.perf_counter() - start
+event = {
+    "resource": "/", "path": "/v1/utils/country_code", "httpMethod": "GET", "headers": {"Host": "localhost"},
+    "multiValueHeaders": {}, "queryStringParameters": None, "multiValueQueryStringParameters": None,
+    "requestContext": {"resourcePath": "/", "httpMethod": "GET", "path": "/v1/utils/country_code"},
+    "body": None, "isBase64Encoded": False,
+}
+response = handler(event, None)
+assert response["statusCode"] == 200, response
+elapsed = time.perf_counter() - start
+print(json.dumps({"seconds": elapsed, "import_seconds": imported,
+                  "modules": [m for m in %r if m in sys.modules]}))
+""" % HEAVY_MODULES
+
+
+def run(code: str, *args) -> subprocess.CompletedProcess:
+    env = dict(os.environ, PYTHONPATH=ROOT)
+    return subprocess.run([sys.executable, *args, "-c", code], env=env, cwd=ROOT,
+                          capture_output=True, text=True, check=True)
+
+
+def cold(label: str, code: str):
+    results = [json.loads(run(code).stdout.strip().splitlines()[-1]) for _ in range(RUNS)]
+    seconds = [result["seconds"] for result in results]
+    print(f"{label:<32} median {statistics.median(seconds) * 1000:8.1f} ms   "
+          f"min {min(seconds) * 1000:8.1f} ms")
+    if "import_seconds" in results[0]:
+        print(f"{'  of which import':<32} median "
+              f"{statistics.median(r['import_seconds'] for r in results) * 1000:8.1f} ms")
+    print(f"{'  heavy modules loaded':<32} {', '.join(results[-1]['modules']) or '-'}")
+
+
+def import_profile():
+    stderr = run("import boaviztapi.main", "-X", "importtime").stderr
+    rows = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, module = line[len("import time:"):].split("|")
+        rows.append((int(self_us), int(cumulative_us), module.strip()))
+    print(f"\nlargest self import times (python -X importtime)")
+    for self_us, cumulative_us, module in sorted(rows, reverse=True)[:TOP_MODULES]:
+        print(f"{module:<60} self {self_us / 1000:7.1f} ms   cumulative {cumulative_us / 1000:7.1f} ms")
+
+
+def main():
+    print(f"{RUNS} fresh interpreters per measure\n")
+    cold("import boaviztapi.main:app", IMPORT_APP)
+    cold("Mangum handler, first request", INVOKE_HANDLER)
+    import_profile()
+
+
+if __name__ == '__main__':
+    main()
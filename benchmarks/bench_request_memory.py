@@ -0,0 +1,61 @@
+"""
+Memory allocated by the impact engine for one server request and one cloud request (model mapping, impacts and
+verbose output), measured with tracemalloc once the data files, fits and CPU names are loaded.
+
+    python -m benchmarks.bench_request_memory
+"""
+import gc
+import tracemalloc
+
+from boaviztapi import config
+from boaviztapi.dto.device import Cloud, Server
+from boaviztapi.dto.device.device import mapper_cloud_instance, mapper_server
+from boaviztapi.model.boattribute import Boattribute
+from boaviztapi.model.impact import Impact
+from boaviztapi.routers.cloud_router import compute_cloud_instance_impact
+from boaviztapi.routers.openapi_doc.examples import cloud_example, server_configuration_examples
+from boaviztapi.routers.server_router import compute_server_impact
+from boaviztapi.service.archetype import get_cloud_instance_archetype, get_server_archetype
+
+RUNS = 20
+
+
+def server_request(verbose: bool):
+    server = mapper_server(Server.parse_obj(server_configuration_examples["DellR740"]),
+                           archetype=get_server_archetype(config["default_server"]))
+    return server, compute_server_impact(server, verbose, None, config["default_criteria"])
+
+
+def cloud_request(verbose: bool):
+    cloud = Cloud.parse_obj(cloud_example)
+    instance = mapper_cloud_instance(cloud, archetype=get_cloud_instance_archetype(cloud.instance_type, cloud.provider))
+    return instance, compute_cloud_instance_impact(instance, verbose, None, config["default_criteria"])
+
+
+def measure(request, verbose: bool):
+    request(verbose)  # warm up: data files, fits and CPU names are loaded once per process
+    peaks, retained = [], []
+    for _ in range(RUNS):
+        gc.collect()
+        tracemalloc.start()
+        model, _ = request(verbose)
+        current, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        peaks.append(peak)
+        retained.append(current)
+        del model
+    return min(peaks), min(retained)
+
+
+def main():
+    print(f"Boattribute: {'slotted' if not hasattr(Boattribute(), '__dict__') else 'with __dict__'}, "
+          f"Impact: {'slotted' if not hasattr(Impact(), '__dict__') else 'with __dict__'}\n")
+    for label, request in (("server", server_request), ("cloud", cloud_request)):
+        for verbose in (False, True):
+            peak, retained = measure(request, verbose)
+            name = f"{label}{' verbose' if verbose else ''}"
+            print(f"{name:<16} peak {peak / 1024:8.1f} KiB   model and response {retained / 1024:8.1f} KiB")
+
+
+if __name__ == '__main__':
+    main()
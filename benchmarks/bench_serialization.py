@@ -0,0 +1,69 @@
+"""
+Encoding time and payload size of verbose server and cloud responses: fastapi's default path (jsonable_encoder then
+JSONResponse) against the direct encoders of service/serialization.py.
+
+    python -m benchmarks.bench_serialization
+"""
+import gzip
+import time
+
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+
+from boaviztapi import config
+from boaviztapi.dto.device import Cloud, Server
+from boaviztapi.dto.device.device import mapper_cloud_instance, mapper_server
+from boaviztapi.routers.cloud_router import compute_cloud_instance_impact
+from boaviztapi.routers.openapi_doc.examples import cloud_example, server_configuration_examples
+from boaviztapi.routers.server_router import compute_server_impact
+from boaviztapi.service import serialization
+from boaviztapi.service.archetype import get_cloud_instance_archetype, get_server_archetype
+
+RUNS = 200
+
+
+def server_response() -> dict:
+    server = mapper_server(Server.parse_obj(server_configuration_examples["DellR740"]),
+                           archetype=get_server_archetype(config["default_server"]))
+    return compute_server_impact(server, True, None, config["default_criteria"])
+
+
+def cloud_response() -> dict:
+    cloud = Cloud.parse_obj(cloud_example)
+    instance = mapper_cloud_instance(cloud, archetype=get_cloud_instance_archetype(cloud.instance_type, cloud.provider))
+    return compute_cloud_instance_impact(instance, True, None, config["default_criteria"])
+
+
+def fastapi_default(content: dict) -> bytes:
+    return JSONResponse(jsonable_encoder(content)).body
+
+
+def encoders():
+    yield "fastapi default", fastapi_default
+    yield "json", serialization.dumps_json
+    if serialization.orjson is not None:
+        yield "orjson", serialization.dumps_orjson
+
+
+def measure(encode, content: dict) -> float:
+    encode(content)
+    start = time.perf_counter()
+    for _ in range(RUNS):
+        encode(content)
+    return (time.perf_counter() - start) / RUNS
+
+
+def main():
+    if serialization.orjson is None:
+        print("orjson is not installed, responses are encoded with json\n")
+    for label, response in (("server verbose", server_response), ("cloud verbose", cloud_response)):
+        content = response()
+        print(label)
+        for name, encode in encoders():
+            body = encode(content)
+            print(f"  {name:<16} {measure(encode, content) * 1000:7.3f} ms   {len(body) / 1024:6.1f} KiB   "
+                  f"gzip {len(gzip.compress(body)) / 1024:5.1f} KiB")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,16 @@
+from typing import Optional, List
+
+from pydantic import conint
+
+from boaviztapi import config
+from boaviztapi.dto import BaseDTO
+
+
+class BatchItem(BaseDTO):
+    id: Optional[str] = None
+    type: str
+    archetype: Optional[str] = None
+    duration: Optional[float] = config["default_duration"]
+    criteria: List[str] = config["default_criteria"]
+    data: Optional[dict] = None
+    units: conint(gt=0) = 1
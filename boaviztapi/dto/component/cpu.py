@@ -1,13 +1,10 @@
-import os
 from typing import Optional
 
-import pandas as pd
-
 from boaviztapi import config
 from boaviztapi.dto.component import ComponentDTO
 from boaviztapi.dto.usage.usage import mapper_usage, Usage
 from boaviztapi.model.component import ComponentCPU
-from boaviztapi.service.archetype import get_component_archetype
+from boaviztapi.service.archetype import get_component_archetype, LazyArchetype, resolve_archetype
 
 
 class CPU(ComponentDTO):
@@ -20,7 +17,8 @@ class CPU(ComponentDTO):
     name: Optional[str] = None
     tdp: Optional[int] = None
 
-def mapper_cpu(cpu_dto: CPU, archetype=get_component_archetype(config["default_cpu"], "cpu")) -> ComponentCPU:
+def mapper_cpu(cpu_dto: CPU, archetype=LazyArchetype(lambda: get_component_archetype(config["default_cpu"], "cpu"))) -> ComponentCPU:
+    archetype = resolve_archetype(archetype)
     cpu_component = ComponentCPU(archetype=archetype)
     cpu_component.usage = mapper_usage(cpu_dto.usage or Usage(), archetype=archetype.get("USAGE"))
 
@@ -5,7 +5,7 @@ from boaviztapi import config
 from boaviztapi.dto.component import ComponentDTO
 from boaviztapi.dto.usage.usage import mapper_usage, Usage
 from boaviztapi.model.component import ComponentSSD, ComponentHDD
-from boaviztapi.service.archetype import get_component_archetype
+from boaviztapi.service.archetype import get_component_archetype, LazyArchetype, resolve_archetype
 
 
 class Disk(ComponentDTO):
@@ -17,7 +17,8 @@ class Disk(ComponentDTO):
     layers: Optional[int] = None
 
 
-def mapper_ssd(disk_dto: Disk, archetype=get_component_archetype(config["default_ssd"], "ssd")) -> ComponentSSD:
+def mapper_ssd(disk_dto: Disk, archetype=LazyArchetype(lambda: get_component_archetype(config["default_ssd"], "ssd"))) -> ComponentSSD:
+    archetype = resolve_archetype(archetype)
     disk_component = ComponentSSD(archetype=archetype)
     disk_component.usage = mapper_usage(disk_dto.usage or Usage(), archetype=archetype.get("USAGE"))
 
@@ -39,7 +40,8 @@ def mapper_ssd(disk_dto: Disk, archetype=get_component_archetype(config["default
     return disk_component
 
 
-def mapper_hdd(disk_dto: Disk, archetype=get_component_archetype(config["default_hdd"], "hdd")) -> ComponentHDD:
+def mapper_hdd(disk_dto: Disk, archetype=LazyArchetype(lambda: get_component_archetype(config["default_hdd"], "hdd"))) -> ComponentHDD:
+    archetype = resolve_archetype(archetype)
     disk_component = ComponentHDD(archetype=archetype)
     disk_component.usage = mapper_usage(disk_dto.usage or Usage(), archetype=archetype.get("USAGE"))
 
@@ -4,7 +4,7 @@ from boaviztapi import config
 from boaviztapi.dto.component import ComponentDTO
 from boaviztapi.dto.usage.usage import mapper_usage, Usage
 from boaviztapi.model.component import ComponentPowerSupply, ComponentMotherboard, ComponentCase
-from boaviztapi.service.archetype import get_component_archetype
+from boaviztapi.service.archetype import get_component_archetype, LazyArchetype, resolve_archetype
 
 
 class PowerSupply(ComponentDTO):
@@ -19,8 +19,10 @@ class Case(ComponentDTO):
     case_type: str = None
 
 
-def mapper_power_supply(power_supply_dto: PowerSupply, archetype=get_component_archetype(config["default_power_supply"],
-                                                                                         "power_supply")) -> ComponentPowerSupply:
+def mapper_power_supply(power_supply_dto: PowerSupply,
+                        archetype=LazyArchetype(lambda: get_component_archetype(config["default_power_supply"],
+                                                                                "power_supply"))) -> ComponentPowerSupply:
+    archetype = resolve_archetype(archetype)
     power_supply_component = ComponentPowerSupply(archetype=archetype)
     power_supply_component.usage = mapper_usage(power_supply_dto.usage or Usage(), archetype=archetype.get("USAGE"))
 
@@ -43,7 +45,8 @@ def mapper_motherboard(motherboard_dto: Motherboard) -> ComponentMotherboard:
     return motherboard_component
 
 
-def mapper_case(case_dto: Case, archetype=get_component_archetype(config["default_case"], "case")) -> ComponentCase:
+def mapper_case(case_dto: Case, archetype=LazyArchetype(lambda: get_component_archetype(config["default_case"], "case"))) -> ComponentCase:
+    archetype = resolve_archetype(archetype)
     case_component = ComponentCase(archetype=archetype)
     case_component.usage = mapper_usage(case_dto.usage or Usage(), archetype=archetype.get("USAGE"))
 
@@ -1,16 +1,11 @@
-import os
 from typing import Optional
 
-import pandas as pd
-
 from boaviztapi import config
 from boaviztapi.dto.component import ComponentDTO
 from boaviztapi.dto.usage import Usage
 from boaviztapi.dto.usage.usage import mapper_usage
 from boaviztapi.model.component import ComponentRAM
-from boaviztapi.service.archetype import get_component_archetype
-
-_ram_df = pd.read_csv(os.path.join(os.path.dirname(__file__), '../../data/crowdsourcing/ram_manufacture.csv'))
+from boaviztapi.service.archetype import get_component_archetype, LazyArchetype, resolve_archetype
 
 
 class RAM(ComponentDTO):
@@ -21,7 +16,8 @@ class RAM(ComponentDTO):
     model: Optional[str] = None
 
 
-def mapper_ram(ram_dto: RAM, archetype=get_component_archetype(config["default_ram"], "ram")) -> ComponentRAM:
+def mapper_ram(ram_dto: RAM, archetype=LazyArchetype(lambda: get_component_archetype(config["default_ram"], "ram"))) -> ComponentRAM:
+    archetype = resolve_archetype(archetype)
     ram_component = ComponentRAM(archetype=archetype)
     ram_component.usage = mapper_usage(ram_dto.usage or Usage(), archetype=archetype.get("USAGE"))
 
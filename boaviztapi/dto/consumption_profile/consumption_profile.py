@@ -1,8 +1,5 @@
-import os
 from typing import List, Tuple
 
-import pandas as pd
-
 from boaviztapi.dto import BaseDTO
 from boaviztapi.dto.component import CPU
 from boaviztapi.model.component import ComponentCPU
@@ -14,7 +14,8 @@ from boaviztapi.model.component import ComponentCase
 from boaviztapi.model.device.server import DeviceServer
 from boaviztapi.model.services.cloud_instance import ServiceCloudInstance
 from boaviztapi.model.usage import ModelUsage
-from boaviztapi.service.archetype import get_server_archetype, get_arch_component, get_cloud_instance_archetype
+from boaviztapi.service.archetype import get_server_archetype, get_arch_component, get_cloud_instance_archetype, \
+    LazyArchetype, resolve_archetype
 
 
 class DeviceDTO(BaseDTO):
@@ -40,7 +41,8 @@ class Server(DeviceDTO):
     usage: Optional[UsageServer] = None
 
 
-def mapper_server(server_dto: Server, archetype=get_server_archetype(config["default_server"])) -> DeviceServer:
+def mapper_server(server_dto: Server, archetype=LazyArchetype(lambda: get_server_archetype(config["default_server"]))) -> DeviceServer:
+    archetype = resolve_archetype(archetype)
     server_model = DeviceServer(archetype=archetype)
 
     server_model = device_mapper(server_dto, server_model)
@@ -74,7 +76,8 @@ class Cloud(Server):
     usage: Optional[UsageCloud] = None
 
 
-def mapper_cloud_instance(cloud_dto: Cloud, archetype=get_cloud_instance_archetype(config["default_cloud_instance"], config["default_cloud_provider"])) -> ServiceCloudInstance:
+def mapper_cloud_instance(cloud_dto: Cloud, archetype=LazyArchetype(lambda: get_cloud_instance_archetype(config["default_cloud_instance"], config["default_cloud_provider"]))) -> ServiceCloudInstance:
+    archetype = resolve_archetype(archetype)
     model_cloud_instance = ServiceCloudInstance(archetype=archetype)
 
     model_cloud_instance.usage = mapper_usage_cloud(cloud_dto.usage or UsageCloud(), archetype=get_arch_component(model_cloud_instance.archetype, "USAGE"))
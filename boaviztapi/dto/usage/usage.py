@@ -4,7 +4,8 @@ from boaviztapi import config
 from boaviztapi.dto import BaseDTO
 from boaviztapi.model.boattribute import Status
 from boaviztapi.model.usage import ModelUsage, ModelUsageServer, ModelUsageCloud
-from boaviztapi.service.archetype import get_cloud_instance_archetype, get_server_archetype
+from boaviztapi.service.archetype import get_cloud_instance_archetype, get_server_archetype, LazyArchetype, \
+    resolve_archetype
 from boaviztapi.service.factor_provider import get_available_countries
 
 
@@ -96,7 +97,8 @@ def mapper_usage(usage_dto: Usage, archetype=None) -> ModelUsage:
 
 
 def mapper_usage_server(usage_dto: UsageServer,
-                        archetype=get_server_archetype(config["default_server"]).get("USAGE")) -> ModelUsageServer:
+                        archetype=LazyArchetype(lambda: get_server_archetype(config["default_server"]).get("USAGE"))) -> ModelUsageServer:
+    archetype = resolve_archetype(archetype)
     usage_model_server = ModelUsageServer(archetype=archetype)
 
     for elec_factor in usage_dto.elec_factors.__dict__.keys():
@@ -127,10 +129,10 @@ def mapper_usage_server(usage_dto: UsageServer,
     return usage_model_server
 
 
-def mapper_usage_cloud(usage_dto: UsageCloud, archetype=get_cloud_instance_archetype(config["default_cloud_instance"],
-                                                                                     config[
-                                                                                         "default_cloud_provider"]).get(
-    "USAGE")) -> ModelUsageCloud:
+def mapper_usage_cloud(usage_dto: UsageCloud,
+                       archetype=LazyArchetype(lambda: get_cloud_instance_archetype(
+                           config["default_cloud_instance"], config["default_cloud_provider"]).get("USAGE"))) -> ModelUsageCloud:
+    archetype = resolve_archetype(archetype)
     usage_model_cloud = ModelUsageCloud(archetype=archetype)
 
     for elec_factor in usage_dto.elec_factors.__dict__.keys():
@@ -1,18 +1,21 @@
+import hashlib
 import json
 import logging
 
 import anyio
-import markdown
-import toml
 from fastapi.middleware.cors import CORSMiddleware
 import os
+from functools import lru_cache
 from fastapi import FastAPI
 from fastapi.openapi.utils import get_openapi
 from mangum import Mangum
 from starlette.requests import Request
 from starlette.responses import Response
 
+from boaviztapi import config
+from boaviztapi.model.consumption_profile.consumption_profile import prewarm_tdp_fit_cache
 from boaviztapi.routers import iot_router
+from boaviztapi.routers.batch_router import batch_router
 from boaviztapi.routers.component_router import component_router
 from boaviztapi.routers.consumption_profile_router import consumption_profile
 from boaviztapi.routers.iot_router import iot
@@ -21,6 +24,9 @@ from boaviztapi.routers.server_router import server_router
 from boaviztapi.routers.cloud_router import cloud_router
 from boaviztapi.routers.terminal_router import terminal_router
 from boaviztapi.routers.utils_router import utils_router
+from boaviztapi.service.cloud_impact_table import precompute_cloud_impact_table
+from boaviztapi.service.execution import compute_executor
+from boaviztapi.utils.data_version import current_data_fingerprint
 
 from fastapi.responses import HTMLResponse
 
@@ -29,7 +35,6 @@ from fastapi.responses import HTMLResponse
 stage = os.environ.get('STAGE', None)
 openapi_prefix = f"/{stage}" if stage else "/"
 app = FastAPI(root_path=openapi_prefix)  # Here is the magic
-version = toml.loads(open(os.path.join(os.path.dirname(__file__), '../pyproject.toml'), 'r').read())['tool']['poetry']['version']
 _logger = logging.getLogger(__name__)
 
 origins = json.loads(os.getenv("ALLOWED_ORIGINS", '["*"]'))
@@ -50,6 +55,47 @@ async def catch_exceptions_middleware(request: Request, call_next):
 
 app.middleware('http')(catch_exceptions_middleware)
 
+
+def is_deterministic(request: Request) -> bool:
+    # samples are drawn at random without a seed
+    return request.method == "GET" and request.scope["path"].startswith("/v1/") \
+        and ("samples" not in request.query_params or config["uncertainty_seed"] is not None)
+
+
+def request_etag(request: Request) -> str:
+    # values of a repeated parameter (e.g. duration) keep their order
+    params = sorted(request.query_params.multi_items(), key=lambda item: item[0])
+    normalized = json.dumps([get_version(), current_data_fingerprint(), request.scope["path"], params])
+    return '"%s"' % hashlib.sha256(normalized.encode()).hexdigest()[:32]
+
+
+def etag_matches(etag: str, if_none_match: str) -> bool:
+    # ETags are only given with successful responses: a client holding one knows that the route answers. "*" is not
+    # accepted since it would answer 304 to requests that fail (unknown archetype, invalid parameter...).
+    candidates = [candidate.strip() for candidate in if_none_match.split(",")]
+    return etag in [candidate[2:] if candidate.startswith("W/") else candidate for candidate in candidates]
+
+
+# Responses of GET routes only depend on the data and the request: clients holding the current ETag get a 304 without
+# the response being computed.
+async def conditional_get_middleware(request: Request, call_next):
+    if not is_deterministic(request):
+        return await call_next(request)
+    etag = request_etag(request)
+    headers = {"ETag": etag}
+    if config["http_cache_max_age"] is not None:
+        headers["Cache-Control"] = "public, max-age=%d" % config["http_cache_max_age"]
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None and etag_matches(etag, if_none_match):
+        return Response(status_code=304, headers=headers)
+    response = await call_next(request)
+    if response.status_code == 200:
+        response.headers.update(headers)
+    return response
+
+
+app.middleware('http')(conditional_get_middleware)
+
 app.add_middleware(
     CORSMiddleware,
     allow_origins=origins,
@@ -65,6 +111,7 @@ app.include_router(component_router)
 app.include_router(iot)
 app.include_router(consumption_profile)
 app.include_router(utils_router)
+app.include_router(batch_router)
 
 if __name__ == '__main__':
     import uvicorn
@@ -72,12 +119,22 @@ if __name__ == '__main__':
     uvicorn.run('main:app', host='localhost', port=5000, reload=True)
 
 
-@app.on_event("startup")
+@lru_cache(maxsize=1)
+def get_version() -> str:
+    import toml
+    return toml.loads(open(os.path.join(os.path.dirname(__file__), '../pyproject.toml'), 'r').read())['tool']['poetry']['version']
+
+
+# The schema is built on the first request of the docs rather than at startup
 def my_schema():
+    if app.openapi_schema:
+        return app.openapi_schema
+
+    import markdown
     intro = open(os.path.join(os.path.dirname(__file__), 'routers/openapi_doc/intro_openapi.md'), 'r', encoding='utf-8')
     openapi_schema = get_openapi(
         title="BOAVIZTAPI - DEMO",
-        version=version,
+        version=get_version(),
         description=markdown.markdown(intro.read()),
         routes=app.routes,
         servers=app.servers,
@@ -87,8 +144,28 @@ def my_schema():
     return app.openapi_schema
 
 
+app.openapi = my_schema
+
+
+@app.on_event("startup")
+def prewarm_consumption_profiles():
+    prewarm_tdp_fit_cache()
+
+
+@app.on_event("startup")
+def precompute_cloud_impacts():
+    precompute_cloud_impact_table()
+
+
+@app.on_event("shutdown")
+def shutdown_compute_executor():
+    compute_executor.shutdown()
+
+
 # Wrapper for aws/lambda serverless app
-handler = Mangum(app)
+# Mangum would run the startup events (fits prewarm, cloud table precompute) at each invocation. On lambda, data and
+# fits are loaded when a request first needs them.
+handler = Mangum(app, lifespan="off")
 
 
 @app.get("/", response_class=HTMLResponse)
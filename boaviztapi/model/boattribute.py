@@ -1,5 +1,6 @@
+from contextlib import contextmanager
 from enum import Enum
-from typing import Any, Optional
+from typing import Any, Iterator, Optional, Tuple
 
 
 class Status(Enum):
@@ -12,6 +13,11 @@ class Status(Enum):
 
 
 class Boattribute:
+    # A request creates hundreds of attributes: no per-instance __dict__, and the warnings list is only
+    # allocated by the first warning
+    __slots__ = ("_min", "_max", "_value", "unit", "status", "source", "default", "args", "_warnings",
+                 "complete_function")
+
     def __init__(self, **kwargs):
 
         self._min = None
@@ -22,7 +28,7 @@ class Boattribute:
         self.source = None
         self.default = None
         self.args = None
-        self.warnings = []
+        self._warnings = None
         self.complete_function = None
 
         for attr, val in kwargs.items():
@@ -63,8 +69,41 @@ class Boattribute:
     def max(self, value: Any):
         self._max = value
 
+    def bounds(self) -> Tuple[Any, Any]:
+        """
+        min and max, without storing the value as the unset ones like the min and max getters do.
+        """
+        return (self._value if self._min is None else self._min,
+                self._value if self._max is None else self._max)
+
+    @contextmanager
+    def read_bounds(self, read: bool = True) -> Iterator["Boattribute"]:
+        """
+        Within the block, min and max are as after reading them with their getters when read is true, and unchanged
+        otherwise. They are restored on exit.
+        """
+        saved = self._min, self._max
+        if read:
+            self._min, self._max = self.bounds()
+        try:
+            yield self
+        finally:
+            self._min, self._max = saved
+
+    @property
+    def warnings(self) -> list:
+        if self._warnings is None:
+            return []
+        return self._warnings
+
+    @warnings.setter
+    def warnings(self, warnings: list):
+        self._warnings = list(warnings) if warnings else None
+
     def add_warning(self, warn):
-        self.warnings.append(warn)
+        if self._warnings is None:
+            self._warnings = []
+        self._warnings.append(warn)
 
     def to_json(self):
         json = {"value": self._value, "status": self.status.value}
@@ -72,7 +111,7 @@ class Boattribute:
         if self.source: json['source'] = self.source
         if (self._min or self._min==0) and (self.is_default() or self.is_completed() or self.is_archetype()): json['min'] = self._min
         if (self._max or self._max==0) and (self.is_default() or self.is_completed() or self.is_archetype()): json['max'] = self._max
-        if self.warnings: json['warnings'] = self.warnings
+        if self._warnings: json['warnings'] = self._warnings
 
         return json
 
@@ -17,6 +17,8 @@ class Component(Assessable):
             max=get_arch_value(archetype, 'units', 'max')
         )
         self._usage = None
+        # (inputs, consumption profile, average power) of the last power modeling
+        self._power_model = None
 
     def __iter__(self):
         for attr, value in self.__dict__.items():
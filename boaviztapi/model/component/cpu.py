@@ -1,28 +1,51 @@
-import os
-
-import pandas as pd
+from functools import lru_cache
 
 import boaviztapi.utils.roundit as rd
-from boaviztapi import config, data_dir
+from boaviztapi import config
 from boaviztapi.model.boattribute import Boattribute
 from boaviztapi.model.component.component import Component
-from boaviztapi.model.consumption_profile import CPUConsumptionProfileModel
+from boaviztapi.model.consumption_profile import CPUConsumptionProfileModel, time_workload_key
 from boaviztapi.model.impact import ImpactFactor
-from boaviztapi.service.archetype import get_component_archetype, get_arch_value
-from boaviztapi.utils.fuzzymatch import fuzzymatch_attr_from_cpu_name, fuzzymatch_attr_from_pdf
+from boaviztapi.service.archetype import get_component_archetype, get_arch_value, LazyArchetype, resolve_archetype
+from boaviztapi.utils.data_snapshot import data_table
+from boaviztapi.utils.data_version import on_data_change
+from boaviztapi.utils.fuzzymatch import fuzzymatch_attr_from_pdf, CPUNameIndex
+
+
+def _cpu_specs():
+    return data_table('crowdsourcing/cpu_specs.csv')
+
 
-_cpu_specs = pd.read_csv(os.path.join(data_dir, 'crowdsourcing/cpu_specs.csv'))
+@lru_cache(maxsize=None)
+def _cpu_name_index() -> CPUNameIndex:
+    return CPUNameIndex(_cpu_specs())
 
 
 def attributes_from_cpu_name(cpu_name: str):
-    return fuzzymatch_attr_from_cpu_name(cpu_name, _cpu_specs)
+    return _attributes_from_normalized_cpu_name(normalize_cpu_name(cpu_name))
+
+
+def normalize_cpu_name(cpu_name: str) -> str:
+    # The fuzzy match scorer ignores case and whitespace layout
+    return " ".join(cpu_name.lower().split())
+
+
+# Process-wide, bounded. "No match" (None) results are cached as well.
+@lru_cache(maxsize=config["cpu_name_cache_size"])
+def _attributes_from_normalized_cpu_name(normalized_cpu_name: str):
+    return _cpu_name_index().match(normalized_cpu_name)
+
+
+on_data_change(_cpu_name_index.cache_clear)
+on_data_change(_attributes_from_normalized_cpu_name.cache_clear)
 
 
 class ComponentCPU(Component):
     NAME = "CPU"
     name_completion = False
 
-    def __init__(self, archetype=get_component_archetype(config["default_cpu"], "cpu"), **kwargs):
+    def __init__(self, archetype=LazyArchetype(lambda: get_component_archetype(config["default_cpu"], "cpu")), **kwargs):
+        archetype = resolve_archetype(archetype)
         super().__init__(archetype=archetype, **kwargs)
         self.core_units = Boattribute(
             complete_function=self._complete_from_name,
@@ -80,18 +103,23 @@ class ComponentCPU(Component):
 
     # TODO: compute min & max
     def model_power_consumption(self) -> ImpactFactor:
-        self.usage.consumption_profile = CPUConsumptionProfileModel()
+        key = (self.manufacturer.value, self.model_range.value, self.tdp.value,
+               time_workload_key(self.usage.time_workload.value))
 
-        self.usage.consumption_profile.compute_consumption_profile_model(cpu_manufacturer=self.manufacturer.value,
-                                                                         cpu_model_range=self.model_range.value,
-                                                                         cpu_tdp=self.tdp.value)
+        if self._power_model is None or self._power_model[0] != key:
+            consumption_profile = CPUConsumptionProfileModel()
+            consumption_profile.compute_consumption_profile_model(cpu_manufacturer=self.manufacturer.value,
+                                                                  cpu_model_range=self.model_range.value,
+                                                                  cpu_tdp=self.tdp.value)
 
-        if type(self.usage.time_workload.value) in (float, int):
-            self.usage.avg_power.set_completed(
-                self.usage.consumption_profile.apply_consumption_profile(self.usage.time_workload.value))
-        else:
-            self.usage.avg_power.set_completed(
-                self.usage.consumption_profile.apply_multiple_workloads(self.usage.time_workload.value))
+            if type(self.usage.time_workload.value) in (float, int):
+                avg_power = consumption_profile.apply_consumption_profile(self.usage.time_workload.value)
+            else:
+                avg_power = consumption_profile.apply_multiple_workloads(self.usage.time_workload.value)
+            self._power_model = (key, consumption_profile, avg_power)
+
+        _, self.usage.consumption_profile, avg_power = self._power_model
+        self.usage.avg_power.set_completed(avg_power)
 
         return ImpactFactor(
             value=rd.round_to_sigfig(self.usage.avg_power.value, 5) * self.units.value,
@@ -125,21 +153,22 @@ class ComponentCPU(Component):
 
     def _complete_from_name(self):
         if self.name.has_value() and not self.name_completion:
+            self.name_completion = True
             compute_min_max = False
             if self.name.min != self.name.value or self.name.max != self.name.value:
                 compute_min_max = True
 
             cpu_attributes = attributes_from_cpu_name(self.name.value)
             name, manufacturer, family, model_range, tdp, cores, threads, die_size, die_size_source, source = cpu_attributes if (
-                    cpu_attributes is not None) else (None, None, None, None, None, None, None, None, None)
+                    cpu_attributes is not None) else (None,) * 10
 
             if compute_min_max:
                 cpu_attributes_min = attributes_from_cpu_name(self.name.min)
                 cpu_attributes_max = attributes_from_cpu_name(self.name.max)
                 name_min, manufacturer_min, family_min, model_range_min, tdp_min, cores_min, threads_min, die_size_min, die_size_source_min, source_min = cpu_attributes_min if (
-                        cpu_attributes_min is not None) else (None, None, None, None, None, None, None, None, None)
+                        cpu_attributes_min is not None) else (None,) * 10
                 name_max, manufacturer_max, family_max, model_range_max, tdp_max, cores_max, threads_max, die_size_max, die_size_source_max, source_max = cpu_attributes_max if (
-                        cpu_attributes_max is not None) else (None, None, None, None, None, None, None, None, None)
+                        cpu_attributes_max is not None) else (None,) * 10
             else:
                 name_min, manufacturer_min, family_min, model_range_min, tdp_min, cores_min, threads_min, die_size_min, die_size_source_min, source_min = name, manufacturer, family, model_range, tdp, cores, threads, die_size, die_size_source, source
                 name_max, manufacturer_max, family_max, model_range_max, tdp_max, cores_max, threads_max, die_size_max, die_size_source_max, source_max = name, manufacturer, family, model_range, tdp, cores, threads, die_size, die_size_source, source
@@ -169,11 +198,12 @@ class ComponentCPU(Component):
                                             source=f"{die_size_source} : Completed from name name based on {source}.")
 
     def _complete_die_size_from_cpu_specs(self):
-        df = _cpu_specs[_cpu_specs["total_die_size"].notna()]
+        cpu_specs = _cpu_specs()
+        df = cpu_specs[cpu_specs["total_die_size"].notna()]
 
         # Fuzzymatch on the available code_name
         family = fuzzymatch_attr_from_pdf(self.family.value, "code_name",
-                                          _cpu_specs) if self.family.has_value() else None
+                                          cpu_specs) if self.family.has_value() else None
 
         # if family not in df we set it to None
         if family not in df["code_name"].values:
@@ -183,7 +213,7 @@ class ComponentCPU(Component):
             if family != self.family.value:
                 self.family.set_changed(family)
             # Filter the cpu_specs file to get only the rows that match the family
-            df = df[(_cpu_specs["code_name"] == self.family.value)]
+            df = df[(cpu_specs["code_name"] == self.family.value)]
 
         # If we don't have a core_units, we take the average of the df
         if self.core_units.is_none():
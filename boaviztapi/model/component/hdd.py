@@ -1,7 +1,7 @@
 from boaviztapi import config
 from boaviztapi.model.boattribute import Boattribute
 from boaviztapi.model.component.component import Component
-from boaviztapi.service.archetype import get_component_archetype, get_arch_value
+from boaviztapi.service.archetype import get_component_archetype, get_arch_value, LazyArchetype, resolve_archetype
 
 
 class ComponentHDD(Component):
@@ -9,7 +9,8 @@ class ComponentHDD(Component):
 
     __DISK_TYPE = 'hdd'
 
-    def __init__(self, archetype=get_component_archetype(config["default_ssd"], "ssd"), **kwargs):
+    def __init__(self, archetype=LazyArchetype(lambda: get_component_archetype(config["default_ssd"], "ssd")), **kwargs):
+        archetype = resolve_archetype(archetype)
         super().__init__(archetype=archetype, **kwargs)
 
         self.capacity = Boattribute(
@@ -1,13 +1,14 @@
 from boaviztapi import config
 from boaviztapi.model.boattribute import Boattribute
 from boaviztapi.model.component.component import Component
-from boaviztapi.service.archetype import get_component_archetype, get_arch_value
+from boaviztapi.service.archetype import get_component_archetype, get_arch_value, LazyArchetype, resolve_archetype
 
 
 class ComponentPowerSupply(Component):
     NAME = "POWER_SUPPLY"
 
-    def __init__(self, archetype=get_component_archetype(config["default_power_supply"], "power_supply"), **kwargs):
+    def __init__(self, archetype=LazyArchetype(lambda: get_component_archetype(config["default_power_supply"], "power_supply")), **kwargs):
+        archetype = resolve_archetype(archetype)
         super().__init__(archetype=archetype, **kwargs)
 
         self.unit_weight = Boattribute(
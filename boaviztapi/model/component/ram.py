@@ -1,23 +1,23 @@
-import os
-
-import pandas as pd
-
 import boaviztapi.utils.roundit as rd
-from boaviztapi import config, data_dir
+from boaviztapi import config
 from boaviztapi.model.boattribute import Boattribute
 from boaviztapi.model.component.component import Component
-from boaviztapi.model.consumption_profile.consumption_profile import RAMConsumptionProfileModel
+from boaviztapi.model.consumption_profile.consumption_profile import RAMConsumptionProfileModel, time_workload_key
 from boaviztapi.model.impact import ImpactFactor
-from boaviztapi.service.archetype import get_arch_value, get_component_archetype
+from boaviztapi.service.archetype import get_arch_value, get_component_archetype, LazyArchetype, resolve_archetype
+from boaviztapi.utils.data_snapshot import data_table
 from boaviztapi.utils.fuzzymatch import fuzzymatch_attr_from_pdf
 
 
 class ComponentRAM(Component):
     NAME = "RAM"
 
-    _ram_df = pd.read_csv(os.path.join(data_dir, 'crowdsourcing/ram_manufacture.csv'))
+    @property
+    def _ram_df(self):
+        return data_table('crowdsourcing/ram_manufacture.csv')
 
-    def __init__(self, archetype=get_component_archetype(config["default_ram"], "ram"), **kwargs):
+    def __init__(self, archetype=LazyArchetype(lambda: get_component_archetype(config["default_ram"], "ram")), **kwargs):
+        archetype = resolve_archetype(archetype)
         super().__init__(archetype=archetype, **kwargs)
 
         self.process = Boattribute(
@@ -47,15 +47,20 @@ class ComponentRAM(Component):
     # IMPACT COMPUTATION
 
     def model_power_consumption(self, ) -> ImpactFactor:
-        self.usage.consumption_profile = RAMConsumptionProfileModel()
-        self.usage.consumption_profile.compute_consumption_profile_model(ram_capacity=self.capacity.value)
+        key = (self.capacity.value, time_workload_key(self.usage.time_workload.value))
 
-        if type(self.usage.time_workload.value) in (float, int):
-            self.usage.avg_power.set_completed(
-                self.usage.consumption_profile.apply_consumption_profile(self.usage.time_workload.value))
-        else:
-            self.usage.avg_power.set_completed(
-                self.usage.consumption_profile.apply_multiple_workloads(self.usage.time_workload.value))
+        if self._power_model is None or self._power_model[0] != key:
+            consumption_profile = RAMConsumptionProfileModel()
+            consumption_profile.compute_consumption_profile_model(ram_capacity=self.capacity.value)
+
+            if type(self.usage.time_workload.value) in (float, int):
+                avg_power = consumption_profile.apply_consumption_profile(self.usage.time_workload.value)
+            else:
+                avg_power = consumption_profile.apply_multiple_workloads(self.usage.time_workload.value)
+            self._power_model = (key, consumption_profile, avg_power)
+
+        _, self.usage.consumption_profile, avg_power = self._power_model
+        self.usage.avg_power.set_completed(avg_power)
 
         return ImpactFactor(
             value=rd.round_to_sigfig(self.usage.avg_power.value, 5)*self.units.value,
@@ -1,22 +1,22 @@
-import os
-
-import pandas as pd
-
-from boaviztapi import config, data_dir
+from boaviztapi import config
 from boaviztapi.model.boattribute import Boattribute
 from boaviztapi.model.component.component import Component
-from boaviztapi.service.archetype import get_component_archetype, get_arch_value
+from boaviztapi.service.archetype import get_component_archetype, get_arch_value, LazyArchetype, resolve_archetype
+from boaviztapi.utils.data_snapshot import data_table
 from boaviztapi.utils.fuzzymatch import fuzzymatch_attr_from_pdf
 
 
 class ComponentSSD(Component):
-    _ssd_df = pd.read_csv(os.path.join(data_dir, 'crowdsourcing/ssd_manufacture.csv'))
+    @property
+    def _ssd_df(self):
+        return data_table('crowdsourcing/ssd_manufacture.csv')
 
     NAME = "SSD"
 
     __DISK_TYPE = 'ssd'
 
-    def __init__(self, archetype=get_component_archetype(config["default_ssd"], "ssd"), **kwargs):
+    def __init__(self, archetype=LazyArchetype(lambda: get_component_archetype(config["default_ssd"], "ssd")), **kwargs):
+        archetype = resolve_archetype(archetype)
         super().__init__(archetype=archetype, **kwargs)
         self.manufacturer = Boattribute(
             default=get_arch_value(archetype, 'manufacturer', 'default'),
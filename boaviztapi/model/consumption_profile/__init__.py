@@ -1 +1 @@
-from .consumption_profile import CPUConsumptionProfileModel, RAMConsumptionProfileModel
+from .consumption_profile import CPUConsumptionProfileModel, RAMConsumptionProfileModel, time_workload_key
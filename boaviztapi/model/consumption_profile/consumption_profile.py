@@ -1,23 +1,111 @@
 import dataclasses
+import json
+import logging
 import math
 import os
+import threading
+from collections import OrderedDict
 from typing import Dict, Optional, List, Tuple, Union
 
-import numpy as np
-import pandas as pd
-from scipy.optimize import curve_fit
-
 import boaviztapi.utils.fuzzymatch as fuzzymatch
-from boaviztapi import config, data_dir
+from boaviztapi import config
 from boaviztapi.dto.usage.usage import WorkloadTime
 from boaviztapi.model.boattribute import Boattribute, Status
-from boaviztapi.service.archetype import get_component_archetype, get_arch_value
+from boaviztapi.service.archetype import get_component_archetype, get_arch_value, LazyArchetype, resolve_archetype
+from boaviztapi.utils.data_snapshot import data_table
 
-fuzzymatch.pandas()
+MIN_POWER = 1   # Minimal power is 1 W
 
-_cpu_profile_consumption_df = pd.read_csv(os.path.join(data_dir, 'consumption_profile/cpu/cpu_profile.csv'))
+_logger = logging.getLogger(__name__)
 
-MIN_POWER = 1   # Minimal power is 1 W
+
+def time_workload_key(time_workload) -> Union[float, Tuple[Tuple[float, float], ...], None]:
+    """
+    Hashable form of a time_workload value, either a load rate or a list of WorkloadTime.
+    """
+    if time_workload is None or type(time_workload) in (float, int):
+        return time_workload
+    return tuple((workload.time_percentage, workload.load_percentage) for workload in time_workload)
+
+
+class TDPFitCache:
+    """
+    Memoized CPU consumption profile fits on TDP derived workloads.
+    A fit only depends on the base model parameters and on the TDP. Fits of requested TDPs are kept in a LRU of
+    max_size entries; pinned fits (prewarmed or loaded from a file) are never evicted.
+    """
+    _MODEL_PARAM_NAME = ['a', 'b', 'c', 'd']
+
+    def __init__(self, max_size: int = 1024):
+        self.max_size = max_size
+        self._pinned = {}
+        self._fits = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._pinned) + len(self._fits)
+
+    @classmethod
+    def key(cls, base_model: Dict[str, float], cpu_tdp: float) -> Tuple[float, ...]:
+        return tuple(float(base_model[param_name]) for param_name in cls._MODEL_PARAM_NAME) + (float(cpu_tdp),)
+
+    def get(self, base_model: Dict[str, float], cpu_tdp: float) -> Optional[Dict[str, float]]:
+        key = self.key(base_model, cpu_tdp)
+        with self._lock:
+            fit = self._pinned.get(key)
+            if fit is None:
+                fit = self._fits.get(key)
+                if fit is not None:
+                    self._fits.move_to_end(key)
+        return dict(fit) if fit is not None else None
+
+    def set(self, base_model: Dict[str, float], cpu_tdp: float, fit: Dict[str, float]) -> None:
+        key = self.key(base_model, cpu_tdp)
+        with self._lock:
+            if key in self._pinned:
+                return
+            self._fits[key] = dict(fit)
+            self._fits.move_to_end(key)
+            while len(self._fits) > self.max_size:
+                self._fits.popitem(last=False)
+
+    def pin(self, entries: List[Tuple[Tuple[float, ...], Dict[str, float]]]) -> None:
+        with self._lock:
+            for key, params in entries:
+                key = tuple(key)
+                self._fits.pop(key, None)
+                self._pinned[key] = dict(params)
+
+    def pin_all(self) -> None:
+        """
+        Pins every fit of the LRU.
+        """
+        with self._lock:
+            self._pinned.update(self._fits)
+            self._fits = OrderedDict()
+
+    def entries(self) -> List[Tuple[Tuple[float, ...], Dict[str, float]]]:
+        with self._lock:
+            return list(self._pinned.items()) + list(self._fits.items())
+
+    def clear(self) -> None:
+        with self._lock:
+            self._pinned = {}
+            self._fits = OrderedDict()
+
+    def load(self, path: str) -> None:
+        with open(path, 'r', encoding='utf-8') as f:
+            self.pin([(entry["key"], entry["params"]) for entry in json.load(f)])
+
+    def save(self, path: str) -> None:
+        entries = [{"key": list(key), "params": params} for key, params in self.entries()]
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(entries, f)
+        os.replace(tmp_path, path)
+
+
+tdp_fit_cache = TDPFitCache(max_size=config["cpu_profile_fit_cache_size"])
 
 
 class ConsumptionProfileModel:
@@ -29,7 +117,8 @@ class ConsumptionProfileModel:
 class RAMConsumptionProfileModel(ConsumptionProfileModel):
     ram_electrical_factor_per_go = 0.284
 
-    def __init__(self, archetype=get_component_archetype(config["default_ram"], "ram").get("consumption_profile")):
+    def __init__(self, archetype=LazyArchetype(lambda: get_component_archetype(config["default_ram"], "ram").get("consumption_profile"))):
+        archetype = resolve_archetype(archetype)
         self.workloads = Boattribute(
             unit="workload_rate:W"
         )
@@ -62,7 +151,8 @@ class CPUConsumptionProfileModel(ConsumptionProfileModel):
     )
     _MODEL_PARAM_NAME = ['a', 'b', 'c', 'd']
 
-    def __init__(self, archetype=get_component_archetype(config["default_cpu"], "cpu").get("CONSUMPTION_PROFILE")):
+    def __init__(self, archetype=LazyArchetype(lambda: get_component_archetype(config["default_cpu"], "cpu").get("CONSUMPTION_PROFILE"))):
+        archetype = resolve_archetype(archetype)
         self.workloads = Boattribute(
             unit="workload_rate:W"
         )
@@ -128,11 +218,18 @@ class CPUConsumptionProfileModel(ConsumptionProfileModel):
             _TDPWorkloadPower(load_percentage=w, power_watt=cpu_tdp * r)
             for w, r in zip(self._TDP_RATIOS_WORKLOAD, self._TDP_RATIOS)
         ])
-        return self.__compute_model_adaptation(base_model=base_model)
+        model = tdp_fit_cache.get(base_model, cpu_tdp)
+        if model is None:
+            model = self.__compute_model_adaptation(base_model=base_model)
+            tdp_fit_cache.set(base_model, cpu_tdp, model)
+        return model
 
     def __compute_model_adaptation(self, base_model: Dict[str, float]) -> Dict[str, float]:
         base_model_list = self.__model_dict_to_list(base_model)
         bounds = self.__adapt_model_bounds(base_model_list)
+        # scipy is only imported by the first fit, most requests use a memoized or persisted fit
+        from scipy.optimize import curve_fit
+
         x_data, y_data = self.list_workloads
         popt, _ = curve_fit(f=self.__log_model,
                             xdata=x_data,
@@ -157,6 +254,7 @@ class CPUConsumptionProfileModel(ConsumptionProfileModel):
 
     @staticmethod
     def __log_model(x: float, a: float, b: float, c: float, d: float) -> float:
+        import numpy as np
         return a * np.log(b * (x + c)) + d
 
     @staticmethod
@@ -164,15 +262,15 @@ class CPUConsumptionProfileModel(ConsumptionProfileModel):
             cpu_manufacturer: str = None,
             cpu_model_range: str = None
     ) -> Optional[Dict[str, float]]:
-        sub = _cpu_profile_consumption_df
+        sub = data_table('consumption_profile/cpu/cpu_profile.csv')
 
         if cpu_manufacturer is not None:
-            tmp = sub[sub['manufacturer'].fuzzymatch(cpu_manufacturer)]
+            tmp = sub[fuzzymatch.fuzzymatch(sub['manufacturer'], cpu_manufacturer)]
             if len(tmp) > 0:
                 sub = tmp.copy()
 
         if cpu_model_range is not None:
-            tmp = sub[sub['model_range'].fuzzymatch(cpu_model_range)]
+            tmp = sub[fuzzymatch.fuzzymatch(sub['model_range'], cpu_model_range)]
             if len(tmp) > 0:
                 sub = tmp.copy()
 
@@ -183,4 +281,34 @@ class CPUConsumptionProfileModel(ConsumptionProfileModel):
                 'b': row.b,
                 'c': row.c,
                 'd': row.d,
-            }
\ No newline at end of file
+            }
+
+
+def prewarm_tdp_fit_cache(cache_path: Optional[str] = config["cpu_profile_fit_cache_path"],
+                          fit_cpu_specs: bool = config["cpu_profile_fit_prewarm"]) -> int:
+    """
+    Loads the persisted TDP fits, fits every distinct (manufacturer, model_range, tdp) of the cpu specs
+    that is still missing, and persists the result. These fits are pinned. Returns the number of fits computed.
+    """
+    if cache_path and os.path.exists(cache_path):
+        tdp_fit_cache.load(cache_path)
+
+    computed = 0
+    if fit_cpu_specs:
+        cpu_specs = data_table('crowdsourcing/cpu_specs.csv')
+        cpu_specs = cpu_specs[cpu_specs["tdp"].notna()][["manufacturer", "model_range", "tdp"]].drop_duplicates()
+        cpu_specs = cpu_specs.astype(object).where(cpu_specs.notna(), None)
+        for manufacturer, model_range, tdp in cpu_specs.itertuples(index=False):
+            size = len(tdp_fit_cache)
+            CPUConsumptionProfileModel().compute_consumption_profile_model(cpu_manufacturer=manufacturer,
+                                                                           cpu_model_range=model_range,
+                                                                           cpu_tdp=int(tdp))
+            computed += len(tdp_fit_cache) - size
+            # the fits of the cpu specs are kept whatever the TDPs requested later
+            tdp_fit_cache.pin_all()
+
+    if cache_path and computed:
+        tdp_fit_cache.save(cache_path)
+
+    _logger.info(f"CPU consumption profile TDP fits: {len(tdp_fit_cache)} cached, {computed} computed")
+    return computed
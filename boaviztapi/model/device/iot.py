@@ -4,7 +4,7 @@ from boaviztapi import config
 from boaviztapi.model.component.functional_block import ComponentFunctionalBlock, get_functional_block
 from boaviztapi.model.device import Device
 from boaviztapi.model.usage import ModelUsage
-from boaviztapi.service.archetype import get_arch_component, get_iot_device_archetype
+from boaviztapi.service.archetype import get_arch_component, get_iot_device_archetype, LazyArchetype, resolve_archetype
 
 
 class DeviceIoT(Device):
@@ -12,8 +12,9 @@ class DeviceIoT(Device):
     WARNINGS = ["Connected object, not including associated digital services (use of network, datacenter, "
                 "virtual machines or other terminals not included)", "Do not include the impact of distribution"]
 
-    def __init__(self, archetype=get_iot_device_archetype(config["default_iot_device"]),
+    def __init__(self, archetype=LazyArchetype(lambda: get_iot_device_archetype(config["default_iot_device"])),
                  functional_block: List[ComponentFunctionalBlock] = None):
+        archetype = resolve_archetype(archetype)
         super().__init__(archetype=archetype)
 
         if functional_block is None:
@@ -6,13 +6,14 @@ from boaviztapi.model.component import Component, ComponentCPU, ComponentRAM, Co
 from boaviztapi.model.device.device import Device
 from boaviztapi.model.impact import ImpactFactor
 from boaviztapi.model.usage import ModelUsageServer
-from boaviztapi.service.archetype import get_server_archetype, get_arch_component
+from boaviztapi.service.archetype import get_server_archetype, get_arch_component, LazyArchetype, resolve_archetype
 
 
 class DeviceServer(Device):
     NAME = "SERVER"
 
-    def __init__(self, archetype=get_server_archetype(config["default_server"]), **kwargs):
+    def __init__(self, archetype=LazyArchetype(lambda: get_server_archetype(config["default_server"])), **kwargs):
+        archetype = resolve_archetype(archetype)
         super().__init__(archetype=archetype, **kwargs)
         self._cpu = None
         self._ram_list = None
@@ -125,11 +126,7 @@ class DeviceServer(Device):
             self.motherboard]
 
     def model_power_consumption(self):
-        conso_cpu = ImpactFactor(
-            value=self.cpu.model_power_consumption().value,
-            min=self.cpu.model_power_consumption().min,
-            max=self.cpu.model_power_consumption().max,
-        )
+        conso_cpu = self.cpu.model_power_consumption()
         self.cpu.usage.avg_power.set_completed(value=conso_cpu.value,
                                                min=conso_cpu.min,
                                                max=conso_cpu.max)
@@ -140,9 +137,10 @@ class DeviceServer(Device):
             max=0
         )
         for ram_unit in self.ram:
-            conso_ram.value = conso_ram.value + ram_unit.model_power_consumption().value
-            conso_ram.min = conso_ram.min + ram_unit.model_power_consumption().min
-            conso_ram.max = conso_ram.max + ram_unit.model_power_consumption().max
+            conso_ram_unit = ram_unit.model_power_consumption()
+            conso_ram.value = conso_ram.value + conso_ram_unit.value
+            conso_ram.min = conso_ram.min + conso_ram_unit.min
+            conso_ram.max = conso_ram.max + conso_ram_unit.max
             ram_unit.usage.avg_power.set_completed(value=conso_ram.value,
                                                    min=conso_ram.min,
                                                    max=conso_ram.max)
@@ -4,7 +4,8 @@ from boaviztapi import config
 from boaviztapi.model.boattribute import Boattribute
 from boaviztapi.model.device import Device
 from boaviztapi.model.usage import ModelUsage
-from boaviztapi.service.archetype import get_arch_value, get_user_terminal_archetype, get_arch_component
+from boaviztapi.service.archetype import get_arch_value, get_user_terminal_archetype, get_arch_component, \
+    LazyArchetype, resolve_archetype
 
 
 class EndUserDevice(Device):
@@ -31,7 +32,8 @@ class EndUserDevice(Device):
 class DeviceLaptop(EndUserDevice, ABC):
     NAME = "LAPTOP"
 
-    def __init__(self, archetype=get_user_terminal_archetype(config["default_laptop"]), **kwargs):
+    def __init__(self, archetype=LazyArchetype(lambda: get_user_terminal_archetype(config["default_laptop"])), **kwargs):
+        archetype = resolve_archetype(archetype)
         super().__init__(archetype=archetype, **kwargs)
         self.type = Boattribute(
             default=get_arch_value(archetype, 'type', 'default'),
@@ -42,7 +44,8 @@ class DeviceLaptop(EndUserDevice, ABC):
 class DeviceDesktop(EndUserDevice, ABC):
     NAME = "DESKTOP"
 
-    def __init__(self, archetype=get_user_terminal_archetype(config["default_desktop"]), **kwargs):
+    def __init__(self, archetype=LazyArchetype(lambda: get_user_terminal_archetype(config["default_desktop"])), **kwargs):
+        archetype = resolve_archetype(archetype)
         super().__init__(archetype=archetype, **kwargs)
         self.type = Boattribute(
             default=get_arch_value(archetype, 'type', 'default'),
@@ -53,21 +56,24 @@ class DeviceDesktop(EndUserDevice, ABC):
 class DeviceTablet(EndUserDevice, ABC):
     NAME = "TABLET"
 
-    def __init__(self, archetype=get_user_terminal_archetype(config["default_tablet"]), **kwargs):
+    def __init__(self, archetype=LazyArchetype(lambda: get_user_terminal_archetype(config["default_tablet"])), **kwargs):
+        archetype = resolve_archetype(archetype)
         super().__init__(archetype=archetype, **kwargs)
 
 
 class DeviceSmartphone(EndUserDevice, ABC):
     NAME = "SMARTPHONE"
 
-    def __init__(self, archetype=get_user_terminal_archetype(config["default_smartphone"]), **kwargs):
+    def __init__(self, archetype=LazyArchetype(lambda: get_user_terminal_archetype(config["default_smartphone"])), **kwargs):
+        archetype = resolve_archetype(archetype)
         super().__init__(archetype=archetype, **kwargs)
 
 
 class DeviceTelevision(EndUserDevice, ABC):
     NAME = "TELEVISION"
 
-    def __init__(self, archetype=get_user_terminal_archetype(config["default_television"]), **kwargs):
+    def __init__(self, archetype=LazyArchetype(lambda: get_user_terminal_archetype(config["default_television"])), **kwargs):
+        archetype = resolve_archetype(archetype)
         super().__init__(archetype=archetype, **kwargs)
         self.type = Boattribute(
             default=get_arch_value(archetype, 'type', 'default'),
@@ -78,40 +84,46 @@ class DeviceTelevision(EndUserDevice, ABC):
 class DeviceSmartWatch(EndUserDevice, ABC):
     NAME = "SMARTWATCH"
 
-    def __init__(self, archetype=get_user_terminal_archetype(config["default_smartwatch"]), **kwargs):
+    def __init__(self, archetype=LazyArchetype(lambda: get_user_terminal_archetype(config["default_smartwatch"])), **kwargs):
+        archetype = resolve_archetype(archetype)
         super().__init__(archetype=archetype, **kwargs)
 
 
 class DeviceBox(EndUserDevice, ABC):
     NAME = "BOX"
 
-    def __init__(self, archetype=get_user_terminal_archetype(config["default_box"]), **kwargs):
+    def __init__(self, archetype=LazyArchetype(lambda: get_user_terminal_archetype(config["default_box"])), **kwargs):
+        archetype = resolve_archetype(archetype)
         super().__init__(archetype=archetype, **kwargs)
 
 
 class DeviceUsbStick(EndUserDevice, ABC):
     NAME = "USB_STICK"
 
-    def __init__(self, archetype=get_user_terminal_archetype(config["default_usb_stick"]), **kwargs):
+    def __init__(self, archetype=LazyArchetype(lambda: get_user_terminal_archetype(config["default_usb_stick"])), **kwargs):
+        archetype = resolve_archetype(archetype)
         super().__init__(archetype=archetype, **kwargs)
 
 
 class DeviceExternalSSD(EndUserDevice, ABC):
     NAME = "EXTERNAL_SSD"
 
-    def __init__(self, archetype=get_user_terminal_archetype(config["default_external_ssd"]), **kwargs):
+    def __init__(self, archetype=LazyArchetype(lambda: get_user_terminal_archetype(config["default_external_ssd"])), **kwargs):
+        archetype = resolve_archetype(archetype)
         super().__init__(archetype=archetype, **kwargs)
 
 
 class DeviceExternalHDD(EndUserDevice, ABC):
     NAME = "EXTERNAL_HDD"
 
-    def __init__(self, archetype=get_user_terminal_archetype(config["default_external_hdd"]), **kwargs):
+    def __init__(self, archetype=LazyArchetype(lambda: get_user_terminal_archetype(config["default_external_hdd"])), **kwargs):
+        archetype = resolve_archetype(archetype)
         super().__init__(archetype=archetype, **kwargs)
 
 
 class DeviceMonitor(EndUserDevice, ABC):
     NAME = "MONITOR"
 
-    def __init__(self, archetype=get_user_terminal_archetype(config["default_monitor"]), **kwargs):
+    def __init__(self, archetype=LazyArchetype(lambda: get_user_terminal_archetype(config["default_monitor"])), **kwargs):
+        archetype = resolve_archetype(archetype)
         super().__init__(archetype=archetype, **kwargs)
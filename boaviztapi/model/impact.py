@@ -17,25 +17,39 @@ class ImpactCriteria:
 
 
 class Impact:
+    __slots__ = ("value", "min", "max", "_warnings")
+
     def __init__(self, **kwargs):
         self.value = 0
         self.min = 0
         self.max = 0
-        self.warnings = []
+        self._warnings = None
 
         for attr, val in kwargs.items():
             if val is not None:
                 self.__setattr__(attr, val)
 
+    @property
+    def warnings(self) -> list:
+        if self._warnings is None:
+            return []
+        return self._warnings
+
+    @warnings.setter
+    def warnings(self, warnings: list):
+        self._warnings = list(warnings) if warnings else None
+
     def add_warning(self, warn):
-        if warn not in self.warnings:
-            self.warnings.append(warn)
+        if self._warnings is None:
+            self._warnings = []
+        if warn not in self._warnings:
+            self._warnings.append(warn)
 
     def to_json(self):
         json = {"value": self.rounded_value()}
         if self.min or self.min == 0: json['min'] = self.rounded_min()
         if self.max or self.max == 0: json['max'] = self.rounded_max()
-        if self.warnings: json['warnings'] = sorted(self.warnings)
+        if self._warnings: json['warnings'] = sorted(self._warnings)
 
         return json
 
@@ -58,7 +72,20 @@ class Impact:
         return rd.round_to_sigfig(self.max, config["max_sig_fig"])
 
     def allocate(self, duration, life_time):
-        if duration > life_time.value:
+        if _is_vector(duration) or _is_vector(life_time.value):
+            # one allocation per duration or per sampled lifetime, see compute_impacts_by_duration and
+            # compute_impact_distributions
+            import numpy as np
+
+            # np.where evaluates both branches: the bounds are read without storing them, as the getters would
+            # whatever the durations (see compute_impacts_by_duration)
+            life_time_value = life_time.value
+            life_time_min, life_time_max = life_time.bounds()
+            beyond_life_time = duration > life_time_value
+            allocation_ratio = np.where(beyond_life_time, 1, duration / life_time_value)
+            allocation_ratio_min = np.where(beyond_life_time, 1, duration / life_time_max)
+            allocation_ratio_max = np.where(beyond_life_time, 1, duration / life_time_min)
+        elif duration > life_time.value:
             allocation_ratio, allocation_ratio_min, allocation_ratio_max = 1, 1, 1
         else:
             allocation_ratio = duration / life_time.value
@@ -69,6 +96,21 @@ class Impact:
         self.min = self.min * allocation_ratio_min
         self.max = self.max * allocation_ratio_max
 
+    def at(self, index: int) -> "Impact":
+        """
+        Impact for the index-th duration of an impact computed for several durations at once.
+        """
+        return Impact(value=_item(self.value, index), min=_item(self.min, index), max=_item(self.max, index),
+                      warnings=self._warnings)
+
+
+def _is_vector(value) -> bool:
+    return getattr(value, "ndim", 0) > 0
+
+
+def _item(value, index: int):
+    return float(value[index]) if _is_vector(value) else value
+
 
 
 GWP = ImpactCriteria(name="gwp", unit="kgCO2eq", description="Total climate change")
@@ -111,6 +153,8 @@ IMPACT_PHASES = [EMBEDDED, USE]
 
 
 class ImpactFactor:
+    __slots__ = ("value", "min", "max")
+
     def __init__(self, **kwargs):
         self.value = 0
         self.min = 0
@@ -124,7 +168,7 @@ class Assessable:
     def __init__(self, **kwargs):
         self._impacts = {}
 
-    def get_impacts(self, selected_criteria):
+    def get_impacts(self, selected_criteria, index: Optional[int] = None):
         result = {}
         for criteria in selected_criteria:
             result[criteria] = {}
@@ -134,7 +178,10 @@ class Assessable:
                 if criteria not in self._impacts or phase not in self._impacts[criteria] or self._impacts[criteria][phase] is None:
                     result[criteria][phase] = NOT_IMPLEMENTED
                 else:
-                    result[criteria][phase] = self._impacts[criteria][phase].to_json()
+                    impact = self._impacts[criteria][phase]
+                    if index is not None:
+                        impact = impact.at(index)
+                    result[criteria][phase] = impact.to_json()
         return result
     @property
     def impacts(self):
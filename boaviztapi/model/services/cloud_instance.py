@@ -3,7 +3,8 @@ from boaviztapi.model.boattribute import Boattribute
 from boaviztapi.model.device.server import DeviceServer
 from boaviztapi.model.impact import Assessable, ImpactFactor
 from boaviztapi.model.usage import ModelUsage
-from boaviztapi.service.archetype import get_server_archetype, get_cloud_instance_archetype, get_arch_value
+from boaviztapi.service.archetype import get_server_archetype, get_cloud_instance_archetype, get_arch_value, \
+    LazyArchetype, resolve_archetype
 
 
 class Service(Assessable):
@@ -30,8 +31,9 @@ class Service(Assessable):
 class ServiceCloudInstance(Service):
     NAME = "CLOUD_INSTANCE"
 
-    def __init__(self, archetype=get_cloud_instance_archetype(config["default_cloud_instance"], config["default_cloud_provider"]),
+    def __init__(self, archetype=LazyArchetype(lambda: get_cloud_instance_archetype(config["default_cloud_instance"], config["default_cloud_provider"])),
                  **kwargs):
+        archetype = resolve_archetype(archetype)
         super().__init__(archetype=archetype, **kwargs)
 
         self._platform = DeviceServer(archetype=get_server_archetype(archetype_name=get_arch_value(archetype, 'platform', 'default')))
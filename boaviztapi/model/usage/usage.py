@@ -1,8 +1,12 @@
 import os
+from collections.abc import Mapping
+from functools import partial
+from typing import Iterator
 
 from boaviztapi import config, data_dir
 from boaviztapi.model.boattribute import Boattribute
-from boaviztapi.service.archetype import get_arch_value, get_server_archetype, get_cloud_instance_archetype
+from boaviztapi.service.archetype import get_arch_value, get_server_archetype, get_cloud_instance_archetype, \
+    LazyArchetype, resolve_archetype
 from boaviztapi.service.factor_provider import get_available_countries, get_electrical_impact_factor, \
     get_electrical_min_max
 
@@ -10,6 +14,64 @@ _cpu_profile_path = os.path.join(data_dir, 'consumption_profile/cpu/cpu_profile.
 _cloud_profile_path = os.path.join(data_dir, 'consumption_profile/cloud/cpu_profile.csv')
 _server_profile_path = os.path.join(data_dir, 'consumption_profile/server/server_profile.csv')
 
+# Electricity impact factors: criteria -> (unit, criteria of the factors file used as value)
+ELEC_FACTORS = {
+    "gwp": ("kg CO2eq/kWh", "gwp"),
+    "adp": ("kg Sbeq/kWh", "adpe"),
+    "pe": ("MJ/kWh", "pe"),
+    "gwppb": ("kg CO2eq/kWh", "gwppb"),
+    "gwppf": ("kg CO2eq/kWh", "gwppf"),
+    "gwpplu": ("kg CO2eq/kWh", "gwpplu"),
+    "ir": ("kg U235eq/kWh", "ir"),
+    "lu": ("No dimension/kWh", "lu"),
+    "odp": ("kg CFC-11eq/kWh", "odp"),
+    "pm": ("Disease occurrence/kWh", "pm"),
+    "pocp": ("kg NMVOCeq/kWh", "pocp"),
+    "wu": ("m3eq/kWh", "wu"),
+    "mips": ("kg/kWh", "mips"),
+    "adpe": ("kg Sbeq/kWh", "adpe"),
+    "adpf": ("MJ/kWh", "adpf"),
+    "ap": ("mol H+eq/kWh", "ap"),
+    "ctue": ("CTUe/kWh", "ctue"),
+    "ctuh_c": ("CTUh/kWh", "ctuh_c"),
+    "ctuh_nc": ("CTUh/kWh", "ctuh_nc"),
+    "epf": ("kg Peq/kWh", "epf"),
+    "epm": ("kg Neq/kWh", "epm"),
+    "ept": ("mol Neq/kWh", "ept"),
+}
+
+
+class ElecFactors(Mapping):
+    """
+    Electricity impact factors of a usage, by criteria. The attribute of a criteria is only created when it is
+    first accessed, most requests use a few of the criteria.
+    """
+    __slots__ = ("_usage", "_factors")
+
+    def __init__(self, usage: "ModelUsage"):
+        self._usage = usage
+        self._factors = {}
+
+    def __getitem__(self, criteria: str) -> Boattribute:
+        factor = self._factors.get(criteria)
+        if factor is None:
+            unit, criteria_proxy = ELEC_FACTORS[criteria]
+            factor = Boattribute(unit=unit, complete_function=partial(self._usage._complete_impact_factor,
+                                                                      criteria, criteria_proxy))
+            self._factors[criteria] = factor
+        return factor
+
+    def __contains__(self, criteria) -> bool:
+        return criteria in ELEC_FACTORS
+
+    def __iter__(self) -> Iterator[str]:
+        # only the created attributes, in the order of ELEC_FACTORS
+        return (criteria for criteria in ELEC_FACTORS if criteria in self._factors)
+
+    def __len__(self) -> int:
+        return len(self._factors)
+
+
 class ModelUsage:
 
     _DAYS_IN_HOURS = 24
@@ -48,30 +110,7 @@ class ModelUsage:
             min=get_arch_value(archetype, 'hours_life_time', 'min'),
             max=get_arch_value(archetype, 'hours_life_time', 'max')
         )
-        self.elec_factors = {
-            "gwp": Boattribute(unit="kg CO2eq/kWh", complete_function=self._complete_gwp),
-            "adp": Boattribute(unit="kg Sbeq/kWh", complete_function=self._complete_adp),
-            "pe": Boattribute(unit="MJ/kWh", complete_function=self._complete_pe),
-            "gwppb": Boattribute(unit="kg CO2eq/kWh", complete_function=self._complete_gwppb),
-            "gwppf": Boattribute(unit="kg CO2eq/kWh", complete_function=self._complete_gwppf),
-            "gwpplu": Boattribute(unit="kg CO2eq/kWh", complete_function=self._complete_gwpplu),
-            "ir": Boattribute(unit="kg U235eq/kWh", complete_function=self._complete_ir),
-            "lu": Boattribute(unit="No dimension/kWh", complete_function=self._complete_lu),
-            "odp": Boattribute(unit="kg CFC-11eq/kWh", complete_function=self._complete_odp),
-            "pm": Boattribute(unit="Disease occurrence/kWh", complete_function=self._complete_pm),
-            "pocp": Boattribute(unit="kg NMVOCeq/kWh", complete_function=self._complete_pocp),
-            "wu": Boattribute(unit="m3eq/kWh", complete_function=self._complete_wu),
-            "mips": Boattribute(unit="kg/kWh", complete_function=self._complete_mips),
-            "adpe": Boattribute(unit="kg Sbeq/kWh", complete_function=self._complete_adpe),
-            "adpf": Boattribute(unit="MJ/kWh", complete_function=self._complete_adpf),
-            "ap": Boattribute(unit="mol H+eq/kWh", complete_function=self._complete_ap),
-            "ctue": Boattribute(unit="CTUe/kWh", complete_function=self._complete_ctue),
-            "ctuh_c": Boattribute(unit="CTUh/kWh", complete_function=self._complete_ctuh_c),
-            "ctuh_nc": Boattribute(unit="CTUh/kWh", complete_function=self._complete_ctuh_nc),
-            "epf": Boattribute(unit="kg Peq/kWh", complete_function=self._complete_epf),
-            "epm": Boattribute(unit="kg Neq/kWh", complete_function=self._complete_epm),
-            "ept": Boattribute(unit="mol Neq/kWh", complete_function=self._complete_ept),
-        }
+        self.elec_factors = ElecFactors(self)
 
     def __iter__(self):
         for attr, value in self.__dict__.items():
@@ -99,54 +138,11 @@ class ModelUsage:
                                                              min=factor["value"],
                                                              max=factor["value"])
 
-    def _complete_gwp(self):
-        self._complete_impact_factor("gwp", "gwp")
-    def _complete_adp(self):
-        self._complete_impact_factor("adp", "adpe")
-    def _complete_pe(self):
-        self._complete_impact_factor("pe", "pe")
-    def _complete_gwppb(self):
-        self._complete_impact_factor("gwppb", "gwppb")
-    def _complete_gwppf(self):
-        self._complete_impact_factor("gwppf", "gwppf")
-    def _complete_gwpplu(self):
-        self._complete_impact_factor("gwpplu", "gwpplu")
-    def _complete_ir(self):
-        self._complete_impact_factor("ir", "ir")
-    def _complete_lu(self):
-        self._complete_impact_factor("lu", "lu")
-    def _complete_odp(self):
-        self._complete_impact_factor("odp", "odp")
-    def _complete_pm(self):
-        self._complete_impact_factor("pm", "pm")
-    def _complete_pocp(self):
-        self._complete_impact_factor("pocp", "pocp")
-    def _complete_wu(self):
-        self._complete_impact_factor("wu", "wu")
-    def _complete_mips(self):
-        self._complete_impact_factor("mips", "mips")
-    def _complete_adpe(self):
-        self._complete_impact_factor("adpe", "adpe")
-    def _complete_adpf(self):
-        self._complete_impact_factor("adpf", "adpf")
-    def _complete_ap(self):
-        self._complete_impact_factor("ap", "ap")
-    def _complete_ctue(self):
-        self._complete_impact_factor("ctue", "ctue")
-    def _complete_ctuh_c(self):
-        self._complete_impact_factor("ctuh_c", "ctuh_c")
-    def _complete_ctuh_nc(self):
-        self._complete_impact_factor("ctuh_nc", "ctuh_nc")
-    def _complete_epf(self):
-        self._complete_impact_factor("epf", "epf")
-    def _complete_epm(self):
-        self._complete_impact_factor("epm", "epm")
-    def _complete_ept(self):
-        self._complete_impact_factor("ept", "ept")
 
 class ModelUsageServer(ModelUsage):
 
-    def __init__(self, archetype=get_server_archetype(config["default_server"]).get("USAGE"), **kwargs):
+    def __init__(self, archetype=LazyArchetype(lambda: get_server_archetype(config["default_server"]).get("USAGE")), **kwargs):
+        archetype = resolve_archetype(archetype)
         super().__init__(archetype=archetype, **kwargs)
 
         self.other_consumption_ratio = Boattribute(
@@ -157,7 +153,8 @@ class ModelUsageServer(ModelUsage):
         )
 
 class ModelUsageCloud(ModelUsageServer):
-    def __init__(self, archetype=get_cloud_instance_archetype(config["default_cloud_instance"], config["default_cloud_provider"]).get("USAGE"), **kwargs):
+    def __init__(self, archetype=LazyArchetype(lambda: get_cloud_instance_archetype(config["default_cloud_instance"], config["default_cloud_provider"]).get("USAGE")), **kwargs):
+        archetype = resolve_archetype(archetype)
         super().__init__(archetype=archetype, **kwargs)
         self.instance_per_server = Boattribute(
             default=get_arch_value(archetype, 'instance_per_server', 'default'),
@@ -0,0 +1,20 @@
+from typing import List
+
+from fastapi import APIRouter, Body
+
+from boaviztapi.dto.batch import BatchItem
+from boaviztapi.routers.openapi_doc.descriptions import batch_description
+from boaviztapi.routers.openapi_doc.examples import batch_example
+from boaviztapi.service.batch_computation import compute_batch
+from boaviztapi.service.serialization import ImpactJSONResponse
+
+batch_router = APIRouter(
+    prefix='/v1/batch',
+    tags=['batch']
+)
+
+
+@batch_router.post('',
+                   description=batch_description)
+async def batch_impact(items: List[BatchItem] = Body(..., example=batch_example)):
+    return ImpactJSONResponse(await compute_batch(items))
@@ -1,9 +1,8 @@
 import os
-from typing import List, Optional
-
-import pandas as pd
+from typing import List, Optional, Union
 
 from fastapi import APIRouter, Query, Body, HTTPException
+from starlette.responses import Response
 
 from boaviztapi import config, data_dir
 from boaviztapi.dto.device import Cloud
@@ -12,9 +11,18 @@ from boaviztapi.model.services.cloud_instance import ServiceCloudInstance
 from boaviztapi.routers.openapi_doc.descriptions import cloud_provider_description, all_default_cloud_instances, \
     all_default_cloud_providers, get_instance_config
 from boaviztapi.routers.openapi_doc.examples import cloud_example
-from boaviztapi.service.archetype import get_cloud_instance_archetype, get_device_archetype_lst
-from boaviztapi.service.impacts_computation import compute_impacts
+from boaviztapi.service.archetype import get_cloud_instance_archetype
+from boaviztapi.service.cloud_impact_table import cloud_impact_table
+from boaviztapi.service.execution import run_compute
+from boaviztapi.service.factor_provider import get_available_countries
+from boaviztapi.service.listing import get_listing, listing_response
+from boaviztapi.service.serialization import ImpactJSONResponse
+from boaviztapi.service.response_cache import response_cache, response_key
+from boaviztapi.service.uncertainty import compute_impact_distributions
+from boaviztapi.service.impacts_computation import compute_impacts, compute_impacts_by_duration, \
+    compute_impacts_by_location
 from boaviztapi.service.verbose import verbose_device, verbose_cloud
+from boaviztapi.utils.data_snapshot import read_csv
 
 cloud_router = APIRouter(
     prefix='/v1/cloud',
@@ -37,8 +45,10 @@ async def get_archetype_config(
                    description=cloud_provider_description)
 async def instance_cloud_impact(cloud_instance: Cloud = Body(None, example=cloud_example),
                                 verbose: bool = True,
-                                duration: Optional[float] = config["default_duration"],
-                                criteria: List[str] = Query(config["default_criteria"])):
+                                duration: Optional[List[float]] = Query(config["default_duration"]),
+                                criteria: List[str] = Query(config["default_criteria"]),
+                                usage_locations: Optional[List[str]] = Query(None),
+                                samples: Optional[int] = Query(None, gt=0, le=config["uncertainty_max_samples"])):
     instance_archetype = get_cloud_instance_archetype(cloud_instance.instance_type, cloud_instance.provider)
 
     if not instance_archetype:
@@ -51,7 +61,11 @@ async def instance_cloud_impact(cloud_instance: Cloud = Body(None, example=cloud
         cloud_instance=instance_model,
         verbose=verbose,
         duration=duration,
-        criteria=criteria
+        criteria=criteria,
+        usage_locations=usage_locations,
+        samples=samples,
+        cache_key=response_key("cloud", cloud_instance, verbose=verbose, duration=duration, criteria=criteria,
+                               usage_locations=usage_locations, samples=samples)
     )
 
 
@@ -61,8 +75,20 @@ async def instance_cloud_impact(
         provider: str = Query(config["default_cloud_provider"], example=config["default_cloud_provider"]),
         instance_type: str = Query(config["default_cloud_instance"], example=config["default_cloud_instance"]),
         verbose: bool = True,
-        duration: Optional[float] = config["default_duration"],
-        criteria: List[str] = Query(config["default_criteria"])):
+        duration: Optional[List[float]] = Query(config["default_duration"]),
+        criteria: List[str] = Query(config["default_criteria"]),
+        usage_locations: Optional[List[str]] = Query(None),
+        samples: Optional[int] = Query(None, gt=0, le=config["uncertainty_max_samples"])):
+
+    if duration is None and not usage_locations and samples is None:
+        if not verbose:
+            impacts = cloud_impact_table.get(provider, instance_type, criteria)
+            if impacts is not None:
+                return ImpactJSONResponse({"impacts": impacts})
+        elif criteria == config["default_criteria"]:
+            body = cloud_impact_table.get_verbose(provider, instance_type)
+            if body is not None:
+                return Response(content=body, media_type="application/json")
 
     cloud_instance = Cloud()
     cloud_instance.usage = {}
@@ -78,37 +104,81 @@ async def instance_cloud_impact(
         cloud_instance=instance_model,
         verbose=verbose,
         duration=duration,
-        criteria=criteria
+        criteria=criteria,
+        usage_locations=usage_locations,
+        samples=samples,
+        cache_key=response_key("cloud", None, provider=provider, instance_type=instance_type, verbose=verbose,
+                               duration=duration, criteria=criteria, usage_locations=usage_locations,
+                               samples=samples)
     )
 
 
 @cloud_router.get('/instance/all_instances',
-                  description=all_default_cloud_instances)
-async def server_get_all_archetype_name(provider: str = Query(None, example="aws")):
-    if not os.path.exists(data_dir + '/archetypes/cloud/' + provider + '.csv'):
+                  description=all_default_cloud_instances, response_model=List[str])
+async def server_get_all_archetype_name(provider: str = Query(None, example="aws"),
+                                        prefix: Optional[str] = Query(None, example="c5"),
+                                        offset: int = Query(0, ge=0),
+                                        limit: Optional[int] = Query(None, gt=0)):
+    path = os.path.join(data_dir, 'archetypes/cloud/' + provider + '.csv')
+    if not os.path.exists(path):
         raise HTTPException(status_code=404, detail=f"No available data for this cloud provider ({provider})")
-    return get_device_archetype_lst(os.path.join(data_dir, 'archetypes/cloud/' + provider + '.csv'))
+    instances = get_listing(path, lambda: read_csv(path)['id'].drop_duplicates().tolist())
+    return listing_response(instances, prefix, offset, limit)
 
 
 @cloud_router.get('/instance/all_providers',
-                  description=all_default_cloud_providers)
+                  description=all_default_cloud_providers, response_model=List[str])
 async def server_get_all_provider_name():
-    df = pd.read_csv(os.path.join(data_dir, 'archetypes/cloud/providers.csv'))
-    return df['provider.name'].tolist()
+    path = os.path.join(data_dir, 'archetypes/cloud/providers.csv')
+    return listing_response(get_listing(path, lambda: read_csv(path)['provider.name'].tolist()))
 
 
 async def cloud_instance_impact(cloud_instance: ServiceCloudInstance,
                                 verbose: bool,
-                                duration: Optional[float] = config["default_duration"],
-                                criteria: List[str] = Query(config["default_criteria"])) -> dict:
-    if duration is None:
-        duration = cloud_instance.platform.usage.hours_life_time.value
-
-    impacts = compute_impacts(model=cloud_instance, selected_criteria=criteria, duration=duration)
+                                duration: Optional[List[float]] = Query(config["default_duration"]),
+                                criteria: List[str] = Query(config["default_criteria"]),
+                                usage_locations: Optional[List[str]] = None,
+                                samples: Optional[int] = None,
+                                cache_key: Optional[str] = None) -> ImpactJSONResponse:
+    if usage_locations and duration is not None and len(duration) > 1:
+        raise HTTPException(status_code=400, detail="usage_locations cannot be combined with several durations")
+    if samples and (usage_locations or duration is not None and len(duration) > 1):
+        raise HTTPException(status_code=400,
+                            detail="samples cannot be combined with several durations or usage_locations")
+    if usage_locations and verbose:
+        raise HTTPException(status_code=400, detail="usage_locations cannot be combined with verbose, "
+                                                    "set verbose=false")
+    if usage_locations:
+        unknown = [location for location in usage_locations
+                   if location != "all" and location not in get_available_countries(reverse=True)]
+        if unknown:
+            raise HTTPException(status_code=400, detail=f"Unknown usage locations: {', '.join(unknown)}")
+    return ImpactJSONResponse(await response_cache.run(cache_key, run_compute, compute_cloud_instance_impact,
+                                                       cloud_instance, verbose, duration, criteria, usage_locations,
+                                                       samples))
+
+
+def compute_cloud_instance_impact(cloud_instance: ServiceCloudInstance, verbose: bool,
+                                  duration: Optional[List[float]], criteria: List[str],
+                                  usage_locations: Optional[List[str]] = None,
+                                  samples: Optional[int] = None) -> Union[dict, List[dict]]:
+    if usage_locations:
+        duration = duration[0] if duration else cloud_instance.platform.usage.hours_life_time.value
+        return compute_impacts_by_location(model=cloud_instance, selected_criteria=criteria, duration=duration,
+                                           usage_locations=usage_locations)
+
+    if duration is not None and len(duration) > 1:
+        return compute_impacts_by_duration(
+            model=cloud_instance, selected_criteria=criteria, durations=duration,
+            verbose=(lambda d, i: verbose_cloud(cloud_instance, selected_criteria=criteria, duration=d, index=i))
+            if verbose else None)
+
+    duration = duration[0] if duration else cloud_instance.platform.usage.hours_life_time.value
+
+    result = {"impacts": compute_impacts(model=cloud_instance, selected_criteria=criteria, duration=duration)}
 
     if verbose:
-        return {
-            "impacts": impacts,
-            "verbose": verbose_cloud(cloud_instance, selected_criteria=criteria, duration=duration)
-        }
-    return {"impacts": impacts}
+        result["verbose"] = verbose_cloud(cloud_instance, selected_criteria=criteria, duration=duration)
+    if samples:
+        result["uncertainty"] = compute_impact_distributions(cloud_instance, criteria, duration, samples)
+    return result
@@ -1,5 +1,5 @@
 import os
-from typing import List, Optional
+from typing import List, Optional, Union
 
 from fastapi import APIRouter, Body, HTTPException, Query
 
@@ -14,7 +14,10 @@ from boaviztapi.routers.openapi_doc.descriptions import cpu_description, ram_des
     hdd_description, motherboard_description, power_supply_description, case_description
 from boaviztapi.routers.openapi_doc.examples import components_examples
 from boaviztapi.service.archetype import get_component_archetype, get_device_archetype_lst
-from boaviztapi.service.impacts_computation import compute_impacts
+from boaviztapi.service.execution import run_compute
+from boaviztapi.service.serialization import ImpactJSONResponse
+from boaviztapi.service.response_cache import response_cache, response_key
+from boaviztapi.service.impacts_computation import compute_impacts, compute_impacts_by_duration
 from boaviztapi.service.verbose import verbose_component
 
 component_router = APIRouter(
@@ -55,7 +58,7 @@ async def cpu_archetype_config(archetype: str = Query(example=config["default_cp
                        description=cpu_description)
 async def cpu_impact_bottom_up(cpu: CPU = Body(None, example=components_examples["cpu"]),
                                verbose: bool = True,
-                               duration: Optional[float] = config["default_duration"],
+                               duration: Optional[List[float]] = Query(config["default_duration"]),
                                archetype: str = config["default_cpu"],
                                criteria: List[str] = Query(config["default_criteria"])):
     archetype_config = get_component_archetype(archetype, "cpu")
@@ -69,14 +72,15 @@ async def cpu_impact_bottom_up(cpu: CPU = Body(None, example=components_examples
         component=component,
         verbose=verbose,
         duration=duration,
-        criteria=criteria
+        criteria=criteria,
+        cache_key=response_key("cpu", cpu, archetype=archetype, verbose=verbose, duration=duration, criteria=criteria)
     )
 
 
 @component_router.get('/cpu',
                       description=cpu_description)
 async def cpu_impact_bottom_up(verbose: bool = True,
-                               duration: Optional[float] = config["default_duration"],
+                               duration: Optional[List[float]] = Query(config["default_duration"]),
                                archetype: str = config["default_cpu"],
                                criteria: List[str] = Query(config["default_criteria"])):
     archetype_config = get_component_archetype(archetype, "cpu")
@@ -90,7 +94,8 @@ async def cpu_impact_bottom_up(verbose: bool = True,
         component=component,
         verbose=verbose,
         duration=duration,
-        criteria=criteria
+        criteria=criteria,
+        cache_key=response_key("cpu", None, archetype=archetype, verbose=verbose, duration=duration, criteria=criteria)
     )
 
 
@@ -112,7 +117,7 @@ async def ram_archetype_config(archetype: str = Query(example=config["default_ra
                        description=ram_description)
 async def ram_impact_bottom_up(ram: RAM = Body(None, example=components_examples["ram"]),
                                verbose: bool = True,
-                               duration: Optional[float] = config["default_duration"],
+                               duration: Optional[List[float]] = Query(config["default_duration"]),
                                archetype: str = config["default_ram"],
                                criteria: List[str] = Query(config["default_criteria"])):
     archetype_config = get_component_archetype(archetype, "ram")
@@ -126,14 +131,15 @@ async def ram_impact_bottom_up(ram: RAM = Body(None, example=components_examples
         component=component,
         verbose=verbose,
         duration=duration,
-        criteria=criteria
+        criteria=criteria,
+        cache_key=response_key("ram", ram, archetype=archetype, verbose=verbose, duration=duration, criteria=criteria)
     )
 
 
 @component_router.get('/ram',
                       description=ram_description)
 async def ram_impact_bottom_up(verbose: bool = True,
-                               duration: Optional[float] = config["default_duration"],
+                               duration: Optional[List[float]] = Query(config["default_duration"]),
                                archetype: str = config["default_ram"],
                                criteria: List[str] = Query(config["default_criteria"])):
     archetype_config = get_component_archetype(archetype, "ram")
@@ -147,7 +153,8 @@ async def ram_impact_bottom_up(verbose: bool = True,
         component=component,
         verbose=verbose,
         duration=duration,
-        criteria=criteria
+        criteria=criteria,
+        cache_key=response_key("ram", None, archetype=archetype, verbose=verbose, duration=duration, criteria=criteria)
     )
 
 
@@ -169,7 +176,7 @@ async def ssd_archetype_config(archetype: str = Query(example=config["default_ss
                        description=ssd_description)
 async def disk_impact_bottom_up(disk: Disk = Body(None, example=components_examples["ssd"]),
                                 verbose: bool = True,
-                                duration: Optional[float] = config["default_duration"],
+                                duration: Optional[List[float]] = Query(config["default_duration"]),
                                 archetype: str = config["default_ssd"],
                                 criteria: List[str] = Query(config["default_criteria"])):
     disk.type = "ssd"
@@ -184,14 +191,15 @@ async def disk_impact_bottom_up(disk: Disk = Body(None, example=components_examp
         component=component,
         verbose=verbose,
         duration=duration,
-        criteria=criteria
+        criteria=criteria,
+        cache_key=response_key("ssd", disk, archetype=archetype, verbose=verbose, duration=duration, criteria=criteria)
     )
 
 
 @component_router.get('/ssd',
                       description=ssd_description)
 async def disk_impact_bottom_up(verbose: bool = True,
-                                duration: Optional[float] = config["default_duration"],
+                                duration: Optional[List[float]] = Query(config["default_duration"]),
                                 archetype: str = config["default_ssd"],
                                 criteria: List[str] = Query(config["default_criteria"])):
     disk = Disk()
@@ -207,7 +215,8 @@ async def disk_impact_bottom_up(verbose: bool = True,
         component=component,
         verbose=verbose,
         duration=duration,
-        criteria=criteria
+        criteria=criteria,
+        cache_key=response_key("ssd", disk, archetype=archetype, verbose=verbose, duration=duration, criteria=criteria)
     )
 
 
@@ -229,7 +238,7 @@ async def hdd_archetype_config(archetype: str = Query(example=config["default_hd
                        description=hdd_description)
 async def disk_impact_bottom_up(disk: Disk = Body(None, example=components_examples["hdd"]),
                                 verbose: bool = True,
-                                duration: Optional[float] = config["default_duration"],
+                                duration: Optional[List[float]] = Query(config["default_duration"]),
                                 archetype: str = config["default_hdd"],
                                 criteria: List[str] = Query(config["default_criteria"])):
     disk.type = "hdd"
@@ -244,14 +253,15 @@ async def disk_impact_bottom_up(disk: Disk = Body(None, example=components_examp
         component=component,
         verbose=verbose,
         duration=duration,
-        criteria=criteria
+        criteria=criteria,
+        cache_key=response_key("hdd", disk, archetype=archetype, verbose=verbose, duration=duration, criteria=criteria)
     )
 
 
 @component_router.get('/hdd',
                       description=hdd_description)
 async def disk_impact_bottom_up(verbose: bool = True,
-                                duration: Optional[float] = config["default_duration"],
+                                duration: Optional[List[float]] = Query(config["default_duration"]),
                                 archetype: str = config["default_hdd"],
                                 criteria: List[str] = Query(config["default_criteria"])):
     disk = Disk()
@@ -267,7 +277,8 @@ async def disk_impact_bottom_up(verbose: bool = True,
         component=component,
         verbose=verbose,
         duration=duration,
-        criteria=criteria
+        criteria=criteria,
+        cache_key=response_key("hdd", disk, archetype=archetype, verbose=verbose, duration=duration, criteria=criteria)
     )
 
 
@@ -290,7 +301,7 @@ async def motherboard_archetype_config(archetype: str = Query(example=config["de
 async def motherboard_impact_bottom_up(
         motherboard: Motherboard = Body(None, example=components_examples["motherboard"]),
         verbose: bool = True,
-        duration: Optional[float] = config["default_duration"],
+        duration: Optional[List[float]] = Query(config["default_duration"]),
         criteria: List[str] = Query(config["default_criteria"])):
     completed_motherboard = mapper_motherboard(motherboard)
 
@@ -298,14 +309,15 @@ async def motherboard_impact_bottom_up(
         component=completed_motherboard,
         verbose=verbose,
         duration=duration,
-        criteria=criteria
+        criteria=criteria,
+        cache_key=response_key("motherboard", motherboard, verbose=verbose, duration=duration, criteria=criteria)
     )
 
 
 @component_router.get('/motherboard',
                       description=motherboard_description)
 async def motherboard_impact_bottom_up(verbose: bool = True,
-                                       duration: Optional[float] = config["default_duration"],
+                                       duration: Optional[List[float]] = Query(config["default_duration"]),
                                        criteria: List[str] = Query(config["default_criteria"])):
     completed_motherboard = mapper_motherboard(Motherboard())
 
@@ -313,7 +325,8 @@ async def motherboard_impact_bottom_up(verbose: bool = True,
         component=completed_motherboard,
         verbose=verbose,
         duration=duration,
-        criteria=criteria
+        criteria=criteria,
+        cache_key=response_key("motherboard", None, verbose=verbose, duration=duration, criteria=criteria)
     )
 
 
@@ -336,7 +349,7 @@ async def power_supply_archetype_config(archetype: str = Query(example=config["d
 async def power_supply_impact_bottom_up(
         power_supply: PowerSupply = Body(None, example=components_examples["power_supply"]),
         verbose: bool = True,
-        duration: Optional[float] = config["default_duration"],
+        duration: Optional[List[float]] = Query(config["default_duration"]),
         archetype: str = config["default_power_supply"],
         criteria: List[str] = Query(config["default_criteria"])):
     archetype_config = get_component_archetype(archetype, "power_supply")
@@ -350,14 +363,16 @@ async def power_supply_impact_bottom_up(
         component=completed_power_supply,
         verbose=verbose,
         duration=duration,
-        criteria=criteria
+        criteria=criteria,
+        cache_key=response_key("power_supply", power_supply, archetype=archetype,
+                               verbose=verbose, duration=duration, criteria=criteria)
     )
 
 
 @component_router.get('/power_supply',
                       description=power_supply_description)
 async def power_supply_impact_bottom_up(verbose: bool = True,
-                                        duration: Optional[float] = config["default_duration"],
+                                        duration: Optional[List[float]] = Query(config["default_duration"]),
                                         archetype: str = config["default_power_supply"],
                                         criteria: List[str] = Query(config["default_criteria"])):
     archetype_config = get_component_archetype(archetype, "power_supply")
@@ -371,7 +386,9 @@ async def power_supply_impact_bottom_up(verbose: bool = True,
         component=completed_power_supply,
         verbose=verbose,
         duration=duration,
-        criteria=criteria
+        criteria=criteria,
+        cache_key=response_key("power_supply", None, archetype=archetype,
+                               verbose=verbose, duration=duration, criteria=criteria)
     )
 
 
@@ -393,7 +410,7 @@ async def case_archetype_config(archetype: str = Query(example=config["default_c
                        description=case_description)
 async def case_impact_bottom_up(case: Case = Body(None, example=components_examples["case"]),
                                 verbose: bool = True,
-                                duration: Optional[float] = config["default_duration"],
+                                duration: Optional[List[float]] = Query(config["default_duration"]),
                                 archetype: str = config["default_case"],
                                 criteria: List[str] = Query(config["default_criteria"])):
     archetype_config = get_component_archetype(archetype, "case")
@@ -407,14 +424,15 @@ async def case_impact_bottom_up(case: Case = Body(None, example=components_examp
         component=completed_case,
         verbose=verbose,
         duration=duration,
-        criteria=criteria
+        criteria=criteria,
+        cache_key=response_key("case", case, archetype=archetype, verbose=verbose, duration=duration, criteria=criteria)
     )
 
 
 @component_router.get('/case',
                       description=case_description)
 async def case_impact_bottom_up(verbose: bool = True,
-                                duration: Optional[float] = config["default_duration"],
+                                duration: Optional[List[float]] = Query(config["default_duration"]),
                                 archetype: str = config["default_case"],
                                 criteria: List[str] = Query(config["default_criteria"])):
     archetype_config = get_component_archetype(archetype, "case")
@@ -428,23 +446,36 @@ async def case_impact_bottom_up(verbose: bool = True,
         component=completed_case,
         verbose=verbose,
         duration=duration,
-        criteria=criteria
+        criteria=criteria,
+        cache_key=response_key("case", None, archetype=archetype, verbose=verbose, duration=duration, criteria=criteria)
     )
 
 
 async def component_impact_bottom_up(component: Component,
                                      verbose: bool,
-                                     duration: Optional[float] = config["default_duration"],
-                                     criteria=config["default_criteria"]) -> dict:
-    if duration is None:
-        duration = component.usage.hours_life_time.value
+                                     duration: Optional[List[float]] = Query(config["default_duration"]),
+                                     criteria=config["default_criteria"],
+                                     cache_key: Optional[str] = None) -> ImpactJSONResponse:
+    return ImpactJSONResponse(await response_cache.run(cache_key, run_compute, compute_component_impact, component,
+                                                       verbose, duration, criteria))
+
+
+def compute_component_impact(component: Component, verbose: bool, duration: Optional[List[float]],
+                             criteria: List[str]) -> Union[dict, List[dict]]:
+    if duration is not None and len(duration) > 1:
+        return compute_impacts_by_duration(
+            model=component, selected_criteria=criteria, durations=duration,
+            verbose=(lambda d, i: verbose_component(component=component, selected_criteria=criteria, duration=d,
+                                                    index=i)) if verbose else None)
+
+    duration = duration[0] if duration else component.usage.hours_life_time.value
 
     impacts = compute_impacts(model=component, duration=duration, selected_criteria=criteria)
 
     if verbose:
         return {
             "impacts": impacts,
-            "verbose": verbose_component(component=component, duration=duration)
+            "verbose": verbose_component(component=component, selected_criteria=criteria, duration=duration)
         }
     return {"impacts": impacts}
 
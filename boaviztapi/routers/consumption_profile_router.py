@@ -3,6 +3,7 @@ from fastapi import APIRouter, Body
 from boaviztapi.dto.consumption_profile import ConsumptionProfileCPU
 from boaviztapi.dto.consumption_profile.consumption_profile import mapper_cp_cpu
 from boaviztapi.routers.openapi_doc.examples import cpu_consumption_profiles
+from boaviztapi.service.execution import run_compute
 
 consumption_profile = APIRouter(
     prefix='/v1/consumption_profile',
@@ -14,6 +15,10 @@ consumption_profile = APIRouter(
                           description="cpu consumption profile generator")
 async def cpu_consumption_profile(cp_dto: ConsumptionProfileCPU = Body(None, example=cpu_consumption_profiles),
                                   verbose: bool = True):
+    return await run_compute(compute_cpu_consumption_profile, cp_dto)
+
+
+def compute_cpu_consumption_profile(cp_dto: ConsumptionProfileCPU):
     cp, cpu = mapper_cp_cpu(cp_dto)
     result = cp.compute_consumption_profile_model(cpu_manufacturer=cpu.manufacturer.value,
                                                   cpu_model_range=cpu.model_range.value,
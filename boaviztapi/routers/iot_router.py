@@ -1,14 +1,18 @@
 import os
 from typing import Optional, List
 
-import pandas as pd
 from fastapi import APIRouter, Body, Query, HTTPException
 
 from boaviztapi import config, data_dir
 from boaviztapi.dto.device.iot import IoT, mapper_iot_device
 from boaviztapi.service.archetype import get_iot_device_archetype
+from boaviztapi.service.execution import run_compute
+from boaviztapi.service.listing import get_listing, listing_response
+from boaviztapi.service.serialization import ImpactJSONResponse
+from boaviztapi.service.response_cache import response_cache, response_key
 from boaviztapi.service.impacts_computation import compute_impacts
 from boaviztapi.service.verbose import verbose_device
+from boaviztapi.utils.data_snapshot import read_csv
 
 iot = APIRouter(
     prefix='/v1/iot',
@@ -17,10 +21,10 @@ iot = APIRouter(
 
 
 @iot.get('/iot_device/archetypes',
-         description="")
+         description="", response_model=List[str])
 async def iot_device_get_all_archetype_name():
-    df = pd.read_csv(os.path.join(data_dir, "archetypes/iot_device.csv"))
-    return df['id'].tolist()
+    path = os.path.join(data_dir, "archetypes/iot_device.csv")
+    return listing_response(get_listing(path, lambda: read_csv(path)['id'].tolist()))
 
 
 @iot.get('/iot_device/archetype_config',
@@ -61,12 +65,20 @@ async def device_iot_impact(iot_dto: IoT,
                             archetype: str,
                             verbose: bool,
                             duration: Optional[float] = config["default_duration"],
-                            criteria: List[str] = Query(config["default_criteria"])) -> dict:
+                            criteria: List[str] = Query(config["default_criteria"])) -> ImpactJSONResponse:
     archetype_config = get_iot_device_archetype(archetype)
 
     if not archetype_config:
         raise HTTPException(status_code=404, detail=f"{archetype} not found")
 
+    cache_key = response_key("iot_device", iot_dto, archetype=archetype, verbose=verbose, duration=duration,
+                             criteria=criteria)
+    return ImpactJSONResponse(await response_cache.run(cache_key, run_compute, compute_iot_device_impact, iot_dto,
+                                                       archetype_config, verbose, duration, criteria))
+
+
+def compute_iot_device_impact(iot_dto: IoT, archetype_config: dict, verbose: bool, duration: Optional[float],
+                              criteria: List[str]) -> dict:
     device = mapper_iot_device(iot_dto, archetype=archetype_config)
 
     if duration is None:
@@ -166,3 +166,16 @@ peripheral_description = "# ✔ Peripheral impacts\n" \
                           "* ⏺️  Given\n\n" \
                           "* 📋 Archetype\n\n" \
                           "⏬ Allocation"
+
+
+batch_description = "# ✔ Batch impacts\n" \
+                    "Retrieve the impacts of a list of heterogeneous items (servers, cloud instances, components, " \
+                    "terminals, peripherals and IoT devices) in a single request.\n\n" \
+                    "### Features\n\n" \
+                    "📋 Items \n\n" \
+                    "Each item has a *type*, an optional *archetype*, *duration* and *criteria*, and a *data* " \
+                    "object with the same content as the body of the corresponding route.\n\n" \
+                    "📊 Aggregate \n\n" \
+                    "The impacts of all the items are summed (value, min and max) by criteria and phase. " \
+                    "Items which cannot be assessed are returned with an error and excluded from the aggregate.\n\n" \
+                    "⏬ Allocation"
@@ -106,4 +106,23 @@ end_user_terminal = {
         "use_time_ratio": 0.3,
         "usage_location": "FRA",
     }
-}
\ No newline at end of file
+}
+batch_example = [
+    {
+        "id": "server-1",
+        "type": "server",
+        "archetype": "platform_compute_medium",
+        "data": {"usage": {"usage_location": "FRA"}}
+    },
+    {
+        "id": "cloud-1",
+        "type": "cloud_instance",
+        "duration": 8760,
+        "data": {"provider": "aws", "instance_type": "a1.4xlarge", "usage": {"time_workload": 50}}
+    },
+    {
+        "id": "laptop-1",
+        "type": "laptop",
+        "criteria": ["gwp"]
+    }
+]
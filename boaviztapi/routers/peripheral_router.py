@@ -40,7 +40,7 @@ async def monitor_get_archetype_config(archetype: str = Query(example=config["de
 @peripheral_router.post('/monitor', description=peripheral_description)
 async def monitor_impact(monitor: Monitor = Body(None, example=end_user_terminal),
                          verbose: bool = True,
-                         duration: Optional[float] = config["default_duration"],
+                         duration: Optional[List[float]] = Query(config["default_duration"]),
                          archetype: str = config["default_monitor"],
                          criteria: List[str] = Query(config["default_criteria"])):
     return await user_terminal_impact(user_terminal_dto=monitor,
@@ -53,7 +53,7 @@ async def monitor_impact(monitor: Monitor = Body(None, example=end_user_terminal
 @peripheral_router.get('/monitor', description=peripheral_description)
 async def monitor_impact(archetype: str = config["default_monitor"],
                          verbose: bool = True,
-                         duration: Optional[float] = config["default_duration"],
+                         duration: Optional[List[float]] = Query(config["default_duration"]),
                          criteria: List[str] = Query(config["default_criteria"])):
     return await user_terminal_impact(user_terminal_dto=Monitor(),
                                       verbose=verbose,
@@ -77,7 +77,7 @@ async def usb_stick_get_archetype_config(archetype: str = Query(example=config["
 @peripheral_router.post('/usb_stick', description=peripheral_description)
 async def usb_stick_impact(usb_stick: UsbStick = Body(None, example=end_user_terminal),
                            verbose: bool = True,
-                           duration: Optional[float] = config["default_duration"],
+                           duration: Optional[List[float]] = Query(config["default_duration"]),
                            archetype: str = config["default_usb_stick"],
                            criteria: List[str] = Query(config["default_criteria"])):
     return await user_terminal_impact(user_terminal_dto=usb_stick,
@@ -90,7 +90,7 @@ async def usb_stick_impact(usb_stick: UsbStick = Body(None, example=end_user_ter
 @peripheral_router.get('/usb_stick', description=peripheral_description)
 async def usb_stick_impact(archetype: str = config["default_usb_stick"],
                            verbose: bool = True,
-                           duration: Optional[float] = config["default_duration"],
+                           duration: Optional[List[float]] = Query(config["default_duration"]),
                            criteria: List[str] = Query(config["default_criteria"])):
     return await user_terminal_impact(user_terminal_dto=UsbStick(),
                                       verbose=verbose,
@@ -114,7 +114,7 @@ async def external_ssd_get_archetype_config(archetype: str = Query(example=confi
 @peripheral_router.post('/external_ssd', description=peripheral_description)
 async def external_ssd_impact(external_ssd: ExternalSSD = Body(None, example=end_user_terminal),
                               verbose: bool = True,
-                              duration: Optional[float] = config["default_duration"],
+                              duration: Optional[List[float]] = Query(config["default_duration"]),
                               archetype: str = config["default_external_ssd"],
                               criteria: List[str] = Query(config["default_criteria"])):
     return await user_terminal_impact(user_terminal_dto=external_ssd,
@@ -127,7 +127,7 @@ async def external_ssd_impact(external_ssd: ExternalSSD = Body(None, example=end
 @peripheral_router.get('/external_ssd', description=peripheral_description)
 async def external_ssd_impact(archetype: str = config["default_external_ssd"],
                               verbose: bool = True,
-                              duration: Optional[float] = config["default_duration"],
+                              duration: Optional[List[float]] = Query(config["default_duration"]),
                               criteria: List[str] = Query(config["default_criteria"])):
     return await user_terminal_impact(user_terminal_dto=ExternalSSD(),
                                       verbose=verbose,
@@ -151,7 +151,7 @@ async def external_hdd_get_archetype_config(archetype: str = Query(example=confi
 @peripheral_router.post('/external_hdd', description=peripheral_description)
 async def external_hdd_impact(external_hdd: ExternalHDD = Body(None, example=end_user_terminal),
                               verbose: bool = True,
-                              duration: Optional[float] = config["default_duration"],
+                              duration: Optional[List[float]] = Query(config["default_duration"]),
                               archetype: str = config["default_external_hdd"],
                               criteria: List[str] = Query(config["default_criteria"])):
     return await user_terminal_impact(user_terminal_dto=external_hdd,
@@ -164,7 +164,7 @@ async def external_hdd_impact(external_hdd: ExternalHDD = Body(None, example=end
 @peripheral_router.get('/external_hdd', description=peripheral_description)
 async def external_hdd_impact(archetype: str = config["default_external_hdd"],
                               verbose: bool = True,
-                              duration: Optional[float] = config["default_duration"],
+                              duration: Optional[List[float]] = Query(config["default_duration"]),
                               criteria: List[str] = Query(config["default_criteria"])):
     return await user_terminal_impact(user_terminal_dto=ExternalHDD(),
                                       verbose=verbose,
@@ -13,7 +13,13 @@ from boaviztapi.routers.openapi_doc.descriptions import server_impact_by_model_d
 from boaviztapi.routers.openapi_doc.examples import server_configuration_examples
 from boaviztapi.service.archetype import get_server_archetype, get_device_archetype_lst
 from boaviztapi.service.verbose import verbose_device
-from boaviztapi.service.impacts_computation import compute_impacts
+from boaviztapi.service.impacts_computation import compute_impacts, compute_impacts_by_duration, \
+    compute_impacts_by_location
+from boaviztapi.service.execution import run_compute
+from boaviztapi.service.factor_provider import get_available_countries
+from boaviztapi.service.serialization import ImpactJSONResponse
+from boaviztapi.service.response_cache import response_cache, response_key
+from boaviztapi.service.uncertainty import compute_impact_distributions
 
 server_router = APIRouter(
     prefix='/v1/server',
@@ -40,8 +46,10 @@ async def get_archetype_config(archetype: str = Query(example=config["default_se
                    description=server_impact_by_model_description)
 async def server_impact_from_model(archetype: str = config["default_server"],
                                    verbose: bool = True,
-                                   duration: Optional[float] = config["default_duration"],
-                                   criteria: List[str] = Query(config["default_criteria"])):
+                                   duration: Optional[List[float]] = Query(config["default_duration"]),
+                                   criteria: List[str] = Query(config["default_criteria"]),
+                                   usage_locations: Optional[List[str]] = Query(None),
+                                   samples: Optional[int] = Query(None, gt=0, le=config["uncertainty_max_samples"])):
     archetype_config = get_server_archetype(archetype)
 
     if not archetype_config:
@@ -53,7 +61,11 @@ async def server_impact_from_model(archetype: str = config["default_server"],
         device=model_server,
         verbose=verbose,
         duration=duration,
-        criteria=criteria
+        criteria=criteria,
+        usage_locations=usage_locations,
+        samples=samples,
+        cache_key=response_key("server", None, archetype=archetype, verbose=verbose, duration=duration,
+                               criteria=criteria, usage_locations=usage_locations, samples=samples)
     )
 
 
@@ -62,9 +74,11 @@ async def server_impact_from_model(archetype: str = config["default_server"],
 async def server_impact_from_configuration(
         server: Server = Body(None, example=server_configuration_examples["DellR740"]),
         verbose: bool = True,
-        duration: Optional[float] = config["default_duration"],
+        duration: Optional[List[float]] = Query(config["default_duration"]),
         archetype: str = config["default_server"],
-        criteria: List[str] = Query(config["default_criteria"])):
+        criteria: List[str] = Query(config["default_criteria"]),
+        usage_locations: Optional[List[str]] = Query(None),
+        samples: Optional[int] = Query(None, gt=0, le=config["uncertainty_max_samples"])):
     archetype_config = get_server_archetype(archetype)
 
     if not archetype_config:
@@ -76,22 +90,58 @@ async def server_impact_from_configuration(
         device=completed_server,
         verbose=verbose,
         duration=duration,
-        criteria=criteria
+        criteria=criteria,
+        usage_locations=usage_locations,
+        samples=samples,
+        cache_key=response_key("server", server, archetype=archetype, verbose=verbose, duration=duration,
+                               criteria=criteria, usage_locations=usage_locations, samples=samples)
     )
 
 
 async def server_impact(device: Device,
                         verbose: bool,
-                        duration: Optional[float] = config["default_duration"],
-                        criteria: List[str] = Query(config["default_criteria"])) -> dict:
-    if duration is None:
-        duration = device.usage.hours_life_time.value
-
-    impacts = compute_impacts(model=device, selected_criteria=criteria, duration=duration)
+                        duration: Optional[List[float]] = Query(config["default_duration"]),
+                        criteria: List[str] = Query(config["default_criteria"]),
+                        usage_locations: Optional[List[str]] = None,
+                        samples: Optional[int] = None,
+                        cache_key: Optional[str] = None) -> ImpactJSONResponse:
+    if usage_locations and duration is not None and len(duration) > 1:
+        raise HTTPException(status_code=400, detail="usage_locations cannot be combined with several durations")
+    if samples and (usage_locations or duration is not None and len(duration) > 1):
+        raise HTTPException(status_code=400,
+                            detail="samples cannot be combined with several durations or usage_locations")
+    if usage_locations and verbose:
+        raise HTTPException(status_code=400, detail="usage_locations cannot be combined with verbose, "
+                                                    "set verbose=false")
+    if usage_locations:
+        unknown = [location for location in usage_locations
+                   if location != "all" and location not in get_available_countries(reverse=True)]
+        if unknown:
+            raise HTTPException(status_code=400, detail=f"Unknown usage locations: {', '.join(unknown)}")
+    return ImpactJSONResponse(await response_cache.run(cache_key, run_compute, compute_server_impact, device, verbose,
+                                                       duration, criteria, usage_locations, samples))
+
+
+def compute_server_impact(device: Device, verbose: bool, duration: Optional[List[float]],
+                          criteria: List[str], usage_locations: Optional[List[str]] = None,
+                          samples: Optional[int] = None) -> Union[dict, List[dict]]:
+    if usage_locations:
+        duration = duration[0] if duration else device.usage.hours_life_time.value
+        return compute_impacts_by_location(model=device, selected_criteria=criteria, duration=duration,
+                                           usage_locations=usage_locations)
+
+    if duration is not None and len(duration) > 1:
+        return compute_impacts_by_duration(
+            model=device, selected_criteria=criteria, durations=duration,
+            verbose=(lambda d, i: verbose_device(device, selected_criteria=criteria, duration=d, index=i))
+            if verbose else None)
+
+    duration = duration[0] if duration else device.usage.hours_life_time.value
+
+    result = {"impacts": compute_impacts(model=device, selected_criteria=criteria, duration=duration)}
 
     if verbose:
-        return {
-            "impacts": impacts,
-            "verbose": verbose_device(device, selected_criteria=criteria, duration=duration)
-        }
-    return {"impacts": impacts}
+        result["verbose"] = verbose_device(device, selected_criteria=criteria, duration=duration)
+    if samples:
+        result["uncertainty"] = compute_impact_distributions(device, criteria, duration, samples)
+    return result
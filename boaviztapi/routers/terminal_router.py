@@ -10,7 +10,10 @@ from boaviztapi.routers.openapi_doc.descriptions import all_archetype_user_termi
     get_archetype_config_desc, terminal_description
 from boaviztapi.routers.openapi_doc.examples import end_user_terminal
 from boaviztapi.service.archetype import get_user_terminal_archetype, get_device_archetype_lst_with_type
-from boaviztapi.service.impacts_computation import compute_impacts
+from boaviztapi.service.execution import run_compute
+from boaviztapi.service.serialization import ImpactJSONResponse
+from boaviztapi.service.response_cache import response_cache, response_key
+from boaviztapi.service.impacts_computation import compute_impacts, compute_impacts_by_duration
 from boaviztapi.service.verbose import verbose_device
 
 terminal_router = APIRouter(
@@ -47,7 +50,7 @@ async def laptop_get_archetype_config(archetype: str = Query(example=config["def
 @terminal_router.post('/laptop', description=terminal_description)
 async def laptop_impact(laptop: Laptop = Body(None, example=end_user_terminal),
                         verbose: bool = True,
-                        duration: Optional[float] = config["default_duration"],
+                        duration: Optional[List[float]] = Query(config["default_duration"]),
                         archetype: str = config["default_laptop"],
                         criteria: List[str] = Query(config["default_criteria"])):
     return await user_terminal_impact(user_terminal_dto=laptop,
@@ -60,7 +63,7 @@ async def laptop_impact(laptop: Laptop = Body(None, example=end_user_terminal),
 @terminal_router.get('/laptop', description=terminal_description)
 async def laptop_impact(archetype: str = config["default_laptop"],
                         verbose: bool = True,
-                        duration: Optional[float] = config["default_duration"],
+                        duration: Optional[List[float]] = Query(config["default_duration"]),
                         criteria: List[str] = Query(config["default_criteria"])):
     return await user_terminal_impact(user_terminal_dto=Laptop(),
                                       verbose=verbose,
@@ -84,7 +87,7 @@ async def desktop_get_archetype_config(archetype: str = Query(example=config["de
 @terminal_router.post('/desktop', description=terminal_description)
 async def desktop_impact(desktop: Desktop = Body(None, example=end_user_terminal),
                          verbose: bool = True,
-                         duration: Optional[float] = config["default_duration"],
+                         duration: Optional[List[float]] = Query(config["default_duration"]),
                          archetype: str = config["default_desktop"],
                          criteria: List[str] = Query(config["default_criteria"])):
     return await user_terminal_impact(user_terminal_dto=desktop,
@@ -97,7 +100,7 @@ async def desktop_impact(desktop: Desktop = Body(None, example=end_user_terminal
 @terminal_router.get('/desktop', description=terminal_description)
 async def desktop_impact(archetype: str = config["default_desktop"],
                          verbose: bool = True,
-                         duration: Optional[float] = config["default_duration"],
+                         duration: Optional[List[float]] = Query(config["default_duration"]),
                          criteria: List[str] = Query(config["default_criteria"])):
     return await user_terminal_impact(user_terminal_dto=Desktop(),
                                       verbose=verbose,
@@ -121,7 +124,7 @@ async def smartphone_get_archetype_config(archetype: str = Query(example=config[
 @terminal_router.post('/smartphone', description=terminal_description)
 async def smartphone_impact(smartphone: Smartphone = Body(None, example=end_user_terminal),
                             verbose: bool = True,
-                            duration: Optional[float] = config["default_duration"],
+                            duration: Optional[List[float]] = Query(config["default_duration"]),
                             archetype: str = config["default_smartphone"],
                             criteria: List[str] = Query(config["default_criteria"])):
     return await user_terminal_impact(user_terminal_dto=smartphone,
@@ -134,7 +137,7 @@ async def smartphone_impact(smartphone: Smartphone = Body(None, example=end_user
 @terminal_router.get('/smartphone', description=terminal_description)
 async def smartphone_impact(archetype: str = config["default_smartphone"],
                             verbose: bool = True,
-                            duration: Optional[float] = config["default_duration"],
+                            duration: Optional[List[float]] = Query(config["default_duration"]),
                             criteria: List[str] = Query(config["default_criteria"])):
     return await user_terminal_impact(user_terminal_dto=Smartphone(),
                                       verbose=verbose,
@@ -158,7 +161,7 @@ async def tablet_get_archetype_config(archetype: str = Query(example=config["def
 @terminal_router.post('/tablet', description=terminal_description)
 async def tablet_impact(tablet: Tablet = Body(None, example=end_user_terminal),
                         verbose: bool = True,
-                        duration: Optional[float] = config["default_duration"],
+                        duration: Optional[List[float]] = Query(config["default_duration"]),
                         archetype: str = config["default_tablet"],
                         criteria: List[str] = Query(config["default_criteria"])):
     return await user_terminal_impact(user_terminal_dto=tablet,
@@ -171,7 +174,7 @@ async def tablet_impact(tablet: Tablet = Body(None, example=end_user_terminal),
 @terminal_router.get('/tablet', description=terminal_description)
 async def tablet_impact(archetype: str = config["default_tablet"],
                         verbose: bool = True,
-                        duration: Optional[float] = config["default_duration"],
+                        duration: Optional[List[float]] = Query(config["default_duration"]),
                         criteria: List[str] = Query(config["default_criteria"])):
     return await user_terminal_impact(user_terminal_dto=Tablet(),
                                       verbose=verbose,
@@ -195,7 +198,7 @@ async def television_get_archetype_config(archetype: str = Query(example=config[
 @terminal_router.post('/television', description=terminal_description)
 async def television_impact(television: Television = Body(None, example=end_user_terminal),
                             verbose: bool = True,
-                            duration: Optional[float] = config["default_duration"],
+                            duration: Optional[List[float]] = Query(config["default_duration"]),
                             archetype: str = config["default_television"],
                             criteria: List[str] = Query(config["default_criteria"])):
     return await user_terminal_impact(user_terminal_dto=television,
@@ -208,7 +211,7 @@ async def television_impact(television: Television = Body(None, example=end_user
 @terminal_router.get('/television', description=terminal_description)
 async def television_impact(archetype: str = config["default_television"],
                             verbose: bool = True,
-                            duration: Optional[float] = config["default_duration"],
+                            duration: Optional[List[float]] = Query(config["default_duration"]),
                             criteria: List[str] = Query(config["default_criteria"])):
     return await user_terminal_impact(user_terminal_dto=Television(),
                                       verbose=verbose,
@@ -232,7 +235,7 @@ async def box_get_archetype_config(archetype: str = Query(example=config["defaul
 @terminal_router.post('/box', description=terminal_description)
 async def box_impact(box: Box = Body(None, example=end_user_terminal),
                      verbose: bool = True,
-                     duration: Optional[float] = config["default_duration"],
+                     duration: Optional[List[float]] = Query(config["default_duration"]),
                      archetype: str = config["default_box"],
                      criteria: List[str] = Query(config["default_criteria"])):
     return await user_terminal_impact(user_terminal_dto=box,
@@ -245,7 +248,7 @@ async def box_impact(box: Box = Body(None, example=end_user_terminal),
 @terminal_router.get('/box', description=terminal_description)
 async def box_impact(archetype: str = config["default_box"],
                      verbose: bool = True,
-                     duration: Optional[float] = config["default_duration"],
+                     duration: Optional[List[float]] = Query(config["default_duration"]),
                      criteria: List[str] = Query(config["default_criteria"])):
     return await user_terminal_impact(user_terminal_dto=Box(),
                                       verbose=verbose,
@@ -257,17 +260,31 @@ async def box_impact(archetype: str = config["default_box"],
 async def user_terminal_impact(user_terminal_dto: UserTerminal,
                                archetype: str,
                                verbose: bool,
-                               duration: Optional[float] = config["default_duration"],
-                               criteria: List[str] = Query(config["default_criteria"])) -> dict:
+                               duration: Optional[List[float]] = Query(config["default_duration"]),
+                               criteria: List[str] = Query(config["default_criteria"])) -> ImpactJSONResponse:
     archetype_config = get_user_terminal_archetype(archetype)
 
     if not archetype_config:
         raise HTTPException(status_code=404, detail=f"{archetype} not found")
 
+    cache_key = response_key(type(user_terminal_dto).__name__, user_terminal_dto, archetype=archetype,
+                             verbose=verbose, duration=duration, criteria=criteria)
+    return ImpactJSONResponse(await response_cache.run(cache_key, run_compute, compute_user_terminal_impact,
+                                                       user_terminal_dto, archetype_config, verbose, duration,
+                                                       criteria))
+
+
+def compute_user_terminal_impact(user_terminal_dto: UserTerminal, archetype_config: dict, verbose: bool,
+                                 duration: Optional[List[float]], criteria: List[str]) -> Union[dict, List[dict]]:
     device = mapper_user_terminal(user_terminal_dto, archetype=archetype_config)
 
-    if duration is None:
-        duration = device.usage.hours_life_time.value
+    if duration is not None and len(duration) > 1:
+        return compute_impacts_by_duration(
+            model=device, selected_criteria=criteria, durations=duration,
+            verbose=(lambda d, i: verbose_device(device, selected_criteria=criteria, duration=d, index=i))
+            if verbose else None)
+
+    duration = duration[0] if duration else device.usage.hours_life_time.value
 
     impacts = compute_impacts(model=device, selected_criteria=criteria, duration=duration)
 
@@ -1,9 +1,9 @@
 import os
-import os
+from typing import List, Optional
 
-import pandas as pd
 from fastapi import APIRouter, Query
 
+from boaviztapi import data_dir
 from boaviztapi.dto.component.cpu import CPU
 from boaviztapi.model import impact
 from boaviztapi.model.component import ComponentCase
@@ -11,16 +11,22 @@ from boaviztapi.model.component.cpu import attributes_from_cpu_name
 from boaviztapi.routers.openapi_doc.descriptions import country_code, cpu_family, cpu_model_range, ssd_manufacturer, \
     ram_manufacturer, case_type, name_to_cpu, cpu_names, impacts_criteria
 from boaviztapi.service.factor_provider import get_available_countries
+from boaviztapi.service.listing import get_listing, listing_response
+from boaviztapi.utils.data_snapshot import read_csv
 
 utils_router = APIRouter(
     prefix='/v1/utils',
     tags=['utils']
 )
 
-data_dir = os.path.join(os.path.dirname(__file__), '../data')
-_cpu_specs = pd.read_csv(os.path.join(data_dir, 'crowdsourcing/cpu_specs.csv'))
-_ssd_manuf = pd.read_csv(os.path.join(data_dir, 'crowdsourcing/ssd_manufacture.csv'))
-_ram_manuf = pd.read_csv(os.path.join(data_dir, 'crowdsourcing/ram_manufacture.csv'))
+
+def _unique_values(relative_path: str, column: str) -> List[str]:
+    table = read_csv(os.path.join(data_dir, relative_path))
+    return [*table[table[column].notna()][column].unique()]
+
+
+def _listing(relative_path: str, column: str):
+    return get_listing(f"{relative_path}:{column}", lambda: _unique_values(relative_path, column))
 
 
 @utils_router.get('/country_code', description=country_code)
@@ -28,30 +34,24 @@ async def utils_get_all_countries():
     return get_available_countries()
 
 
-@utils_router.get('/cpu_family', description=cpu_family)
+@utils_router.get('/cpu_family', description=cpu_family, response_model=List[str])
 async def utils_get_all_cpu_family():
-    df = _cpu_specs[_cpu_specs["code_name"].notna()]
-    return [*df["code_name"].unique()]
+    return listing_response(_listing('crowdsourcing/cpu_specs.csv', 'code_name'))
 
 
-@utils_router.get('/cpu_model_range', description=cpu_model_range)
+@utils_router.get('/cpu_model_range', description=cpu_model_range, response_model=List[str])
 async def utils_get_all_cpu_model_range():
-    df = _cpu_specs[_cpu_specs["model_range"].notna()]
-    return [*df["model_range"].unique()]
+    return listing_response(_listing('crowdsourcing/cpu_specs.csv', 'model_range'))
 
 
-@utils_router.get('/ssd_manufacturer', description=ssd_manufacturer)
+@utils_router.get('/ssd_manufacturer', description=ssd_manufacturer, response_model=List[str])
 async def utils_get_all_ssd_manufacturer():
-    df = _ssd_manuf[_ssd_manuf["manufacturer"].notna()]
-
-    return [*df["manufacturer"].unique()]
+    return listing_response(_listing('crowdsourcing/ssd_manufacture.csv', 'manufacturer'))
 
 
-@utils_router.get('/ram_manufacturer', description=ram_manufacturer)
+@utils_router.get('/ram_manufacturer', description=ram_manufacturer, response_model=List[str])
 async def utils_get_all_ram_manufacturer():
-    df = _ram_manuf[_ram_manuf["manufacturer"].notna()]
-
-    return [*df["manufacturer"].unique()]
+    return listing_response(_listing('crowdsourcing/ram_manufacture.csv', 'manufacturer'))
 
 
 @utils_router.get('/case_type', description=case_type)
@@ -69,10 +69,11 @@ async def name_to_cpu(cpu_name: str = Query(example="Intel Core i7-9700K")):
     else:
         return f"CPU name {cpu_name} is not found in our database"
 
-@utils_router.get('/cpu_name', description=cpu_names)
-async def utils_get_all_cpu_name():
-    df = _cpu_specs[_cpu_specs["name"].notna()]
-    return [*df["name"].unique()]
+@utils_router.get('/cpu_name', description=cpu_names, response_model=List[str])
+async def utils_get_all_cpu_name(prefix: Optional[str] = Query(None, example="Intel Xeon"),
+                                 offset: int = Query(0, ge=0),
+                                 limit: Optional[int] = Query(None, gt=0)):
+    return listing_response(_listing('crowdsourcing/cpu_specs.csv', 'name'), prefix, offset, limit)
 
 
 @utils_router.get('/impact_criteria', description=impacts_criteria)
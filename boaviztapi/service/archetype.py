@@ -1,22 +1,124 @@
 import ast
 import csv
 import os
-from typing import Union
-
-import pandas as pd
+import threading
+from typing import Callable, Union, Dict, List
 
 from boaviztapi import data_dir
+from boaviztapi.utils.data_snapshot import snapshot_archetype_index
+from boaviztapi.utils.data_version import on_data_change
+
+
+class FrozenDict(dict):
+    """
+    Read-only dict. Parsed archetypes are frozen so that a single instance can be shared
+    by every request and every thread.
+    """
+
+    def _read_only(self, *args, **kwargs):
+        raise TypeError(f"{type(self).__name__} is read-only")
+
+    __setitem__ = __delitem__ = __ior__ = _read_only
+    clear = pop = popitem = setdefault = update = _read_only
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+    def __reduce__(self):
+        return FrozenDict, (dict(self),)
+
+
+def freeze(value):
+    if isinstance(value, dict):
+        return FrozenDict({key: freeze(val) for key, val in value.items()})
+    if isinstance(value, (list, tuple)):
+        return tuple(freeze(val) for val in value)
+    return value
+
+
+class ArchetypeRegistry:
+    """
+    Loads each archetype file once and keeps its parsed archetypes indexed by id.
+    Indexes are keyed by csv path, i.e. by (kind, provider).
+    """
+
+    def __init__(self):
+        self._indexes = {}
+        self._lock = threading.Lock()
+        # incremented by clear, so that the archetypes resolved from an older load are looked up again
+        self.generation = 0
+
+    def index(self, csv_path: str) -> Dict[str, dict]:
+        index = self._indexes.get(csv_path)
+        if index is None:
+            with self._lock:
+                index = self._indexes.get(csv_path)
+                if index is None:
+                    index = snapshot_archetype_index(csv_path)
+                    if index is None:
+                        index = load_archetype_index(csv_path)
+                    self._indexes[csv_path] = index
+        return index
+
+    def get(self, archetype_name: str, csv_path: str) -> Union[dict, bool]:
+        return self.index(csv_path).get(archetype_name, False)
+
+    def ids(self, csv_path: str) -> List[str]:
+        return list(self.index(csv_path))
+
+    def clear(self):
+        with self._lock:
+            self._indexes = {}
+            self.generation += 1
+
+
+def load_archetype_index(csv_path: str) -> Dict[str, dict]:
+    index = {}
+    with open(csv_path, encoding='utf-8') as f:
+        for row in csv.DictReader(f):
+            # first row wins, as with the former linear scan
+            if row["id"] not in index:
+                index[row["id"]] = freeze(row2json(row))
+    return index
+
+
+archetype_registry = ArchetypeRegistry()
+on_data_change(archetype_registry.clear)
+
+
+class LazyArchetype:
+    """
+    Default value of an archetype argument. The lookup runs on first use instead of at import, and its result is kept.
+    """
+
+    def __init__(self, lookup: Callable[[], Union[dict, bool]]):
+        self._lookup = lookup
+        self._archetype = None
+        self._generation = None
+
+    def resolve(self) -> Union[dict, bool]:
+        if self._generation != archetype_registry.generation:
+            self._archetype = self._lookup()
+            self._generation = archetype_registry.generation
+        return self._archetype
+
+
+def resolve_archetype(archetype):
+    if isinstance(archetype, LazyArchetype):
+        return archetype.resolve()
+    return archetype
 
 
 def get_device_archetype_lst(path):
-    df = pd.read_csv(path)
-    return df['id'].tolist()
+    return archetype_registry.ids(path)
 
 
 def get_device_archetype_lst_with_type(path, name: str, ) -> Union[dict, bool]:
-    df = pd.read_csv(path)
-    df = df[df['device_type'] == name]
-    return df['id'].tolist()
+    return [archetype_id for archetype_id, archetype in archetype_registry.index(path).items()
+            if get_arch_value(archetype, 'device_type', 'default') == name]
 
 
 def get_component_archetype(archetype_name: str, component_type: str) -> Union[dict, bool]:
@@ -50,11 +152,7 @@ def get_cloud_instance_archetype(archetype_name: str, provider: str) -> Union[di
 
 
 def get_archetype(archetype_name: str, csv_path: str) -> Union[dict, bool]:
-    reader = csv.DictReader(open(csv_path, encoding='utf-8'))
-    for row in reader:
-        if row["id"] == archetype_name:
-            return row2json(row)
-    return False
+    return archetype_registry.get(archetype_name, csv_path)
 
 
 def parse_to_boattribute_json(value):
@@ -119,11 +217,13 @@ def get_arch_value(archetype: dict, attribute: str, key: str, default=None):
 def get_arch_component(archetype: dict, component_name: str, default=None):
     if not archetype:
         return default
-    if archetype.get(component_name) is not None:
-        if component_name != "USAGE" and archetype.get("USAGE") is not None:
-            archetype[component_name]["USAGE"] = archetype.get("USAGE")
-        return archetype.get(component_name)
-    return default
+    component = archetype.get(component_name)
+    if component is None:
+        return default
+    if component_name != "USAGE" and archetype.get("USAGE") is not None:
+        # Derived view: the (shared) archetype itself is left untouched
+        return FrozenDict({**component, "USAGE": archetype.get("USAGE")})
+    return component
 
 
 def get_iot_device_archetype(archetype_name: str) -> Union[dict, bool]:
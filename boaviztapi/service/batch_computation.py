@@ -0,0 +1,275 @@
+import asyncio
+import hashlib
+import json
+import logging
+from typing import List, Union, Optional, Tuple
+
+from boaviztapi import config
+from boaviztapi.dto import BaseDTO
+from boaviztapi.dto.batch import BatchItem
+from boaviztapi.dto.component import CPU, RAM, Disk, Motherboard, PowerSupply, Case
+from boaviztapi.dto.component.cpu import mapper_cpu
+from boaviztapi.dto.component.disk import mapper_ssd, mapper_hdd
+from boaviztapi.dto.component.other import mapper_motherboard, mapper_power_supply, mapper_case
+from boaviztapi.dto.component.ram import mapper_ram
+from boaviztapi.dto.device import Server, Cloud
+from boaviztapi.dto.device.device import mapper_server, mapper_cloud_instance
+from boaviztapi.dto.device.iot import IoT, mapper_iot_device
+from boaviztapi.dto.device.user_terminal import mapper_user_terminal, Laptop, Desktop, Smartphone, Tablet, \
+    Television, Box, Monitor, UsbStick, ExternalSSD, ExternalHDD
+from boaviztapi.model.component import Component
+from boaviztapi.model.device import Device
+from boaviztapi.model.impact import IMPACT_CRITERIAS, IMPACT_PHASES, NOT_IMPLEMENTED, Impact, Assessable
+from boaviztapi.model.services.cloud_instance import Service, ServiceCloudInstance
+from boaviztapi.service.archetype import get_server_archetype, get_cloud_instance_archetype, \
+    get_component_archetype, get_user_terminal_archetype, get_iot_device_archetype
+from boaviztapi.service.execution import run_compute
+from boaviztapi.service.impacts_computation import compute_impacts
+
+_logger = logging.getLogger(__name__)
+
+WARNING_PARTIAL_AGGREGATE = "Some items do not implement this impact, they are not included in the sum."
+
+
+class BatchItemError(Exception):
+    pass
+
+
+def _archetype_or_error(archetype_config, archetype_name):
+    if not archetype_config:
+        raise BatchItemError(f"{archetype_name} not found")
+    return archetype_config
+
+
+def _map_server(item: BatchItem, server: Server) -> Device:
+    archetype = item.archetype or config["default_server"]
+    archetype_config = _archetype_or_error(get_server_archetype(archetype), archetype)
+    return mapper_server(server, archetype=archetype_config)
+
+
+def _map_cloud_instance(item: BatchItem, cloud: Cloud) -> Service:
+    provider = cloud.provider or config["default_cloud_provider"]
+    instance_type = cloud.instance_type or config["default_cloud_instance"]
+    archetype_config = get_cloud_instance_archetype(instance_type, provider)
+    if not archetype_config:
+        raise BatchItemError(f"{instance_type} at {provider} not found")
+    return mapper_cloud_instance(cloud, archetype=archetype_config)
+
+
+def _component_mapper(component_type: str, mapper):
+    def map_component(item: BatchItem, component_dto) -> Component:
+        archetype = item.archetype or config[f"default_{component_type}"]
+        archetype_config = _archetype_or_error(get_component_archetype(archetype, component_type), archetype)
+        return mapper(component_dto, archetype_config)
+
+    return map_component
+
+
+def _map_motherboard(item: BatchItem, motherboard: Motherboard) -> Component:
+    return mapper_motherboard(motherboard)
+
+
+def _user_terminal_mapper(user_terminal_type: str):
+    def map_user_terminal(item: BatchItem, user_terminal_dto) -> Device:
+        archetype = item.archetype or config[f"default_{user_terminal_type}"]
+        archetype_config = _archetype_or_error(get_user_terminal_archetype(archetype), archetype)
+        return mapper_user_terminal(user_terminal_dto, archetype=archetype_config)
+
+    return map_user_terminal
+
+
+def _map_iot_device(item: BatchItem, iot: IoT) -> Device:
+    archetype = item.archetype or config["default_iot_device"]
+    archetype_config = _archetype_or_error(get_iot_device_archetype(archetype), archetype)
+    return mapper_iot_device(iot, archetype=archetype_config)
+
+
+# item type -> (DTO of the data, mapper)
+batch_item_types = {
+    "server": (Server, _map_server),
+    "cloud_instance": (Cloud, _map_cloud_instance),
+    "cpu": (CPU, _component_mapper("cpu", mapper_cpu)),
+    "ram": (RAM, _component_mapper("ram", mapper_ram)),
+    "ssd": (Disk, _component_mapper("ssd", mapper_ssd)),
+    "hdd": (Disk, _component_mapper("hdd", mapper_hdd)),
+    "motherboard": (Motherboard, _map_motherboard),
+    "power_supply": (PowerSupply, _component_mapper("power_supply", mapper_power_supply)),
+    "case": (Case, _component_mapper("case", mapper_case)),
+    "laptop": (Laptop, _user_terminal_mapper("laptop")),
+    "desktop": (Desktop, _user_terminal_mapper("desktop")),
+    "smartphone": (Smartphone, _user_terminal_mapper("smartphone")),
+    "tablet": (Tablet, _user_terminal_mapper("tablet")),
+    "television": (Television, _user_terminal_mapper("television")),
+    "box": (Box, _user_terminal_mapper("box")),
+    "monitor": (Monitor, _user_terminal_mapper("monitor")),
+    "usb_stick": (UsbStick, _user_terminal_mapper("usb_stick")),
+    "external_ssd": (ExternalSSD, _user_terminal_mapper("external_ssd")),
+    "external_hdd": (ExternalHDD, _user_terminal_mapper("external_hdd")),
+    "iot_device": (IoT, _map_iot_device),
+}
+
+
+def parse_batch_item(item: BatchItem) -> BaseDTO:
+    if item.type not in batch_item_types:
+        raise BatchItemError(f"Unknown item type {item.type}, available types are {list(batch_item_types)}")
+    for criteria in item.criteria:
+        if criteria not in IMPACT_CRITERIAS:
+            raise BatchItemError(f"Unknown criteria {criteria}")
+    dto_class, _ = batch_item_types[item.type]
+    return dto_class.parse_obj(item.data or {})
+
+
+def batch_item_key(item: BatchItem, dto: BaseDTO) -> str:
+    """
+    Canonical hash of an item, from its normalized DTO. Items with the same key have the same impacts per unit.
+    """
+    normalized = {
+        "type": item.type,
+        "archetype": item.archetype,
+        "duration": item.duration,
+        "criteria": item.criteria,
+        "data": dto.dict(exclude_none=True)
+    }
+    return hashlib.sha256(json.dumps(normalized, sort_keys=True, default=str).encode()).hexdigest()
+
+
+def compute_batch_item(item: BatchItem, dto: Optional[BaseDTO] = None) -> Union[Component, Device, Service]:
+    """
+    Map and assess a single item. Raises BatchItemError when the item cannot be assessed.
+    """
+    if dto is None:
+        dto = parse_batch_item(item)
+    _, mapper = batch_item_types[item.type]
+    model = mapper(item, dto)
+
+    duration = item.duration
+    if duration is None:
+        if isinstance(model, ServiceCloudInstance):
+            duration = model.platform.usage.hours_life_time.value
+        else:
+            duration = model.usage.hours_life_time.value
+
+    compute_impacts(model=model, selected_criteria=item.criteria, duration=duration)
+    return model
+
+
+def compute_distinct_item(item: BatchItem, dto: BaseDTO) -> Tuple[Optional[Assessable], Optional[str]]:
+    """
+    Impacts of an item, without the rest of its model so that they are cheap to send back from a worker process, or
+    the error preventing its assessment.
+    """
+    try:
+        impacts = Assessable()
+        impacts.impacts = compute_batch_item(item, dto).impacts
+        return impacts, None
+    except (BatchItemError, ValueError) as e:
+        return None, str(e)
+    except Exception as e:
+        # An unexpected failure on one item should not fail the whole batch
+        _logger.exception(str(e), exc_info=e)
+        return None, "Internal error while assessing the item"
+
+
+def _scaled_impact(impact: Optional[Impact], units: int) -> Optional[Impact]:
+    if impact is None:
+        return None
+    return Impact(value=impact.value * units, min=impact.min * units, max=impact.max * units,
+                  warnings=list(impact.warnings))
+
+
+def scaled_impacts(model: Assessable, selected_criteria: List[str], units: int) -> dict:
+    """
+    Same output as model.get_impacts, for units identical items.
+    """
+    if units == 1:
+        return model.get_impacts(selected_criteria)
+
+    result = {}
+    for criteria in selected_criteria:
+        result[criteria] = {"unit": IMPACT_CRITERIAS[criteria].unit,
+                            "description": IMPACT_CRITERIAS[criteria].description}
+        for phase in IMPACT_PHASES:
+            impact = _scaled_impact(model.impacts.get(criteria, {}).get(phase), units)
+            result[criteria][phase] = NOT_IMPLEMENTED if impact is None else impact.to_json()
+    return result
+
+
+def aggregate_impacts(assessed: List[Tuple[Assessable, List[str], int]],
+                      selected_criteria: List[str]) -> dict:
+    """
+    Sum the impacts of (model, criteria, units) tuples, each model standing for units identical items.
+    """
+    result = {}
+    for criteria in selected_criteria:
+        result[criteria] = {"unit": IMPACT_CRITERIAS[criteria].unit,
+                            "description": IMPACT_CRITERIAS[criteria].description}
+        with_criteria = [(model, units) for model, item_criteria, units in assessed if criteria in item_criteria]
+        for phase in IMPACT_PHASES:
+            impacts = [(model.impacts.get(criteria, {}).get(phase), units) for model, units in with_criteria]
+            implemented = [_scaled_impact(impact, units) for impact, units in impacts if impact is not None]
+            if not implemented:
+                result[criteria][phase] = NOT_IMPLEMENTED
+                continue
+
+            total = Impact(value=sum(impact.value for impact in implemented),
+                           min=sum(impact.min for impact in implemented),
+                           max=sum(impact.max for impact in implemented))
+            for impact in implemented:
+                for warning in impact.warnings:
+                    total.add_warning(warning)
+            if len(implemented) < len(impacts):
+                total.add_warning(WARNING_PARTIAL_AGGREGATE)
+            result[criteria][phase] = total.to_json()
+    return result
+
+
+async def compute_batch(items: List[BatchItem], max_workers: int = config["batch_max_workers"]) -> dict:
+    """
+    Assess a list of items. Identical items (same canonical key) are computed once, their impacts are
+    multiplied by their units. Distinct items are run with the compute executor, max_workers at a time.
+    """
+    keys = []
+    distinct = {}
+    errors = {}
+    for index, item in enumerate(items):
+        try:
+            dto = parse_batch_item(item)
+        except (BatchItemError, ValueError) as e:
+            keys.append(None)
+            errors[index] = str(e)
+            continue
+        key = batch_item_key(item, dto)
+        keys.append(key)
+        if key not in distinct:
+            distinct[key] = (item, dto)
+
+    slots = asyncio.Semaphore(max_workers)
+
+    async def compute(item: BatchItem, dto: BaseDTO):
+        async with slots:
+            return await run_compute(compute_distinct_item, item, dto)
+
+    computed = dict(zip(distinct, await asyncio.gather(*(compute(item, dto) for item, dto in distinct.values()))))
+
+    item_results = []
+    impacts_by_key = {}
+    units_by_key = {}
+    selected_criteria = []
+    for index, (item, key) in enumerate(zip(items, keys)):
+        model, error = computed[key] if key is not None else (None, errors[index])
+        if model is None:
+            item_results.append({"id": item.id, "type": item.type, "error": error})
+            continue
+        if (key, item.units) not in impacts_by_key:
+            impacts_by_key[(key, item.units)] = scaled_impacts(model, item.criteria, item.units)
+        item_results.append({"id": item.id, "type": item.type, "impacts": impacts_by_key[(key, item.units)]})
+        units_by_key[key] = units_by_key.get(key, 0) + item.units
+        for criteria in item.criteria:
+            if criteria not in selected_criteria:
+                selected_criteria.append(criteria)
+
+    assessed = [(computed[key][0], distinct[key][0].criteria, units) for key, units in units_by_key.items()]
+    return {
+        "items": item_results,
+        "aggregate": aggregate_impacts(assessed, selected_criteria)
+    }
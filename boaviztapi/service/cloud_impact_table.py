@@ -0,0 +1,197 @@
+import json
+import logging
+import os
+import sys
+import threading
+from typing import Dict, List, Optional, Tuple
+
+from boaviztapi import config, data_dir
+from boaviztapi.dto.device import Cloud
+from boaviztapi.dto.device.device import mapper_cloud_instance
+from boaviztapi.model.impact import IMPACT_CRITERIAS, IMPACT_PHASES
+from boaviztapi.service.archetype import get_cloud_instance_archetype, get_device_archetype_lst
+from boaviztapi.service.impacts_computation import compute_impacts, compute_single_impact
+from boaviztapi.service.serialization import dumps
+from boaviztapi.service.verbose import verbose_cloud
+from boaviztapi.utils.data_snapshot import read_csv
+from boaviztapi.utils.data_version import current_data_fingerprint, data_fingerprint
+
+_logger = logging.getLogger(__name__)
+
+
+class CloudImpactTable:
+    """
+    Impacts of every cloud instance archetype for the default usage and the default duration (lifetime),
+    rendered as in the API responses, and the verbose response for the default criteria. Criteria which cannot be
+    computed for an instance are left out, such requests are computed by the impact engine.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._impacts: Dict[Tuple[str, str], Dict[str, dict]] = {}
+        self._verbose: Dict[Tuple[str, str], bytes] = {}
+        self.fingerprint = None
+
+    def __len__(self):
+        return len(self._impacts)
+
+    def is_ready(self) -> bool:
+        return self.fingerprint is not None
+
+    def _is_current(self) -> bool:
+        # not built yet, or built from other data
+        return self.fingerprint is not None and self.fingerprint == current_data_fingerprint()
+
+    def get(self, provider: str, instance_type: str, criteria: List[str]) -> Optional[dict]:
+        if not self._is_current():
+            return None
+        instance_impacts = self._impacts.get((provider, instance_type))
+        if instance_impacts is None or any(c not in instance_impacts for c in criteria):
+            return None
+        return {c: instance_impacts[c] for c in criteria}
+
+    def get_verbose(self, provider: str, instance_type: str) -> Optional[bytes]:
+        """
+        JSON body of the verbose response of an instance for the default criteria.
+        """
+        if not self._is_current():
+            return None
+        return self._verbose.get((provider, instance_type))
+
+    def clear(self):
+        with self._lock:
+            self._impacts, self._verbose = {}, {}
+            self.fingerprint = None
+
+    def build(self, instances: Optional[List[Tuple[str, str]]] = None) -> int:
+        fingerprint = data_fingerprint()
+        impacts, verbose = {}, {}
+        for provider, instance_type in instances or all_cloud_instances():
+            instance_impacts = compute_default_instance_impacts(provider, instance_type)
+            if instance_impacts:
+                impacts[(provider, instance_type)] = instance_impacts
+            instance_verbose = compute_default_instance_verbose(provider, instance_type)
+            if instance_verbose is not None:
+                verbose[(provider, instance_type)] = instance_verbose
+        with self._lock:
+            self._impacts, self._verbose, self.fingerprint = impacts, verbose, fingerprint
+        return len(impacts)
+
+    def load(self, path: str) -> bool:
+        with open(path, 'r') as f:
+            content = json.load(f)
+        if content["fingerprint"] != data_fingerprint():
+            return False
+        with self._lock:
+            self._impacts = {(entry["provider"], entry["instance_type"]): entry["impacts"]
+                             for entry in content["instances"]}
+            # kept as rendered JSON, it is the body of the response
+            self._verbose = {(entry["provider"], entry["instance_type"]): entry["verbose"].encode()
+                             for entry in content["instances"] if entry.get("verbose") is not None}
+            self.fingerprint = content["fingerprint"]
+        return True
+
+    def save(self, path: str):
+        instances = sorted(set(self._impacts) | set(self._verbose))
+        content = {
+            "fingerprint": self.fingerprint,
+            "instances": [{"provider": provider, "instance_type": instance_type,
+                           "impacts": self._impacts.get((provider, instance_type), {}),
+                           "verbose": self._verbose[(provider, instance_type)].decode()
+                           if (provider, instance_type) in self._verbose else None}
+                          for provider, instance_type in instances]
+        }
+        tmp_path = path + '.tmp'
+        with open(tmp_path, 'w') as f:
+            json.dump(content, f, separators=(',', ':'))
+        os.replace(tmp_path, path)
+
+
+cloud_impact_table = CloudImpactTable()
+
+
+def all_cloud_instances() -> List[Tuple[str, str]]:
+    instances = []
+    for provider in read_csv(os.path.join(data_dir, 'archetypes/cloud/providers.csv'))['provider.name']:
+        for instance_type in get_device_archetype_lst(os.path.join(data_dir, f'archetypes/cloud/{provider}.csv')):
+            instances.append((provider, instance_type))
+    return instances
+
+
+def compute_default_instance_impacts(provider: str, instance_type: str) -> Dict[str, dict]:
+    """
+    Impacts of an instance for the default usage and lifetime, as returned by GET /v1/cloud/instance.
+    """
+    try:
+        instance_model = mapper_cloud_instance(Cloud(), archetype=get_cloud_instance_archetype(instance_type, provider))
+        duration = instance_model.platform.usage.hours_life_time.value
+    except Exception as e:
+        _logger.debug(f"{instance_type} at {provider} is not precomputed: {e}")
+        return {}
+
+    computed = []
+    for criteria in IMPACT_CRITERIAS:
+        try:
+            for phase in IMPACT_PHASES:
+                compute_single_impact(instance_model, phase, criteria, duration)
+        except Exception as e:
+            _logger.debug(f"{criteria} of {instance_type} at {provider} is not precomputed: {e}")
+            continue
+        computed.append(criteria)
+    return instance_model.get_impacts(computed)
+
+
+def compute_default_instance_verbose(provider: str, instance_type: str) -> Optional[bytes]:
+    """
+    JSON body of GET /v1/cloud/instance for an instance with the default parameters (verbose, default criteria).
+    """
+    criteria = config["default_criteria"]
+    try:
+        instance_model = mapper_cloud_instance(Cloud(), archetype=get_cloud_instance_archetype(instance_type, provider))
+        duration = instance_model.platform.usage.hours_life_time.value
+        result = {"impacts": compute_impacts(model=instance_model, selected_criteria=criteria, duration=duration)}
+        result["verbose"] = verbose_cloud(instance_model, selected_criteria=criteria, duration=duration)
+    except Exception as e:
+        _logger.debug(f"The verbose response of {instance_type} at {provider} is not precomputed: {e}")
+        return None
+    return dumps(result)
+
+
+def cloud_impact_table_path(path: Optional[str] = config["cloud_impact_table_path"]) -> Optional[str]:
+    """
+    Path of the table file, relative paths being relative to the data directory.
+    """
+    return os.path.join(data_dir, path) if path else None
+
+
+def precompute_cloud_impact_table(table_path: Optional[str] = config["cloud_impact_table_path"],
+                                  precompute: bool = config["cloud_impact_table_precompute"]) -> Optional[threading.Thread]:
+    """
+    Load the table from table_path when it matches the current data, otherwise build it in a background thread
+    (GET requests are computed by the impact engine until the table is ready) and save it to table_path.
+    """
+    table_path = cloud_impact_table_path(table_path)
+    if table_path and os.path.exists(table_path) and cloud_impact_table.load(table_path):
+        _logger.info(f"Cloud impact table: {len(cloud_impact_table)} instances loaded from {table_path}")
+        return None
+    if not precompute:
+        return None
+
+    def build():
+        count = cloud_impact_table.build()
+        _logger.info(f"Cloud impact table: {count} instances precomputed")
+        if table_path:
+            cloud_impact_table.save(table_path)
+
+    thread = threading.Thread(target=build, name="cloud-impact-table", daemon=True)
+    thread.start()
+    return thread
+
+
+if __name__ == '__main__':
+    # Build step: python -m boaviztapi.service.cloud_impact_table <path>
+    output_path = sys.argv[1] if len(sys.argv) > 1 else cloud_impact_table_path()
+    if not output_path:
+        sys.exit("usage: python -m boaviztapi.service.cloud_impact_table <path>")
+    print(f"{cloud_impact_table.build()} instances precomputed")
+    cloud_impact_table.save(output_path)
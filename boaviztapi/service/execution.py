@@ -0,0 +1,117 @@
+import asyncio
+import os
+from concurrent.futures import Executor, ThreadPoolExecutor, ProcessPoolExecutor
+from typing import Awaitable, Callable, Dict, Optional
+
+from fastapi import HTTPException
+
+INLINE = "inline"
+THREAD = "thread"
+PROCESS = "process"
+EXECUTION_STRATEGIES = [INLINE, THREAD, PROCESS]
+
+
+def _preload_worker(tdp_fits: list):
+    # Worker processes load the data once, not per request, and take the consumption profile fits of the API process
+    # instead of fitting them again
+    import boaviztapi.service.impacts_computation  # noqa: F401
+    import boaviztapi.service.verbose  # noqa: F401
+    from boaviztapi.model.consumption_profile.consumption_profile import tdp_fit_cache
+    tdp_fit_cache.pin(tdp_fits)
+
+
+class ComputeExecutor:
+    """
+    Runs the CPU bound part of the requests (mapping completion, impacts computation, verbose) either inline on the
+    event loop, in a thread pool or in a process pool. At most workers + queue_depth computations are accepted at
+    once, further requests are rejected with a 503.
+    """
+
+    def __init__(self, strategy: str = INLINE, workers: Optional[int] = None, queue_depth: Optional[int] = None):
+        if strategy not in EXECUTION_STRATEGIES:
+            raise ValueError(f"Unknown execution strategy {strategy}, available strategies are {EXECUTION_STRATEGIES}")
+        self.strategy = strategy
+        self.workers = workers or os.cpu_count() or 1
+        self.queue_depth = queue_depth if queue_depth is not None else 8 * self.workers
+        self.pending = 0
+        self._pool: Optional[Executor] = None
+
+    @classmethod
+    def from_env(cls) -> "ComputeExecutor":
+        workers = os.getenv("BOAVIZTAPI_WORKERS")
+        queue_depth = os.getenv("BOAVIZTAPI_QUEUE_DEPTH")
+        return cls(strategy=os.getenv("BOAVIZTAPI_EXECUTION_STRATEGY", INLINE).lower(),
+                   workers=int(workers) if workers else None,
+                   queue_depth=int(queue_depth) if queue_depth else None)
+
+    def _get_pool(self) -> Executor:
+        if self._pool is None:
+            if self.strategy == THREAD:
+                self._pool = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="compute")
+            else:
+                from boaviztapi.model.consumption_profile.consumption_profile import tdp_fit_cache
+                self._pool = ProcessPoolExecutor(max_workers=self.workers, initializer=_preload_worker,
+                                                 initargs=(tdp_fit_cache.entries(),))
+        return self._pool
+
+    async def run(self, fn: Callable, *args):
+        if self.strategy == INLINE:
+            return fn(*args)
+
+        if self.pending >= self.workers + self.queue_depth:
+            raise HTTPException(status_code=503, detail="Too many computations in progress, retry later",
+                                headers={"Retry-After": "1"})
+        self.pending += 1
+        try:
+            return await asyncio.get_running_loop().run_in_executor(self._get_pool(), fn, *args)
+        finally:
+            self.pending -= 1
+
+    def shutdown(self):
+        if self._pool is not None:
+            self._pool.shutdown(wait=False)
+            self._pool = None
+
+
+class SingleFlight:
+    """
+    Coalesces concurrent computations of the same key: the first request runs the computation, the requests arriving
+    while it is in flight wait for it and share its result, which must not be modified. Computations only overlap
+    with the thread and process strategies.
+    """
+
+    def __init__(self):
+        self.coalesced = 0
+        self._in_flight: Dict[str, asyncio.Future] = {}
+
+    async def run(self, key: str, fn: Callable[..., Awaitable], *args):
+        flight = self._in_flight.get(key)
+        if flight is None:
+            flight = asyncio.ensure_future(fn(*args))
+            self._in_flight[key] = flight
+            flight.add_done_callback(lambda done: self._land(key, done))
+        else:
+            self.coalesced += 1
+        # a cancelled request does not cancel the computation awaited by the others
+        return await asyncio.shield(flight)
+
+    def _land(self, key: str, flight: asyncio.Future):
+        if self._in_flight.get(key) is flight:
+            del self._in_flight[key]
+        if not flight.cancelled():
+            flight.exception()  # retrieved, even if every request was cancelled
+
+    def in_flight(self) -> int:
+        return len(self._in_flight)
+
+
+compute_executor = ComputeExecutor.from_env()
+single_flight = SingleFlight()
+
+
+async def run_compute(fn: Callable, *args):
+    """
+    Run fn(*args) with the configured execution strategy. With the process strategy, fn has to be a module level
+    function and args have to be picklable.
+    """
+    return await compute_executor.run(fn, *args)
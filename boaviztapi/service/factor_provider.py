@@ -1,22 +1,77 @@
 import os
-from pathlib import Path
+from functools import lru_cache
+from typing import Dict, FrozenSet, NamedTuple, Tuple, TYPE_CHECKING
 
-import pandas as pd
-import yaml
 from boaviztapi import data_dir
+from boaviztapi.utils.data_snapshot import load_yaml
+from boaviztapi.utils.data_version import on_data_change
+
+if TYPE_CHECKING:
+    import numpy as np
 
 config_file = os.path.join(data_dir, 'factors.yml')
-impact_factors = yaml.safe_load(Path(config_file).read_text())
 
 
-def get_impact_factor(item, impact_type) -> dict:
-    if impact_factors.get(item):
-        if impact_factors.get(item).get(impact_type):
-            return impact_factors.get(item).get(impact_type)
-    raise NotImplementedError
+@lru_cache(maxsize=None)
+def _impact_factors() -> dict:
+    # factors.yml is parsed by the first computation, not at import
+    return load_yaml(config_file)
+
+
+on_data_change(_impact_factors.cache_clear)
+
+
+def __getattr__(name):
+    if name == "impact_factors":
+        return _impact_factors()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+@lru_cache(maxsize=None)
+def _impact_factor_table() -> Dict[tuple, float]:
+    """
+    Numeric factors of factors.yml (electricity aside) keyed by their path, e.g. ('cpu', 'gwp', 'die_impact') or
+    ('case', 'gwp', 'blade', 'impact_blade_server'). The factor of an IoT functional block, manufacture plus end of
+    life, is resolved once under ('IoT', functional_block, hsl, impact_type).
+    """
+    table = {}
+
+    def flatten(path, value):
+        if isinstance(value, dict):
+            for key, sub_value in value.items():
+                flatten(path + (key,), sub_value)
+            return
+        try:
+            table[path] = float(value)
+        except (TypeError, ValueError):
+            pass  # sources, missing values
+
+    for item, factors in _impact_factors().items():
+        if item != "electricity":
+            flatten((item,), factors)
+
+    for functional_block, levels in (_impact_factors().get("IoT") or {}).items():
+        for hsl, factors in levels.items():
+            for impact_type in factors["manufacture"]:
+                manufacture = table.get(("IoT", functional_block, hsl, "manufacture", impact_type))
+                eol = table.get(("IoT", functional_block, hsl, "eol", impact_type))
+                if manufacture is not None and eol is not None:
+                    table[("IoT", functional_block, hsl, impact_type)] = manufacture + eol
+    return table
+
+
+on_data_change(_impact_factor_table.cache_clear)
+
+
+def get_impact_factor_value(item, impact_type, *keys) -> float:
+    factor = _impact_factor_table().get((item, impact_type) + keys)
+    if factor is None:
+        raise NotImplementedError
+    return factor
 
 
 def get_electrical_impact_factor(usage_location, impact_type) -> dict:
+    impact_factors = _impact_factors()
     if impact_factors["electricity"].get(usage_location):
         if impact_factors["electricity"].get(usage_location).get(impact_type):
             return impact_factors["electricity"].get(usage_location).get(impact_type)
@@ -24,37 +79,92 @@ def get_electrical_impact_factor(usage_location, impact_type) -> dict:
 
 
 def get_electrical_min_max(impact_type, type) -> float:
+    impact_factors = _impact_factors()
     if impact_factors["electricity"].get("min-max").get(impact_type):
         if impact_factors["electricity"].get("min-max").get(impact_type).get(type):
             return impact_factors["electricity"].get("min-max").get(impact_type).get(type)
     raise NotImplementedError
 
 
+def get_factor_criteria(item) -> FrozenSet[str]:
+    impact_factors = _impact_factors()
+    return frozenset(impact_type for impact_type, factor in (impact_factors.get(item) or {}).items() if factor)
+
+
+def get_electrical_factor_criteria() -> FrozenSet[str]:
+    impact_factors = _impact_factors()
+    criteria = set()
+    for usage_location in impact_factors["electricity"]["available_countries"].values():
+        factors = impact_factors["electricity"].get(usage_location) or {}
+        criteria.update(impact_type for impact_type, factor in factors.items() if impact_type != "country" and factor)
+    return frozenset(criteria)
+
+
+class ElectricityFactorMatrix(NamedTuple):
+    locations: Tuple[str, ...]
+    criteria: Dict[str, int]
+    factors: "np.ndarray"
+
+
+@lru_cache(maxsize=None)
+def get_electrical_factor_matrix() -> ElectricityFactorMatrix:
+    """
+    Electricity factors of every available country, one row per location and one column per criteria of the factors
+    file. Missing factors are NaN.
+    """
+    import numpy as np
+
+    locations = tuple(get_available_countries().values())
+    criteria = {impact_type: column for column, impact_type in enumerate(sorted(get_electrical_factor_criteria()))}
+    factors = np.full((len(locations), len(criteria)), np.nan)
+    for row, usage_location in enumerate(locations):
+        for impact_type, column in criteria.items():
+            try:
+                factors[row, column] = float(get_electrical_impact_factor(usage_location, impact_type)["value"])
+            except (NotImplementedError, TypeError, ValueError):
+                pass
+    factors.setflags(write=False)
+    return ElectricityFactorMatrix(locations, criteria, factors)
+
+
+on_data_change(get_electrical_factor_matrix.cache_clear)
+
+
 def get_available_countries(reverse=False):
+    impact_factors = _impact_factors()
     if reverse:
         return {v: k for k, v in impact_factors["electricity"]["available_countries"].items()}
     return impact_factors["electricity"]["available_countries"]
 
 
 def get_available_iot_functional_block():
+    impact_factors = _impact_factors()
     if impact_factors.get("IoT"):
         return impact_factors.get("IoT").keys()
 
 
 def get_available_iot_hsl():
+    impact_factors = _impact_factors()
     response = {}
     for functional_block in get_available_iot_functional_block():
         response[functional_block] = impact_factors.get("IoT").get(functional_block).keys()
     return response
 
 
-def get_iot_impact_factor(functional_block, hsl, impact_type):
-    if impact_factors["IoT"].get(functional_block):
-        if impact_factors["IoT"].get(functional_block).get(hsl):
-            if impact_factors["IoT"].get(functional_block).get(hsl)["manufacture"].get(impact_type) is not None and impact_factors["IoT"].get(functional_block).get(hsl)["eol"].get(impact_type) is not None:
-                return (impact_factors["IoT"].get(functional_block).get(hsl)["manufacture"][impact_type]
-                        + impact_factors["IoT"].get(functional_block).get(hsl)["eol"][impact_type])
-    raise NotImplementedError
+def get_iot_impact_factor(functional_block, hsl, impact_type) -> float:
+    factor = _impact_factor_table().get(("IoT", functional_block, hsl, impact_type))
+    if factor is None:
+        raise NotImplementedError
+    return factor
+
+
+def get_iot_factor_criteria(functional_block) -> FrozenSet[str]:
+    impact_factors = _impact_factors()
+    criteria = set()
+    for factors in (impact_factors["IoT"].get(functional_block) or {}).values():
+        criteria.update(impact_type for impact_type, factor in factors["manufacture"].items()
+                        if factor is not None and factors["eol"].get(impact_type) is not None)
+    return frozenset(criteria)
 
 
 """
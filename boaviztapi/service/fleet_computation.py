@@ -0,0 +1,313 @@
+"""
+Columnar impact engine for fleets of servers.
+
+The impacts of every server of a DataFrame are computed at once with array operations, with the formulas of the
+object engine (service/impacts_computation.py). A row describes one server with a single RAM and SSD configuration;
+columns are named as in the server archetypes:
+
+    units, duration,
+    CPU.units, CPU.die_size, RAM.units, RAM.capacity, RAM.density, SSD.units, SSD.capacity, SSD.density,
+    HDD.units, POWER_SUPPLY.units, POWER_SUPPLY.unit_weight, CASE.units, CASE.case_type, MOTHERBOARD.units,
+    ASSEMBLY.units,
+    USAGE.avg_power, USAGE.use_time_ratio, USAGE.hours_life_time, USAGE.usage_location
+
+Missing columns and empty cells take the value, min and max of the archetype server as completed by the object
+engine. Rows without USAGE.avg_power take the power consumption modeled by the object engine for their CPU and RAM
+configuration, once per distinct configuration.
+"""
+from typing import Dict, List, NamedTuple, Optional, TYPE_CHECKING
+
+from boaviztapi import config
+from boaviztapi.model.boattribute import Boattribute
+from boaviztapi.model.component import ComponentHDD, ComponentSSD
+from boaviztapi.model.device.server import DeviceServer
+from boaviztapi.model.impact import IMPACT_PHASES, EMBEDDED
+from boaviztapi.model.usage.usage import ELEC_FACTORS
+from boaviztapi.service.archetype import get_server_archetype, get_arch_component
+from boaviztapi.service.factor_provider import get_impact_factor_value, get_electrical_impact_factor, \
+    get_electrical_min_max, get_available_countries
+
+if TYPE_CHECKING:
+    import numpy as np
+    import pandas as pd
+
+
+class Columns(NamedTuple):
+    value: "np.ndarray"
+    min: "np.ndarray"
+    max: "np.ndarray"
+
+
+def _reference_attributes(server: DeviceServer) -> Dict[str, Boattribute]:
+    ssd = ComponentSSD(archetype=get_arch_component(server.archetype, "SSD"))
+    hdd = ComponentHDD(archetype=get_arch_component(server.archetype, "HDD"))
+    return {
+        "units": server.units,
+        "CPU.units": server.cpu.units,
+        "CPU.die_size": server.cpu.die_size,
+        "RAM.units": server.ram[0].units,
+        "RAM.capacity": server.ram[0].capacity,
+        "RAM.density": server.ram[0].density,
+        "SSD.units": ssd.units,
+        "SSD.capacity": ssd.capacity,
+        "SSD.density": ssd.density,
+        "HDD.units": hdd.units,
+        "POWER_SUPPLY.units": server.power_supply.units,
+        "POWER_SUPPLY.unit_weight": server.power_supply.unit_weight,
+        "CASE.units": server.case.units,
+        "MOTHERBOARD.units": server.motherboard.units,
+        "ASSEMBLY.units": server.assembly.units,
+        "USAGE.avg_power": server.usage.avg_power,
+        "USAGE.use_time_ratio": server.usage.use_time_ratio,
+        "USAGE.hours_life_time": server.usage.hours_life_time,
+    }
+
+
+# columns the modeled power consumption of a server depends on
+POWER_COLUMNS = ("CPU.units", "RAM.units", "RAM.capacity")
+
+
+def _power_attributes(server: DeviceServer) -> Dict[str, Boattribute]:
+    return {"CPU.units": server.cpu.units, "RAM.units": server.ram[0].units, "RAM.capacity": server.ram[0].capacity}
+
+
+def _modeled_avg_power(fleet: "pd.DataFrame", archetype: dict) -> Columns:
+    """
+    Power consumption modeled as in server_impact_use, computed once per distinct configuration of POWER_COLUMNS.
+    """
+    import numpy as np
+    import pandas as pd
+
+    # empty cells take the archetype values: they are marked -1, which no count or capacity can be
+    configurations = pd.DataFrame({column: fleet[column].to_numpy(dtype=float) if column in fleet
+                                   else np.full(len(fleet), np.nan) for column in POWER_COLUMNS}).fillna(-1)
+    codes = configurations.groupby(list(POWER_COLUMNS), sort=False).ngroup().to_numpy()
+    modeled = []
+    for _, configuration in configurations.drop_duplicates().iterrows():
+        server = DeviceServer(archetype=archetype)
+        for column, attribute in _power_attributes(server).items():
+            if configuration[column] != -1:
+                attribute.set_input(configuration[column])
+        consumption = server.model_power_consumption()
+        modeled.append((consumption.value, consumption.min, consumption.max))
+    modeled = np.array(modeled, dtype=float).reshape(-1, 3)
+    return Columns(*(modeled[codes, stat] for stat in range(3)))
+
+
+def _numeric(value) -> float:
+    return float("nan") if value is None else float(value)
+
+
+def _columns(fleet: "pd.DataFrame", column: str, reference: Boattribute) -> Columns:
+    """
+    Given cells have min = max = value (input), the others take the reference attribute.
+    """
+    import numpy as np
+
+    default_value = _numeric(reference.value)
+    default_min, default_max = _numeric(reference.min), _numeric(reference.max)
+    if column not in fleet:
+        return Columns(*(np.full(len(fleet), default) for default in (default_value, default_min, default_max)))
+
+    values = fleet[column].to_numpy(dtype=float)
+    given = ~np.isnan(values)
+    return Columns(np.where(given, values, default_value),
+                   np.where(given, values, default_min),
+                   np.where(given, values, default_max))
+
+
+def _labels(fleet: "pd.DataFrame", column: str, default: str):
+    """
+    Values of a text column, with default in empty cells, and the mask of the given cells.
+    """
+    import numpy as np
+
+    if column not in fleet:
+        return np.full(len(fleet), default, dtype=object), np.zeros(len(fleet), dtype=bool)
+    labels = fleet[column]
+    given = labels.notna().to_numpy()
+    return np.where(given, labels.to_numpy(dtype=object), default), given
+
+
+def _scaled(impact: Columns, units: Columns) -> Columns:
+    import numpy as np
+
+    # a component with no units has no impact, whatever its other characteristics
+    return Columns(*(np.where(u == 0, 0, i * u) for i, u in zip(impact, units)))
+
+
+def _sum(impacts: List[Columns]) -> Columns:
+    return Columns(*(sum(columns) for columns in zip(*impacts)))
+
+
+def allocate(impact: Columns, duration: "np.ndarray", life_time: Columns) -> Columns:
+    """
+    Columnar Impact.allocate.
+    """
+    import numpy as np
+
+    beyond_life_time = duration > life_time.value
+    return Columns(impact.value * np.where(beyond_life_time, 1, duration / life_time.value),
+                   impact.min * np.where(beyond_life_time, 1, duration / life_time.max),
+                   impact.max * np.where(beyond_life_time, 1, duration / life_time.min))
+
+
+def _die_impact(criteria: str, item: str, size: Columns, constant: float = 0) -> Columns:
+    die_impact = get_impact_factor_value(item, criteria, 'die_impact')
+    impact = get_impact_factor_value(item, criteria, 'impact')
+    return Columns(*((s + constant) * die_impact + impact for s in size))
+
+
+def _constant(fleet_size: int, value: float) -> Columns:
+    import numpy as np
+
+    return Columns(*(np.full(fleet_size, value) for _ in range(3)))
+
+
+def _case_impact(criteria: str, case_type: "np.ndarray", case_type_is_archetype: "np.ndarray") -> Columns:
+    import numpy as np
+
+    rack = get_impact_factor_value('case', criteria, 'rack', 'impact')
+    blade = (get_impact_factor_value('case', criteria, 'blade', 'impact_blade_16_slots') / 16
+             + get_impact_factor_value('case', criteria, 'blade', 'impact_blade_server'))
+    value = np.where(case_type == 'blade', blade, rack)
+    # an archetype rack or blade spans both case types, as in impact_manufacture_rack and impact_manufacture_blade
+    spans = case_type_is_archetype & np.isin(case_type, ['rack', 'blade'])
+    return Columns(value,
+                   np.where(spans, min(rack, blade), value),
+                   np.where(spans, max(rack, blade), value))
+
+
+class _Fleet:
+
+    def __init__(self, fleet: "pd.DataFrame", archetype: dict, duration: Optional[float]):
+        import numpy as np
+        import pandas as pd
+
+        self.size = len(fleet)
+        reference = DeviceServer(archetype=archetype)
+        self.attributes = {column: _columns(fleet, column, attribute)
+                           for column, attribute in _reference_attributes(reference).items()}
+
+        avg_power = self["USAGE.avg_power"]
+        missing_avg_power = np.isnan(avg_power.value)
+        if missing_avg_power.any():
+            modeled = _modeled_avg_power(fleet[missing_avg_power], archetype)
+            for given, filled in zip(avg_power, modeled):
+                given[missing_avg_power] = filled
+
+        reference_case_type = reference.case.case_type
+        self.case_type, given_case_type = _labels(fleet, "CASE.case_type", reference_case_type.value)
+        self.case_type_is_archetype = ~given_case_type & reference_case_type.is_archetype()
+
+        # as in ModelUsage._complete_impact_factor, min and max of the electricity factors only apply to the default
+        # location
+        reference_location = reference.usage.usage_location
+        self.location, given_location = _labels(fleet, "USAGE.usage_location", reference_location.value
+                                                if reference_location.has_value() else config["default_location"])
+        self.location_is_default = ~given_location & (not reference_location.has_value())
+        # factors are looked up once per distinct location
+        self.location_codes, self.locations = pd.factorize(self.location)
+
+        if duration is not None:
+            self.duration = np.full(self.size, float(duration))
+        elif "duration" in fleet:
+            durations = fleet["duration"].to_numpy(dtype=float)
+            self.duration = np.where(np.isnan(durations), self["USAGE.hours_life_time"].value, durations)
+        else:
+            self.duration = self["USAGE.hours_life_time"].value
+
+    def __getitem__(self, column: str) -> Columns:
+        return self.attributes[column]
+
+    def embedded(self, criteria: str) -> Columns:
+        try:
+            impact = self._components_embedded(criteria)
+        except NotImplementedError:
+            # generic server data, as server_impact_embedded when a component cannot be computed
+            impact = _constant(self.size, get_impact_factor_value('SERVER', criteria, 'impact'))
+            impact = allocate(impact, self.duration, self["USAGE.hours_life_time"])
+        return _scaled(impact, self["units"])
+
+    def _components_embedded(self, criteria: str) -> Columns:
+        life_time = self["USAGE.hours_life_time"]
+        ram_size = Columns(self["RAM.capacity"].value / self["RAM.density"].value,
+                           self["RAM.capacity"].min / self["RAM.density"].max,
+                           self["RAM.capacity"].max / self["RAM.density"].min)
+        ssd_size = Columns(self["SSD.capacity"].value / self["SSD.density"].value,
+                           self["SSD.capacity"].min / self["SSD.density"].max,
+                           self["SSD.capacity"].max / self["SSD.density"].min)
+        power_supply = get_impact_factor_value('power_supply', criteria, 'impact')
+        components = [
+            (_constant(self.size, get_impact_factor_value('assembly', criteria, 'impact')), "ASSEMBLY.units"),
+            (_die_impact(criteria, 'cpu', self["CPU.die_size"],
+                         get_impact_factor_value('cpu', criteria, 'constant_core_impact')), "CPU.units"),
+            (_die_impact(criteria, 'ram', ram_size), "RAM.units"),
+            (_die_impact(criteria, 'ssd', ssd_size), "SSD.units"),
+            (_constant(self.size, get_impact_factor_value('hdd', criteria, 'impact')), "HDD.units"),
+            (Columns(*(weight * power_supply for weight in self["POWER_SUPPLY.unit_weight"])), "POWER_SUPPLY.units"),
+            (_case_impact(criteria, self.case_type, self.case_type_is_archetype), "CASE.units"),
+            (_constant(self.size, get_impact_factor_value('motherboard', criteria, 'impact')), "MOTHERBOARD.units"),
+        ]
+        return _sum([_scaled(allocate(impact, self.duration, life_time), self[units]) for impact, units in components])
+
+    def elec_factor(self, criteria: str) -> Columns:
+        import numpy as np
+
+        criteria_proxy = ELEC_FACTORS[criteria][1]
+        available_countries = get_available_countries(reverse=True)
+        location_values = np.full(len(self.locations), np.nan)
+        for code, location in enumerate(self.locations):
+            if location in available_countries:
+                try:
+                    location_values[code] = get_electrical_impact_factor(location, criteria_proxy)["value"]
+                except NotImplementedError:
+                    pass
+        value = location_values[self.location_codes]
+        try:
+            default_min = float(get_electrical_min_max(criteria_proxy, "min"))
+            default_max = float(get_electrical_min_max(criteria_proxy, "max"))
+        except NotImplementedError:
+            # the factor of the default location is not implemented without its min and max
+            default_min = default_max = np.nan
+            value[self.location_is_default] = np.nan
+        return Columns(value,
+                       np.where(self.location_is_default, default_min, value),
+                       np.where(self.location_is_default, default_max, value))
+
+    def use(self, criteria: str) -> Columns:
+        if criteria not in ELEC_FACTORS:
+            raise NotImplementedError
+        factor = self.elec_factor(criteria)
+        avg_power = self["USAGE.avg_power"]
+        use_time_ratio = self["USAGE.use_time_ratio"]
+        impact = Columns(*(f * (p / 1000) * r * self.duration
+                           for f, p, r in zip(factor, avg_power, use_time_ratio)))
+        return _scaled(impact, self["units"])
+
+
+def compute_fleet_impacts(fleet: "pd.DataFrame", selected_criteria=config["default_criteria"],
+                          duration: Optional[float] = None,
+                          archetype: Optional[dict] = None) -> "pd.DataFrame":
+    """
+    Impacts of each server (row) of fleet, in columns named criteria.phase.value, criteria.phase.min and
+    criteria.phase.max. Impacts that are not implemented are NaN. Without duration, the duration column or else the
+    lifetime of each server is used.
+    """
+    import numpy as np
+    import pandas as pd
+
+    if archetype is None:
+        archetype = get_server_archetype(config["default_server"])
+    servers = _Fleet(fleet, archetype, duration)
+
+    result = {}
+    for criteria in selected_criteria:
+        for phase in IMPACT_PHASES:
+            try:
+                impact = servers.embedded(criteria) if phase == EMBEDDED else servers.use(criteria)
+            except NotImplementedError:
+                impact = _constant(servers.size, np.nan)
+            for stat, columns in zip(Columns._fields, impact):
+                result[f"{criteria}.{phase}.{stat}"] = columns
+    return pd.DataFrame(result, index=fleet.index)
@@ -1,4 +1,5 @@
-from typing import Tuple, Union, Optional
+from functools import lru_cache
+from typing import Callable, Tuple, Union, Optional, Dict, FrozenSet, List
 
 from boaviztapi import config
 from boaviztapi.dto.component import Motherboard
@@ -7,11 +8,15 @@ from boaviztapi.model.device.server import DeviceServer
 from boaviztapi.model.services.cloud_instance import Service, ServiceCloudInstance
 from boaviztapi.model.component import ComponentCPU, ComponentCase, ComponentPowerSupply, ComponentRAM, Component, \
     ComponentAssembly, ComponentHDD, ComponentSSD
-from boaviztapi.model.component.functional_block import ComponentFunctionalBlock
+from boaviztapi.model.component.functional_block import ComponentFunctionalBlock, get_functional_block
 from boaviztapi.model.device import Device
 from boaviztapi.model.device.iot import DeviceIoT
-from boaviztapi.model.impact import ImpactFactor, IMPACT_PHASES, IMPACT_CRITERIAS, Impact, USE
-from boaviztapi.service.factor_provider import get_impact_factor, get_iot_impact_factor
+from boaviztapi.model.impact import ImpactFactor, IMPACT_PHASES, IMPACT_CRITERIAS, Impact, USE, EMBEDDED, \
+    NOT_IMPLEMENTED
+from boaviztapi.model.usage.usage import ELEC_FACTORS
+from boaviztapi.service.factor_provider import get_impact_factor_value, get_iot_impact_factor, get_factor_criteria, \
+    get_electrical_factor_criteria, get_iot_factor_criteria, get_electrical_factor_matrix
+from boaviztapi.utils.data_version import on_data_change
 
 
 def compute_single_impact(model: Union[Component, Device, Service],
@@ -19,6 +24,9 @@ def compute_single_impact(model: Union[Component, Device, Service],
                           criteria: str,
                           duration: Union[int, str] = config["default_duration"],
                           allocation: float = 1) -> Optional[Impact]:
+    if not is_implemented(model, phase, criteria):
+        model.add_impacts(None, criteria, phase)
+        return None
     try:
         impact_function = get_impact_function(model, phase)
 
@@ -41,6 +49,12 @@ def compute_single_impact(model: Union[Component, Device, Service],
 
 def compute_impacts(model: Union[Component, Device, Service], selected_criteria=config["default_criteria"],
                     duration=config["default_duration"]) -> dict:
+    compute_all_impacts(model, selected_criteria, duration)
+
+    return model.get_impacts(selected_criteria)
+
+
+def compute_all_impacts(model: Union[Component, Device, Service], selected_criteria, duration) -> None:
     for c in IMPACT_CRITERIAS.keys():
         criteria = IMPACT_CRITERIAS[c]
         if "all" not in selected_criteria:
@@ -49,7 +63,89 @@ def compute_impacts(model: Union[Component, Device, Service], selected_criteria=
         for phase in IMPACT_PHASES:
             compute_single_impact(model, phase, criteria.name, duration)
 
-    return model.get_impacts(selected_criteria)
+
+def compute_impacts_by_duration(model: Union[Component, Device, Service], selected_criteria, durations: List[float],
+                                verbose: Optional[Callable[[float, int], dict]] = None) -> List[dict]:
+    """
+    One impact set per duration. The model is completed and its impacts computed once, as arrays over the durations.
+    verbose(duration, index) returns the verbose output of the index-th duration.
+    """
+    import numpy as np
+
+    compute_all_impacts(model, selected_criteria, np.asarray(durations, dtype=float))
+
+    life_time = (model.platform.usage if isinstance(model, ServiceCloudInstance) else model.usage).hours_life_time
+    results = []
+    for index, duration in enumerate(durations):
+        result = {"duration": duration, "impacts": model.get_impacts(selected_criteria, index)}
+        if verbose is not None:
+            # as the allocation of a single duration within the lifetime, which reads its min and max
+            with life_time.read_bounds(life_time.is_set() and duration <= life_time.value):
+                result["verbose"] = verbose(duration, index)
+        results.append(result)
+    return results
+
+
+def compute_impacts_by_location(model: Union[Component, Device, Service], selected_criteria, duration,
+                                usage_locations: List[str]) -> dict:
+    """
+    Embedded impacts once, and use impacts for each of usage_locations ("all" for every available country). The
+    electricity consumed over duration is computed once and multiplied by the factors of each location.
+    """
+    import numpy as np
+
+    for criteria in selected_criteria:
+        compute_single_impact(model, EMBEDDED, criteria, duration)
+    embedded = {criteria: {key: value for key, value in impacts.items() if key != USE}
+                for criteria, impacts in model.get_impacts(selected_criteria).items()}
+
+    matrix = get_electrical_factor_matrix()
+    if "all" in usage_locations:
+        usage_locations = list(matrix.locations)
+    rows = {usage_location: row for row, usage_location in enumerate(matrix.locations)}
+    consumption = electricity_consumption(model, duration)
+
+    use = {usage_location: {} for usage_location in usage_locations}
+    for criteria in selected_criteria:
+        column = matrix.criteria.get(ELEC_FACTORS[criteria][1]) if criteria in ELEC_FACTORS else None
+        if consumption is None or column is None:
+            for usage_location in usage_locations:
+                use[usage_location][criteria] = NOT_IMPLEMENTED
+            continue
+        factors = np.array([matrix.factors[rows[usage_location], column] if usage_location in rows else np.nan
+                            for usage_location in usage_locations])
+        # one row per location: value, min and max
+        impacts = factors[:, None] * np.array([consumption.value, consumption.min, consumption.max])
+        for usage_location, (value, min_value, max_value) in zip(usage_locations, impacts):
+            if np.isnan(value):
+                use[usage_location][criteria] = NOT_IMPLEMENTED
+            else:
+                use[usage_location][criteria] = Impact(value=float(value), min=float(min_value), max=float(max_value),
+                                                       warnings=consumption.warnings).to_json()
+
+    return {"impacts": embedded, "use": use}
+
+
+def electricity_consumption(model: Union[Component, Device, Service], duration) -> Optional[Impact]:
+    """
+    Use impact of model with an electricity factor of 1, i.e. the kWh it consumes over duration.
+    """
+    electricity_impact = electricity_impact_functions.get(get_impact_function(model, USE))
+    if electricity_impact is None:
+        return None
+    try:
+        value, min_value, max_value, warnings = electricity_impact(ImpactFactor(value=1, min=1, max=1), duration,
+                                                                   model)
+    except NotImplementedError:
+        return None
+
+    return Impact(value=value * model.units.value, min=min_value * model.units.min, max=max_value * model.units.max,
+                  warnings=list(set(warnings)))
+
+
+def is_implemented(model: Union[Component, Device, Service], phase: str, criteria: str) -> bool:
+    capabilities = impact_capabilities().get((model.NAME, phase))
+    return capabilities is None or criteria in capabilities
 
 
 def get_impact_function(model: Union[Component, Device, Service], phase: str):
@@ -61,10 +157,17 @@ def not_implemented_function(impact_type: str, duration: int, model: Union[Compo
 
 
 def simple_impact_use(impact_type: str, duration: int, model: Union[Component, Device, Service]) -> ComputedImpacts:
+    # before the factor is completed, which shows in the verbose output
     if not model.usage.avg_power.is_set():
         raise NotImplementedError
 
-    impact_factor = model.usage.elec_factors[impact_type]
+    return simple_electricity_impact(model.usage.elec_factors[impact_type], duration, model)
+
+
+def simple_electricity_impact(impact_factor: ImpactFactor, duration: int,
+                              model: Union[Component, Device, Service]) -> ComputedImpacts:
+    if not model.usage.avg_power.is_set():
+        raise NotImplementedError
 
     impacts = impact_factor.value * (model.usage.avg_power.value / 1000) * model.usage.use_time_ratio.value * duration
     max_impact = impact_factor.max * (model.usage.avg_power.max / 1000) * model.usage.use_time_ratio.min * duration
@@ -73,32 +176,33 @@ def simple_impact_use(impact_type: str, duration: int, model: Union[Component, D
     return impacts, min_impact, max_impact, []
 
 
+def complete_avg_power(model: Union[Component, Device, Service]) -> None:
+    if not model.usage.avg_power.is_set():
+        modeled_consumption = model.model_power_consumption()
+        model.usage.avg_power.set_completed(
+            modeled_consumption.value,
+            min=modeled_consumption.min,
+            max=modeled_consumption.max
+        )
+
+
 def simple_embedded(impact_type: str, duration: int, model: [Device, Component, Service]) -> ComputedImpacts:
     if hasattr(model, 'type') and model.type is not None:
-        impact = float(get_impact_factor(item=model.NAME, impact_type=impact_type)[model.type.value]["impact"])
-        min_impact = float(get_impact_factor(item=model.NAME, impact_type=impact_type)[model.type.value]["impact"])
-        max_impact = float(get_impact_factor(item=model.NAME, impact_type=impact_type)[model.type.value]["impact"])
-
+        impact = get_impact_factor_value(model.NAME, impact_type, model.type.value, "impact")
     else:
-        impact = float(get_impact_factor(item=model.NAME, impact_type=impact_type)["impact"])
-        min_impact = float(get_impact_factor(item=model.NAME, impact_type=impact_type)["impact"])
-        max_impact = float(get_impact_factor(item=model.NAME, impact_type=impact_type)["impact"])
+        impact = get_impact_factor_value(model.NAME, impact_type, "impact")
 
     warnings = ["Generic data used for impact calculation."]
 
-    return impact, min_impact, max_impact, warnings
+    return impact, impact, impact, warnings
 
 
 def cpu_impact_use(impact_type: str, duration: int, cpu: ComponentCPU) -> ComputedImpacts:
-    impact_factor = cpu.usage.elec_factors[impact_type]
+    return cpu_electricity_impact(cpu.usage.elec_factors[impact_type], duration, cpu)
 
-    if not cpu.usage.avg_power.is_set():
-        modeled_consumption = cpu.model_power_consumption()
-        cpu.usage.avg_power.set_completed(
-            modeled_consumption.value,
-            min=modeled_consumption.min,
-            max=modeled_consumption.max
-        )
+
+def cpu_electricity_impact(impact_factor: ImpactFactor, duration: int, cpu: ComponentCPU) -> ComputedImpacts:
+    complete_avg_power(cpu)
 
     impact = Impact(
         value=impact_factor.value * (
@@ -113,26 +217,14 @@ def cpu_impact_use(impact_type: str, duration: int, cpu: ComponentCPU) -> Comput
 
 
 def cpu_impact_embedded(impact_type: str, duration: int, cpu: ComponentCPU) -> ComputedImpacts:
-    core_impact = Impact(
-        value=get_impact_factor(item='cpu', impact_type=impact_type)['constant_core_impact'],
-        min=get_impact_factor(item='cpu', impact_type=impact_type)['constant_core_impact'],
-        max=get_impact_factor(item='cpu', impact_type=impact_type)['constant_core_impact']
-    )
-    cpu_die_impact = Impact(
-        value=get_impact_factor(item='cpu', impact_type=impact_type)['die_impact'],
-        min=get_impact_factor(item='cpu', impact_type=impact_type)['die_impact'],
-        max=get_impact_factor(item='cpu', impact_type=impact_type)['die_impact']
-    )
-    cpu_impact = Impact(
-        value=get_impact_factor(item='cpu', impact_type=impact_type)['impact'],
-        min=get_impact_factor(item='cpu', impact_type=impact_type)['impact'],
-        max=get_impact_factor(item='cpu', impact_type=impact_type)['impact']
-    )
+    core_impact = get_impact_factor_value('cpu', impact_type, 'constant_core_impact')
+    cpu_die_impact = get_impact_factor_value('cpu', impact_type, 'die_impact')
+    cpu_impact = get_impact_factor_value('cpu', impact_type, 'impact')
 
     impact = Impact(
-        value=(cpu.die_size.value + core_impact.value) * cpu_die_impact.value + cpu_impact.value,
-        min=(cpu.die_size.min + core_impact.min) * cpu_die_impact.min + cpu_impact.min,
-        max=(cpu.die_size.max + core_impact.max) * cpu_die_impact.max + cpu_impact.max)
+        value=(cpu.die_size.value + core_impact) * cpu_die_impact + cpu_impact,
+        min=(cpu.die_size.min + core_impact) * cpu_die_impact + cpu_impact,
+        max=(cpu.die_size.max + core_impact) * cpu_die_impact + cpu_impact)
 
     impact.allocate(duration, cpu.usage.hours_life_time)
 
@@ -140,11 +232,8 @@ def cpu_impact_embedded(impact_type: str, duration: int, cpu: ComponentCPU) -> C
 
 
 def assembly_impact_embedded(impact_type: str, duration: int, model: ComponentAssembly) -> ComputedImpacts:
-    impact = Impact(
-        value=get_impact_factor(item='assembly', impact_type=impact_type)['impact'],
-        min=get_impact_factor(item='assembly', impact_type=impact_type)['impact'],
-        max=get_impact_factor(item='assembly', impact_type=impact_type)['impact']
-    )
+    impact_factor = get_impact_factor_value('assembly', impact_type, 'impact')
+    impact = Impact(value=impact_factor, min=impact_factor, max=impact_factor)
 
     impact.allocate(duration, model.usage.hours_life_time)
 
@@ -171,21 +260,17 @@ def casing_impact_embedded(impact_type: str, duration: int, case: ComponentCase)
 
 
 def impact_manufacture_rack(impact_type: str, case: ComponentCase) -> ComputedImpacts:
-    impact_factor = Impact(
-        value=get_impact_factor(item='case', impact_type=impact_type)['rack']['impact'],
-        min=get_impact_factor(item='case', impact_type=impact_type)['rack']['impact'],
-        max=get_impact_factor(item='case', impact_type=impact_type)['rack']['impact']
-    )
+    impact_factor = get_impact_factor_value('case', impact_type, 'rack', 'impact')
 
     if case.case_type.is_archetype() and case.case_type.value == 'rack':
         blade_impact = impact_manufacture_blade(impact_type, case)
-        if blade_impact[0] > impact_factor.value:
-            return impact_factor.value, impact_factor.min, blade_impact[2], [
+        if blade_impact[0] > impact_factor:
+            return impact_factor, impact_factor, blade_impact[2], [
                 "End of life is not included in the calculation"]
         else:
-            return impact_factor.value, blade_impact[1], impact_factor.max, [
+            return impact_factor, blade_impact[1], impact_factor, [
                 "End of life is not included in the calculation"]
-    return impact_factor.value, impact_factor.min, impact_factor.max, ["End of life is not included in the calculation"]
+    return impact_factor, impact_factor, impact_factor, ["End of life is not included in the calculation"]
 
 
 def impact_manufacture_blade(impact_type: str, case: ComponentCase) -> ComputedImpacts:
@@ -203,37 +288,23 @@ def impact_manufacture_blade(impact_type: str, case: ComponentCase) -> ComputedI
     return impact.value, impact.min, impact.max, ["End of life is not included in the calculation"]
 
 
-def get_impact_constants_blade(impact_type: str) -> Tuple[Impact, Impact]:
-    impact_blade_server = Impact(
-        value=get_impact_factor(item='case', impact_type=impact_type)['blade']['impact_blade_server'],
-        min=get_impact_factor(item='case', impact_type=impact_type)['blade']['impact_blade_server'],
-        max=get_impact_factor(item='case', impact_type=impact_type)['blade']['impact_blade_server'],
-    )
-    impact_blade_16_slots = Impact(
-        value=get_impact_factor(item='case', impact_type=impact_type)['blade']['impact_blade_16_slots'],
-        min=get_impact_factor(item='case', impact_type=impact_type)['blade']['impact_blade_16_slots'],
-        max=get_impact_factor(item='case', impact_type=impact_type)['blade']['impact_blade_16_slots'],
-    )
+def get_impact_constants_blade(impact_type: str) -> Tuple[float, float]:
+    impact_blade_server = get_impact_factor_value('case', impact_type, 'blade', 'impact_blade_server')
+    impact_blade_16_slots = get_impact_factor_value('case', impact_type, 'blade', 'impact_blade_16_slots')
 
     return impact_blade_server, impact_blade_16_slots
 
 
-def compute_impact_manufacture_blade(impact_blade_server: Impact,
-                                     impact_blade_16_slots: Impact) -> ImpactFactor:
-    return ImpactFactor(
-        value=(impact_blade_16_slots.value / 16) + impact_blade_server.value,
-        min=(impact_blade_16_slots.min / 16) + impact_blade_server.min,
-        max=(impact_blade_16_slots.max / 16) + impact_blade_server.max
-    )
+def compute_impact_manufacture_blade(impact_blade_server: float,
+                                     impact_blade_16_slots: float) -> ImpactFactor:
+    impact = (impact_blade_16_slots / 16) + impact_blade_server
+    return ImpactFactor(value=impact, min=impact, max=impact)
 
 
 def iot_functional_blocks_impact_embedded(impact_type: str, duration: int,
                                           function_blocks: ComponentFunctionalBlock) -> ComputedImpacts:
-    impact = Impact(
-        value=get_iot_impact_factor(function_blocks.IMPACT_KEY, function_blocks.hsl_level.value, impact_type),
-        min=get_iot_impact_factor(function_blocks.IMPACT_KEY, function_blocks.hsl_level.value, impact_type),
-        max=get_iot_impact_factor(function_blocks.IMPACT_KEY, function_blocks.hsl_level.value, impact_type)
-    )
+    impact_factor = get_iot_impact_factor(function_blocks.IMPACT_KEY, function_blocks.hsl_level.value, impact_type)
+    impact = Impact(value=impact_factor, min=impact_factor, max=impact_factor)
 
     impact.allocate(duration, function_blocks.usage.hours_life_time)
 
@@ -241,11 +312,8 @@ def iot_functional_blocks_impact_embedded(impact_type: str, duration: int,
 
 
 def hdd_impact_embedded(impact_type: str, duration: int, hdd: ComponentHDD) -> ComputedImpacts:
-    impact = Impact(
-        value=get_impact_factor(item='hdd', impact_type=impact_type)['impact'],
-        min=get_impact_factor(item='hdd', impact_type=impact_type)['impact'],
-        max=get_impact_factor(item='hdd', impact_type=impact_type)['impact']
-    )
+    impact_factor = get_impact_factor_value('hdd', impact_type, 'impact')
+    impact = Impact(value=impact_factor, min=impact_factor, max=impact_factor)
 
     impact.allocate(duration, hdd.usage.hours_life_time)
 
@@ -253,11 +321,8 @@ def hdd_impact_embedded(impact_type: str, duration: int, hdd: ComponentHDD) -> C
 
 
 def motherboard_impact_embedded(impact_type: str, duration: int, motherboard: Motherboard) -> ComputedImpacts:
-    impact = Impact(
-        value=get_impact_factor(item='motherboard', impact_type=impact_type)['impact'],
-        min=get_impact_factor(item='motherboard', impact_type=impact_type)['impact'],
-        max=get_impact_factor(item='motherboard', impact_type=impact_type)['impact']
-    )
+    impact_factor = get_impact_factor_value('motherboard', impact_type, 'impact')
+    impact = Impact(value=impact_factor, min=impact_factor, max=impact_factor)
 
     impact.allocate(duration, motherboard.usage.hours_life_time)
 
@@ -276,16 +341,12 @@ def power_supply_impact_embedded(impact_type: str, duration: int,
 
 def server_power_supply_impact_embedded(impact_type: str, duration: int,
                                         power_supply: ComponentPowerSupply) -> ComputedImpacts:
-    impact_factor = Impact(
-        value=get_impact_factor(item='power_supply', impact_type=impact_type)['impact'],
-        min=get_impact_factor(item='power_supply', impact_type=impact_type)['impact'],
-        max=get_impact_factor(item='power_supply', impact_type=impact_type)['impact']
-    )
+    impact_factor = get_impact_factor_value('power_supply', impact_type, 'impact')
 
     impact = Impact(
-        value=power_supply.unit_weight.value * impact_factor.value,
-        min=power_supply.unit_weight.min * impact_factor.min,
-        max=power_supply.unit_weight.max * impact_factor.max
+        value=power_supply.unit_weight.value * impact_factor,
+        min=power_supply.unit_weight.min * impact_factor,
+        max=power_supply.unit_weight.max * impact_factor
     )
 
     impact.allocate(duration, power_supply.usage.hours_life_time)
@@ -294,22 +355,13 @@ def server_power_supply_impact_embedded(impact_type: str, duration: int,
 
 
 def ram_impact_embedded(impact_type: str, duration: int, ram: ComponentRAM) -> ComputedImpacts:
-    ram_die_impact = Impact(
-        value=get_impact_factor(item='ram', impact_type=impact_type)['die_impact'],
-        min=get_impact_factor(item='ram', impact_type=impact_type)['die_impact'],
-        max=get_impact_factor(item='ram', impact_type=impact_type)['die_impact']
-    )
-
-    ram_impact = Impact(
-        value=get_impact_factor(item='ram', impact_type=impact_type)['impact'],
-        min=get_impact_factor(item='ram', impact_type=impact_type)['impact'],
-        max=get_impact_factor(item='ram', impact_type=impact_type)['impact']
-    )
+    ram_die_impact = get_impact_factor_value('ram', impact_type, 'die_impact')
+    ram_impact = get_impact_factor_value('ram', impact_type, 'impact')
 
     impact = Impact(
-        value=(ram.capacity.value / ram.density.value) * ram_die_impact.value + ram_impact.value,
-        min=(ram.capacity.min / ram.density.max) * ram_die_impact.min + ram_impact.min,
-        max=(ram.capacity.max / ram.density.min) * ram_die_impact.max + ram_impact.max
+        value=(ram.capacity.value / ram.density.value) * ram_die_impact + ram_impact,
+        min=(ram.capacity.min / ram.density.max) * ram_die_impact + ram_impact,
+        max=(ram.capacity.max / ram.density.min) * ram_die_impact + ram_impact
     )
 
     impact.allocate(duration, ram.usage.hours_life_time)
@@ -318,15 +370,11 @@ def ram_impact_embedded(impact_type: str, duration: int, ram: ComponentRAM) -> C
 
 
 def ram_impact_use(impact_type: str, duration: int, ram: ComponentRAM) -> ComputedImpacts:
-    impact_factor = ram.usage.elec_factors[impact_type]
+    return ram_electricity_impact(ram.usage.elec_factors[impact_type], duration, ram)
 
-    if not ram.usage.avg_power.is_set():
-        modeled_consumption = ram.model_power_consumption()
-        ram.usage.avg_power.set_completed(
-            modeled_consumption.value,
-            min=modeled_consumption.min,
-            max=modeled_consumption.max,
-        )
+
+def ram_electricity_impact(impact_factor: ImpactFactor, duration: int, ram: ComponentRAM) -> ComputedImpacts:
+    complete_avg_power(ram)
 
     impact = ImpactFactor(
         value=impact_factor.value * (
@@ -341,21 +389,13 @@ def ram_impact_use(impact_type: str, duration: int, ram: ComponentRAM) -> Comput
 
 
 def ssd_impact_embedded(impact_type: str, duration: int, ssd: ComponentSSD) -> ComputedImpacts:
-    ssd_die_impact = Impact(
-        value=get_impact_factor(item='ssd', impact_type=impact_type)['die_impact'],
-        min=get_impact_factor(item='ssd', impact_type=impact_type)['die_impact'],
-        max=get_impact_factor(item='ssd', impact_type=impact_type)['die_impact']
-    )
-    ssd_impact = Impact(
-        value=get_impact_factor(item='ssd', impact_type=impact_type)['impact'],
-        min=get_impact_factor(item='ssd', impact_type=impact_type)['impact'],
-        max=get_impact_factor(item='ssd', impact_type=impact_type)['impact']
-    )
+    ssd_die_impact = get_impact_factor_value('ssd', impact_type, 'die_impact')
+    ssd_impact = get_impact_factor_value('ssd', impact_type, 'impact')
 
     impact = Impact(
-        value=(ssd.capacity.value / ssd.density.value) * ssd_die_impact.value + ssd_impact.value,
-        min=(ssd.capacity.min / ssd.density.max) * ssd_die_impact.min + ssd_impact.min,
-        max=(ssd.capacity.max / ssd.density.min) * ssd_die_impact.max + ssd_impact.max
+        value=(ssd.capacity.value / ssd.density.value) * ssd_die_impact + ssd_impact,
+        min=(ssd.capacity.min / ssd.density.max) * ssd_die_impact + ssd_impact,
+        max=(ssd.capacity.max / ssd.density.min) * ssd_die_impact + ssd_impact
     )
 
     impact.allocate(duration, ssd.usage.hours_life_time)
@@ -380,10 +420,17 @@ def iot_impact_embedded(impact_type: str, duration: int, iot_device: DeviceIoT)
 
 
 def iot_impact_use(impact_type: str, duration: int, iot_device: DeviceIoT) -> ComputedImpacts:
+    # before the factor is completed, which shows in the verbose output
+    if iot_device.usage.avg_power.value is None:
+        raise NotImplementedError
+
+    return iot_electricity_impact(iot_device.usage.elec_factors[impact_type], duration, iot_device)
+
+
+def iot_electricity_impact(impact_factor: ImpactFactor, duration: int, iot_device: DeviceIoT) -> ComputedImpacts:
     if iot_device.usage.avg_power.value is None:
         raise NotImplementedError
 
-    impact_factor = iot_device.usage.elec_factors[impact_type]
     impact = impact_factor.value * (
             iot_device.usage.avg_power.value / 1000) * iot_device.usage.use_time_ratio.value * duration
     min_impact = impact_factor.min * (
@@ -416,9 +463,8 @@ def server_impact_embedded(impact_type: str, duration: int, server: DeviceServer
         return sum(impacts), sum(min_impacts), sum(max_impacts), warnings
 
     except NotImplementedError:
-        impact = Impact(value=get_impact_factor(item='SERVER', impact_type=impact_type)["impact"],
-                        min=get_impact_factor(item='SERVER', impact_type=impact_type)["impact"],
-                        max=get_impact_factor(item='SERVER', impact_type=impact_type)["impact"])
+        impact_factor = get_impact_factor_value('SERVER', impact_type, 'impact')
+        impact = Impact(value=impact_factor, min=impact_factor, max=impact_factor)
 
         warnings = ["Generic data used for impact calculation."]
 
@@ -429,20 +475,19 @@ def server_impact_embedded(impact_type: str, duration: int, server: DeviceServer
 
 def server_impact_use(impact_type: str, duration: int, server: DeviceServer) -> ComputedImpacts:
     impact_factor = server.usage.elec_factors[impact_type]
-
-    if not server.usage.avg_power.is_set():
-        modeled_consumption = server.model_power_consumption()
-        server.usage.avg_power.set_completed(
-            modeled_consumption.value,
-            min=modeled_consumption.min,
-            max=modeled_consumption.max
-        )
+    complete_avg_power(server)
 
     # Compute impacts at component level
     compute_single_impact(server.cpu, USE, impact_type, duration)
     for ram in server.ram:
         compute_single_impact(ram, USE, impact_type, duration)
 
+    return server_electricity_impact(impact_factor, duration, server)
+
+
+def server_electricity_impact(impact_factor: ImpactFactor, duration: int, server: DeviceServer) -> ComputedImpacts:
+    complete_avg_power(server)
+
     impact = impact_factor.value * (server.usage.avg_power.value / 1000) * server.usage.use_time_ratio.value * duration
     min_impact = impact_factor.min * (server.usage.avg_power.min / 1000) * server.usage.use_time_ratio.min * duration
     max_impact = impact_factor.max * (server.usage.avg_power.max / 1000) * server.usage.use_time_ratio.max * duration
@@ -486,9 +531,8 @@ def cloud_impact_embedded(impact_type: str, duration: int, cloud_instance: Servi
         return sum(impacts), sum(min_impacts), sum(max_impacts), warnings
 
     except NotImplementedError:
-        impact = Impact(value=get_impact_factor(item='SERVER', impact_type=impact_type)["impact"],
-                        min=get_impact_factor(item='SERVER', impact_type=impact_type)["impact"],
-                        max=get_impact_factor(item='SERVER', impact_type=impact_type)["impact"])
+        impact_factor = get_impact_factor_value('SERVER', impact_type, 'impact')
+        impact = Impact(value=impact_factor, min=impact_factor, max=impact_factor)
 
         warnings = ["Generic data used for impact calculation."]
 
@@ -500,20 +544,22 @@ def cloud_impact_embedded(impact_type: str, duration: int, cloud_instance: Servi
 def cloud_impact_use(impact_type: str, duration: int, cloud_instance: ServiceCloudInstance) -> ComputedImpacts:
     platform = cloud_instance.platform
     impact_factor = platform.usage.elec_factors[impact_type]
-
-    if not cloud_instance.usage.avg_power.is_set():
-        modeled_consumption = cloud_instance.model_power_consumption()
-        cloud_instance.usage.avg_power.set_completed(
-            value=modeled_consumption.value,
-            min=modeled_consumption.min,
-            max=modeled_consumption.max
-        )
+    complete_avg_power(cloud_instance)
 
     # Compute impacts at component level
     compute_single_impact(platform.cpu, USE, impact_type, duration)
     for ram in platform.ram:
         compute_single_impact(ram, USE, impact_type, duration)
 
+    return cloud_electricity_impact(impact_factor, duration, cloud_instance)
+
+
+def cloud_electricity_impact(impact_factor: ImpactFactor, duration: int,
+                             cloud_instance: ServiceCloudInstance) -> ComputedImpacts:
+    platform = cloud_instance.platform
+
+    complete_avg_power(cloud_instance)
+
     impact = impact_factor.value * (cloud_instance.usage.avg_power.value / 1000) * platform.usage.use_time_ratio.value * duration
     min_impact = impact_factor.min * (cloud_instance.usage.avg_power.min / 1000) * platform.usage.use_time_ratio.min * duration
     max_impact = impact_factor.max * (cloud_instance.usage.avg_power.max / 1000) * platform.usage.use_time_ratio.max * duration
@@ -651,3 +697,68 @@ impacts_functions = {
         "embedded": iot_functional_blocks_impact_embedded
     },
 }
+
+# Use impact of each use function for a given electricity factor, see electricity_consumption
+electricity_impact_functions = {
+    simple_impact_use: simple_electricity_impact,
+    cpu_impact_use: cpu_electricity_impact,
+    ram_impact_use: ram_electricity_impact,
+    iot_impact_use: iot_electricity_impact,
+    server_impact_use: server_electricity_impact,
+    cloud_impact_use: cloud_electricity_impact,
+}
+
+
+
+def electricity_criteria(name: str) -> FrozenSet[str]:
+    available = get_electrical_factor_criteria()
+    return frozenset(criteria for criteria, (_, criteria_proxy) in ELEC_FACTORS.items() if criteria_proxy in available)
+
+
+def server_embedded_criteria(name: str) -> FrozenSet[str]:
+    # computed from the components, or from the generic server factors when a component cannot be computed
+    return frozenset().union(*(get_factor_criteria(item) for item in
+                               ('SERVER', 'cpu', 'ram', 'ssd', 'hdd', 'motherboard', 'power_supply', 'case', 'assembly')))
+
+
+# Criteria for which an impact function can find its factors, given the model NAME. The embedded impacts of an IoT
+# device are the sum of its functional blocks, if any: they are left to the computation.
+impacts_criteria = {
+    not_implemented_function: lambda name: frozenset(),
+    simple_impact_use: electricity_criteria,
+    cpu_impact_use: electricity_criteria,
+    ram_impact_use: electricity_criteria,
+    iot_impact_use: electricity_criteria,
+    server_impact_use: electricity_criteria,
+    cloud_impact_use: electricity_criteria,
+    simple_embedded: get_factor_criteria,
+    cpu_impact_embedded: lambda name: get_factor_criteria('cpu'),
+    ram_impact_embedded: lambda name: get_factor_criteria('ram'),
+    ssd_impact_embedded: lambda name: get_factor_criteria('ssd'),
+    hdd_impact_embedded: lambda name: get_factor_criteria('hdd'),
+    motherboard_impact_embedded: lambda name: get_factor_criteria('motherboard'),
+    assembly_impact_embedded: lambda name: get_factor_criteria('assembly'),
+    casing_impact_embedded: lambda name: get_factor_criteria('case'),
+    power_supply_impact_embedded: lambda name: get_factor_criteria('power_supply') | get_iot_factor_criteria(
+        get_functional_block(name).IMPACT_KEY),
+    iot_functional_blocks_impact_embedded: lambda name: get_iot_factor_criteria(get_functional_block(name).IMPACT_KEY),
+    server_impact_embedded: server_embedded_criteria,
+    cloud_impact_embedded: server_embedded_criteria,
+}
+
+
+@lru_cache(maxsize=None)
+def impact_capabilities() -> Dict[Tuple[str, str], FrozenSet[str]]:
+    """
+    Criteria that can be computed for each (model NAME, phase), built from the impact factors when they are loaded.
+    Any other criteria is not implemented, (model NAME, phase) pairs missing from the matrix are always computed.
+    A criteria of the matrix can still be not implemented for a given model, e.g. when its average power or its usage
+    location are unknown.
+    """
+    return {(name, phase): impacts_criteria[impact_function](name)
+            for name, functions in impacts_functions.items()
+            for phase, impact_function in functions.items()
+            if impact_function in impacts_criteria}
+
+
+on_data_change(impact_capabilities.cache_clear)
@@ -0,0 +1,64 @@
+"""
+Listings of the data (cpu names, manufacturers, cloud instances...) served as JSON built once per data version.
+"""
+import threading
+from typing import Callable, Dict, List, NamedTuple, Optional, Tuple
+
+from starlette.responses import Response
+
+from boaviztapi.service.serialization import dumps
+from boaviztapi.utils.data_version import current_data_fingerprint
+
+
+class Listing(NamedTuple):
+    items: Tuple[str, ...]
+    folded: Tuple[str, ...]
+    body: bytes
+
+
+def make_listing(items: List[str]) -> Listing:
+    items = tuple(items)
+    return Listing(items, tuple(item.casefold() for item in items), dumps(list(items)))
+
+
+_lock = threading.Lock()
+_listings: Dict[str, Tuple[str, Listing]] = {}
+
+
+def get_listing(name: str, build: Callable[[], List[str]]) -> Listing:
+    """
+    Listing name, built with build() when first needed and again when the data fingerprint changes (checked every
+    data_fingerprint_ttl seconds).
+    """
+    fingerprint = current_data_fingerprint()
+    cached = _listings.get(name)
+    if cached is None or cached[0] != fingerprint:
+        with _lock:
+            cached = _listings.get(name)
+            if cached is None or cached[0] != fingerprint:
+                cached = (fingerprint, make_listing(build()))
+                _listings[name] = cached
+    return cached[1]
+
+
+def clear_listings():
+    with _lock:
+        _listings.clear()
+
+
+def listing_response(listing: Listing, prefix: Optional[str] = None, offset: int = 0,
+                     limit: Optional[int] = None) -> Response:
+    """
+    JSON response of the items of listing starting with prefix (case insensitive), from offset and up to limit.
+    The total number of matching items is given in the X-Total-Count header.
+    """
+    if prefix is None and offset == 0 and limit is None:
+        return Response(content=listing.body, media_type="application/json",
+                        headers={"X-Total-Count": str(len(listing.items))})
+    items = listing.items
+    if prefix:
+        prefix = prefix.casefold()
+        items = [item for item, folded in zip(listing.items, listing.folded) if folded.startswith(prefix)]
+    page = items[offset:] if limit is None else items[offset:offset + limit]
+    return Response(content=dumps(list(page)), media_type="application/json",
+                    headers={"X-Total-Count": str(len(items))})
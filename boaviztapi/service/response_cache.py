@@ -0,0 +1,94 @@
+import hashlib
+import json
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Optional
+
+from boaviztapi import config
+from boaviztapi.dto import BaseDTO
+from boaviztapi.service.execution import single_flight
+from boaviztapi.utils.data_version import current_data_fingerprint
+
+
+def response_key(kind: str, dto: Optional[BaseDTO], **params) -> str:
+    """
+    Canonical hash of a request, from the route kind, its validated body and its query parameters.
+    """
+    normalized = {
+        "kind": kind,
+        "data": dto.dict(exclude_none=True) if dto is not None else None,
+        "params": params
+    }
+    return hashlib.sha256(json.dumps(normalized, sort_keys=True, default=str).encode()).hexdigest()
+
+
+class ResponseCache:
+    """
+    LRU cache of computed responses, with a time to live. Entries are computed from a version of the data: the cache
+    is emptied when the data fingerprint changes. A max_size of 0 disables the cache.
+    """
+
+    def __init__(self, max_size: int = 1024, ttl: Optional[float] = None):
+        self.max_size = max_size
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._fingerprint = None
+        self._lock = threading.Lock()
+
+    def _check_version(self, fingerprint: str):
+        if fingerprint != self._fingerprint:
+            self._entries.clear()
+            self._fingerprint = fingerprint
+
+    def get(self, key: str, fingerprint: str) -> Optional[Any]:
+        with self._lock:
+            self._check_version(fingerprint)
+            entry = self._entries.get(key)
+            if entry is not None and self.ttl is not None and time.monotonic() - entry[0] > self.ttl:
+                del self._entries[key]
+                entry = None
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def put(self, key: str, fingerprint: str, response: Any):
+        with self._lock:
+            self._check_version(fingerprint)
+            self._entries[key] = (time.monotonic(), response)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    async def run(self, key: Optional[str], compute: Callable[..., Awaitable], *args):
+        """
+        Response of key, or await compute(*args) and keep its response. Concurrent computations of the same key are
+        coalesced. Without key, compute is neither cached nor coalesced.
+        """
+        if key is None:
+            return await compute(*args)
+        if self.max_size <= 0:
+            return await single_flight.run(key, compute, *args)
+        fingerprint = current_data_fingerprint()
+        response = self.get(key, fingerprint)
+        if response is None:
+            response = await single_flight.run(f"{fingerprint}:{key}", compute, *args)
+            self.put(key, fingerprint, response)
+        return response
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = 0
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {"size": len(self._entries), "max_size": self.max_size, "hits": self.hits, "misses": self.misses}
+
+
+response_cache = ResponseCache(max_size=config["response_cache_size"], ttl=config["response_cache_ttl"])
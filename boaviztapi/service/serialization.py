@@ -0,0 +1,43 @@
+"""
+JSON encoding of the responses. Impact responses are plain dicts and lists of JSON values: they are encoded directly,
+with orjson when it is installed, rather than going through fastapi's jsonable_encoder which copies them first.
+"""
+import json
+from typing import Any
+
+from fastapi.encoders import jsonable_encoder
+from starlette.responses import Response
+
+try:
+    import orjson
+except ImportError:  # optional dependency
+    orjson = None
+
+
+def _default(value: Any) -> Any:
+    # numpy scalars and arrays, then anything fastapi knows how to encode (pydantic models, enums...)
+    if hasattr(value, "tolist"):
+        return value.tolist()
+    return jsonable_encoder(value)
+
+
+def dumps_json(content: Any) -> bytes:
+    """
+    Compact UTF-8 JSON of content, as written by fastapi.responses.JSONResponse.
+    """
+    return json.dumps(content, ensure_ascii=False, allow_nan=False, indent=None, separators=(",", ":"),
+                      default=_default).encode("utf-8")
+
+
+def dumps_orjson(content: Any) -> bytes:
+    return orjson.dumps(content, default=_default, option=orjson.OPT_SERIALIZE_NUMPY)
+
+
+dumps = dumps_orjson if orjson is not None else dumps_json
+
+
+class ImpactJSONResponse(Response):
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
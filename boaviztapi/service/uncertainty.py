@@ -0,0 +1,106 @@
+"""
+Monte Carlo uncertainty of the impacts of a completed model.
+
+Each numeric attribute with a range (min < max) is replaced by samples of a triangular distribution (min, value, max)
+and the impact formulas are evaluated once over the arrays of samples. Attributes without a numeric range (e.g. the
+case type) and counts of whole things (e.g. the units of a component) keep their value.
+"""
+from typing import Iterator, List, Optional, Union
+
+import boaviztapi.utils.roundit as rd
+from boaviztapi import config
+from boaviztapi.model.boattribute import Boattribute
+from boaviztapi.model.component import Component
+from boaviztapi.model.device import Device
+from boaviztapi.model.impact import IMPACT_PHASES, NOT_IMPLEMENTED
+from boaviztapi.model.services.cloud_instance import Service
+from boaviztapi.model.usage.usage import ElecFactors, ModelUsage
+from boaviztapi.service.impacts_computation import compute_single_impact
+
+COUNT_ATTRIBUTES = ("units", "core_units")
+
+
+def compute_impact_distributions(model: Union[Component, Device, Service], selected_criteria, duration,
+                                 samples: int, percentiles: Optional[List[float]] = None,
+                                 seed: Optional[int] = config["uncertainty_seed"]) -> dict:
+    """
+    Percentiles of the impacts of model over samples draws. The model must have been computed (i.e. completed) for
+    the same criteria and duration; its attributes and impacts are left as they were.
+    """
+    import numpy as np
+
+    if percentiles is None:
+        percentiles = config["uncertainty_percentiles"]
+    rng = np.random.default_rng(seed)
+
+    assessables, attributes = [], []
+    for element in _walk(model, set()):
+        if isinstance(element, Boattribute):
+            if _has_numeric_range(element):
+                attributes.append(element)
+        else:
+            assessables.append(element)
+
+    saved_attributes = [(attribute._value, attribute._min, attribute._max) for attribute in attributes]
+    saved_impacts = [{criteria: dict(phases) for criteria, phases in assessable.impacts.items()}
+                     for assessable in assessables]
+    try:
+        for attribute in attributes:
+            low, high = sorted((attribute._min, attribute._max))
+            mode = min(max(attribute._value, low), high)
+            attribute.value = attribute.min = attribute.max = rng.triangular(low, mode, high, samples)
+
+        distributions = {}
+        for criteria in selected_criteria:
+            distributions[criteria] = {}
+            for phase in IMPACT_PHASES:
+                impact = compute_single_impact(model, phase, criteria, duration)
+                if impact is None:
+                    distributions[criteria][phase] = NOT_IMPLEMENTED
+                    continue
+                values = np.percentile(np.broadcast_to(impact.value, samples), percentiles)
+                distributions[criteria][phase] = {f"p{percentile:g}": rd.round_to_sigfig(float(value),
+                                                                                         config["max_sig_fig"])
+                                                  for percentile, value in zip(percentiles, values)}
+    finally:
+        for attribute, (value, min_value, max_value) in zip(attributes, saved_attributes):
+            attribute._value, attribute._min, attribute._max = value, min_value, max_value
+        for assessable, impacts in zip(assessables, saved_impacts):
+            assessable.impacts = impacts
+
+    return {"samples": samples, "impacts": distributions}
+
+
+def _walk(element, seen: set) -> Iterator[Union[Boattribute, Component, Device, Service]]:
+    """
+    Boattributes and assessable elements reachable from element, each once: attributes shared by several
+    elements (e.g. the lifetime of a server and of its components) are drawn once.
+    """
+    if id(element) in seen:
+        return
+    seen.add(id(element))
+    if isinstance(element, Boattribute):
+        yield element
+    elif isinstance(element, (list, tuple)):
+        for item in element:
+            yield from _walk(item, seen)
+    elif isinstance(element, ElecFactors):
+        for factor in element.values():
+            yield from _walk(factor, seen)
+    elif isinstance(element, (Component, Device, Service, ModelUsage)):
+        if not isinstance(element, ModelUsage):
+            yield element
+        for name, value in element:
+            if name not in COUNT_ATTRIBUTES:
+                yield from _walk(value, seen)
+
+
+def _is_number(value) -> bool:
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def _has_numeric_range(attribute: Boattribute) -> bool:
+    if not attribute.is_set() or not _is_number(attribute._value):
+        return False
+    # a missing min or max is the value itself
+    return _is_number(attribute._min) and _is_number(attribute._max) and attribute._min != attribute._max
@@ -1,3 +1,5 @@
+from typing import Optional
+
 from boaviztapi import config
 from boaviztapi.model.boattribute import Boattribute
 from boaviztapi.model.device import Device
@@ -6,14 +8,16 @@ from boaviztapi.model.services.cloud_instance import ServiceCloudInstance, Servi
 
 
 def verbose_cloud(cloud_instance: ServiceCloudInstance, selected_criteria=config["default_criteria"],
-                  duration=config["default_duration"]):
-    json_output = {**iter_boattribute(cloud_instance),
-                   **verbose_usage(cloud_instance),
-                   **verbose_device(cloud_instance.platform, selected_criteria=selected_criteria, duration=duration)}
+                  duration=config["default_duration"], index: Optional[int] = None):
+    json_output = iter_boattribute(cloud_instance)
+    verbose_usage(cloud_instance, json_output)
+    json_output.update(verbose_device(cloud_instance.platform, selected_criteria=selected_criteria, duration=duration,
+                                      index=index))
     return json_output
 
 
-def verbose_device(device: Device, selected_criteria=config["default_criteria"], duration=config["default_duration"]):
+def verbose_device(device: Device, selected_criteria=config["default_criteria"], duration=config["default_duration"],
+                   index: Optional[int] = None):
     json_output = {"duration": {"value": duration, "unit": "hours"}}
     for component in device.components:
         component.usage.hours_life_time.set_completed(device.usage.hours_life_time.value,
@@ -27,15 +31,16 @@ def verbose_device(device: Device, selected_criteria=config["default_criteria"],
         else:
             key = f"{component.NAME}-1"
 
-        json_output[key] = verbose_component(component, selected_criteria, duration)
+        json_output[key] = verbose_component(component, selected_criteria, duration, index)
 
-    json_output = {**json_output, **verbose_usage(device), **iter_boattribute(device)}
+    verbose_usage(device, json_output)
+    iter_boattribute(device, json_output)
 
     return json_output
 
 
-def verbose_usage(device: [Device, Component, Service]):
-    json_output = {**iter_boattribute(device.usage)}
+def verbose_usage(device: [Device, Component, Service], json_output: Optional[dict] = None):
+    json_output = iter_boattribute(device.usage, json_output)
     if device.usage.consumption_profile is not None:
         if device.usage.consumption_profile.workloads.is_set():
             json_output["workloads"] = device.usage.consumption_profile.workloads.to_json()
@@ -52,18 +57,22 @@ def verbose_usage(device: [Device, Component, Service]):
 
 
 def verbose_component(component: Component, selected_criteria=config["default_criteria"],
-                      duration=config["default_duration"]):
-    json_output = {"impacts": component.get_impacts(selected_criteria), **iter_boattribute(component),
-                   "duration": {"value": duration, "unit": "hours"}}
+                      duration=config["default_duration"], index: Optional[int] = None):
+    json_output = iter_boattribute(component, {"impacts": component.get_impacts(selected_criteria, index)})
+    json_output["duration"] = {"value": duration, "unit": "hours"}
 
     if component.usage.avg_power.is_set():
-        json_output = {**json_output, **verbose_usage(component)}
+        verbose_usage(component, json_output)
 
     return json_output
 
 
-def iter_boattribute(element):
-    json_output = {}
+def iter_boattribute(element, json_output: Optional[dict] = None):
+    """
+    Adds the set boattributes of element to json_output (a new dict by default), which is returned.
+    """
+    if json_output is None:
+        json_output = {}
     for attr, val in element.__iter__():
         if not isinstance(val, Boattribute):
             continue
@@ -0,0 +1,163 @@
+"""
+Binary snapshot of the data directory.
+
+Parsing factors.yml and the csv tables dominates the cold start of the API. The snapshot stores them already
+parsed (yaml documents, pickled DataFrames, archetype indexes) together with the fingerprint of the sources.
+It is used only when it matches the current sources, the files are read otherwise.
+
+    python -m boaviztapi.utils.data_snapshot [path]
+"""
+import logging
+import os
+import pickle
+import sys
+import threading
+from functools import lru_cache
+from pathlib import Path
+from typing import Optional, TYPE_CHECKING
+
+import yaml
+
+from boaviztapi import data_dir
+from boaviztapi.utils.data_version import data_files, data_fingerprint, on_data_change
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+SNAPSHOT_VERSION = 1
+
+_logger = logging.getLogger(__name__)
+
+try:
+    _YamlLoader = yaml.CSafeLoader
+except AttributeError:
+    _YamlLoader = yaml.SafeLoader
+
+
+def snapshot_path() -> str:
+    return os.getenv("BOAVIZTAPI_DATA_SNAPSHOT", os.path.join(data_dir, "data_snapshot.pickle"))
+
+
+def _parse_yaml(path: str):
+    return yaml.load(Path(path).read_text(), Loader=_YamlLoader)
+
+
+def build_snapshot(path: Optional[str] = None, directory: str = data_dir) -> dict:
+    import pandas as pd
+    from boaviztapi.service.archetype import load_archetype_index
+
+    snapshot = {
+        "version": SNAPSHOT_VERSION,
+        "fingerprint": data_fingerprint(directory),
+        "yaml": {},
+        "tables": {},
+        "archetypes": {},
+    }
+    for relative_path in data_files(directory):
+        source = os.path.join(directory, relative_path)
+        if relative_path.endswith(".csv"):
+            try:
+                table = pd.read_csv(source)
+            except pd.errors.EmptyDataError:
+                continue
+            # DataFrames are kept pickled so that only the tables actually used are deserialized
+            snapshot["tables"][relative_path] = pickle.dumps(table, protocol=pickle.HIGHEST_PROTOCOL)
+            if relative_path.startswith("archetypes") and "id" in table.columns:
+                snapshot["archetypes"][relative_path] = load_archetype_index(source)
+        else:
+            snapshot["yaml"][relative_path] = _parse_yaml(source)
+
+    if path:
+        tmp_path = path + ".tmp"
+        with open(tmp_path, "wb") as f:
+            pickle.dump(snapshot, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, path)
+    return snapshot
+
+
+def load_snapshot(path: str, directory: str = data_dir) -> Optional[dict]:
+    """
+    Returns the snapshot stored at path, or None if it is missing, unreadable or built from other sources.
+    """
+    if not os.path.exists(path):
+        return None
+    try:
+        with open(path, "rb") as f:
+            snapshot = pickle.load(f)
+    except Exception:
+        _logger.warning("Unreadable data snapshot %s, reading the data files", path, exc_info=True)
+        return None
+    if not isinstance(snapshot, dict) or snapshot.get("version") != SNAPSHOT_VERSION:
+        _logger.warning("Data snapshot %s has another format version, reading the data files", path)
+        return None
+    if snapshot.get("fingerprint") != data_fingerprint(directory):
+        _logger.warning("Data snapshot %s is stale, reading the data files", path)
+        return None
+    return snapshot
+
+
+_lock = threading.Lock()
+_loaded = False
+_snapshot = None
+
+
+def get_snapshot() -> Optional[dict]:
+    global _loaded, _snapshot
+    if not _loaded:
+        with _lock:
+            if not _loaded:
+                _snapshot = load_snapshot(snapshot_path())
+                _loaded = True
+    return _snapshot
+
+
+@on_data_change
+def reset_snapshot():
+    global _loaded, _snapshot
+    with _lock:
+        _loaded, _snapshot = False, None
+
+
+def _lookup(section: str, path: str):
+    snapshot = get_snapshot()
+    if snapshot is None:
+        return None
+    relative_path = os.path.relpath(os.path.abspath(path), os.path.abspath(data_dir))
+    return snapshot[section].get(relative_path)
+
+
+def read_csv(path: str) -> "pd.DataFrame":
+    table = _lookup("tables", path)
+    if table is None:
+        import pandas as pd
+        return pd.read_csv(path)
+    return pickle.loads(table)
+
+
+@lru_cache(maxsize=None)
+def data_table(relative_path: str) -> "pd.DataFrame":
+    """
+    Table of the data directory, read when first needed and shared by every caller: it must not be modified.
+    """
+    return read_csv(os.path.join(data_dir, relative_path))
+
+
+on_data_change(data_table.cache_clear)
+
+
+def load_yaml(path: str):
+    document = _lookup("yaml", path)
+    if document is None:
+        return _parse_yaml(path)
+    return document
+
+
+def snapshot_archetype_index(csv_path: str) -> Optional[dict]:
+    return _lookup("archetypes", csv_path)
+
+
+if __name__ == '__main__':
+    target = sys.argv[1] if len(sys.argv) > 1 else snapshot_path()
+    content = build_snapshot(target)
+    print(f"{len(content['yaml'])} yaml files, {len(content['tables'])} tables and "
+          f"{len(content['archetypes'])} archetype files written to {target}")
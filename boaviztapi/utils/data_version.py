@@ -0,0 +1,95 @@
+import hashlib
+import os
+import threading
+import time
+from typing import Callable, Optional, Tuple
+
+from boaviztapi import config, data_dir
+
+# Files read by the API. Generated files (cloud impact table, data snapshot) and the
+# maintenance scripts of data/utils are not part of the fingerprint.
+DATA_FILE_EXTENSIONS = ('.csv', '.yml', '.yaml')
+EXCLUDED_DIRECTORIES = ('utils', '__pycache__')
+
+_lock = threading.Lock()
+_fingerprints = {}
+_listeners = []
+# fingerprint of data_dir and when it was checked, for current_data_fingerprint
+_current: Optional[Tuple[str, float]] = None
+
+
+def on_data_change(listener: Callable[[], None]) -> Callable[[], None]:
+    """
+    Registers listener, called when data_fingerprint finds that the files of the data directory changed since its
+    previous call. Caches of data loaded by the process register their clear function.
+    """
+    _listeners.append(listener)
+    return listener
+
+
+def data_files(directory: str = data_dir) -> list:
+    """
+    Relative paths of the source data files, sorted.
+    """
+    paths = []
+    for root, directories, files in os.walk(directory):
+        directories[:] = [d for d in directories if d not in EXCLUDED_DIRECTORIES]
+        for name in files:
+            if name.endswith(DATA_FILE_EXTENSIONS):
+                paths.append(os.path.relpath(os.path.join(root, name), directory))
+    return sorted(paths)
+
+
+def _stat_signature(directory: str) -> tuple:
+    signature = []
+    for relative_path in data_files(directory):
+        stat = os.stat(os.path.join(directory, relative_path))
+        signature.append((relative_path, stat.st_size, stat.st_mtime_ns))
+    return tuple(signature)
+
+
+def data_fingerprint(directory: str = data_dir) -> str:
+    """
+    Content hash of the source data files (archetypes, factors, config...).
+    The hash is recomputed only when a file is added, removed or modified.
+    """
+    global _current
+    signature = _stat_signature(directory)
+    with _lock:
+        cached = _fingerprints.get(directory)
+        if cached is None or cached[0] != signature:
+            sha = hashlib.sha256()
+            for relative_path, _, _ in signature:
+                sha.update(relative_path.encode())
+                with open(os.path.join(directory, relative_path), 'rb') as f:
+                    sha.update(f.read())
+            changed = cached is not None and cached[1] != sha.hexdigest()
+            cached = (signature, sha.hexdigest())
+            _fingerprints[directory] = cached
+            if changed and directory == data_dir:
+                # under the lock: the new fingerprint is not returned before the stale data are dropped
+                for listener in _listeners:
+                    listener()
+        if directory == data_dir:
+            _current = (cached[1], time.monotonic())
+        return cached[1]
+
+
+def current_data_fingerprint() -> str:
+    """
+    Fingerprint of the data directory for the checks made on each request: the files are checked again by
+    data_fingerprint at most every data_fingerprint_ttl seconds (on every call when empty), or after reload_data().
+    """
+    current = _current
+    ttl = config["data_fingerprint_ttl"]
+    if current is None or ttl is None or time.monotonic() - current[1] >= ttl:
+        return data_fingerprint()
+    return current[0]
+
+
+def reload_data():
+    """
+    Checks the data files at the next current_data_fingerprint call, whatever data_fingerprint_ttl.
+    """
+    global _current
+    _current = None
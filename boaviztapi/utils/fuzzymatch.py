@@ -1,38 +1,102 @@
-import pandas as pd
-from pandas.core.series import Series
-from rapidfuzz import process, fuzz
-from typing import Tuple, Union
+import math
+import threading
+import weakref
+from typing import Dict, Tuple, Union, List, Optional, Iterable, TYPE_CHECKING
 
 from boaviztapi import config
 
+# numpy, pandas and rapidfuzz are imported when a match is first needed, not with the API
+if TYPE_CHECKING:
+    import pandas as pd
+
+CPUAttributes = Tuple[str, str, str, str, int, int, int, int, str, str]
+
+
+class CPUNameIndex:
+    """
+    CPU names from a cpu specs dataframe, normalized once, and matched with rapidfuzz bulk scorers.
+    """
+    _ATTRIBUTES = ["name", "manufacturer", "code_name", "model_range", "tdp", "cores", "threads",
+                   "total_die_size", "total_die_size_source", "source"]
+    _INT_ATTRIBUTES = {"tdp", "cores", "threads", "total_die_size"}
+
+    def __init__(self, df: "pd.DataFrame"):
+        self._names = [str(name).lower() for name in df["name"]]
+        self._rows = [self._to_attributes(row) for row in df[self._ATTRIBUTES].itertuples(index=False)]
+
+    def __len__(self):
+        return len(self._names)
+
+    def best(self, cpu_name: str) -> Optional[Tuple[int, float]]:
+        from rapidfuzz import process, fuzz
+
+        result = process.extractOne(cpu_name.lower(), self._names, scorer=fuzz.token_set_ratio, processor=None)
+        if result is None:
+            return None
+        _, score, position = result
+        return position, score
+
+    def match(self, cpu_name: str) -> Optional[CPUAttributes]:
+        best = self.best(cpu_name)
+        if best is None:
+            return None
+        return self._attributes_if_above_threshold(*best)
+
+    def match_many(self, cpu_names: Iterable[str], workers: int = 1) -> List[Optional[CPUAttributes]]:
+        import numpy as np
+        from rapidfuzz import process, fuzz
+
+        queries = [cpu_name.lower() for cpu_name in cpu_names]
+        if not queries:
+            return []
+        scores = process.cdist(queries, self._names, scorer=fuzz.token_set_ratio, processor=None,
+                               dtype=np.float64, workers=workers)
+        positions = scores.argmax(axis=1)
+        return [self._attributes_if_above_threshold(position, scores[i, position])
+                for i, position in enumerate(positions)]
+
+    def _attributes_if_above_threshold(self, position: int, score: float) -> Optional[CPUAttributes]:
+        if score <= config["cpu_name_fuzzymatch_threshold"]:
+            return None
+        return self._rows[position]
+
+    @classmethod
+    def _to_attributes(cls, row) -> CPUAttributes:
+        attributes = []
+        for attribute, value in zip(cls._ATTRIBUTES, row):
+            if value is None or (isinstance(value, float) and math.isnan(value)):
+                value = None  # replace all NaN by None
+            elif attribute in cls._INT_ATTRIBUTES:
+                value = int(value)
+            attributes.append(value)
+        return tuple(attributes)
+
+
+_indexes_lock = threading.Lock()
+# id of a dataframe -> its index, dropped when the dataframe is garbage collected
+_indexes: Dict[int, CPUNameIndex] = {}
+
+
+def cpu_name_index(df: "pd.DataFrame") -> CPUNameIndex:
+    """
+    Index of the CPU names of df, built once per dataframe: df must not be modified afterwards.
+    """
+    with _indexes_lock:
+        index = _indexes.get(id(df))
+        if index is None:
+            index = CPUNameIndex(df)
+            _indexes[id(df)] = index
+            weakref.finalize(df, _indexes.pop, id(df), None)
+        return index
+
+
+def fuzzymatch_attr_from_cpu_name(cpu_name: str, df: "pd.DataFrame") -> Union[CPUAttributes, None]:
+    return cpu_name_index(df).match(cpu_name)
+
+
+def fuzzymatch_attr_from_pdf(name: str, attr: str, pdf: "pd.DataFrame") -> str:
+    from rapidfuzz import process, fuzz
 
-def fuzzymatch_attr_from_cpu_name(cpu_name: str, df: pd.DataFrame) -> Union[
-    Tuple[str, str, str, str, int, int, int, int, str, str], None]:
-    cpu_name = cpu_name.lower()
-    score = df["name"].str.lower().apply(lambda x: fuzz.token_set_ratio(x, cpu_name))
-    max_score = score.max()
-    if max_score <= config["cpu_name_fuzzymatch_threshold"]:
-        return None
-    else:
-        best = df.iloc[score.idxmax()]
-        best = best.mask(best.isnull(), None)  # replace all NaN by None
-        safe_int = lambda x: x if x is None else int(x)  # float to int but keep None
-
-        return (
-            best["name"],  # .name is reserved by pandas for indexes
-            best.manufacturer,
-            best.code_name,
-            best.model_range,
-            safe_int(best.tdp),
-            safe_int(best.cores),
-            safe_int(best.threads),
-            safe_int(best.total_die_size),
-            best.total_die_size_source,
-            best.source,
-        )
-
-
-def fuzzymatch_attr_from_pdf(name: str, attr: str, pdf: pd.DataFrame) -> str:
     name_list = list(pdf[attr].unique())
 
     result = process.extractOne(name, name_list, scorer=fuzz.WRatio)
@@ -41,9 +105,13 @@ def fuzzymatch_attr_from_pdf(name: str, attr: str, pdf: pd.DataFrame) -> str:
     return result or None
 
 
-def fuzzymatch(s: pd.Series, value: str, threshold: float = 90.0) -> pd.Series:
+def fuzzymatch(s: "pd.Series", value: str, threshold: float = 90.0) -> "pd.Series":
+    from rapidfuzz import fuzz
+
     return s.apply(lambda x: fuzz.token_sort_ratio(x.lower(), value.lower()) >= threshold)
 
 
 def pandas() -> None:
+    from pandas import Series
+
     Series.fuzzymatch = fuzzymatch
@@ -0,0 +1,117 @@
+import pytest
+from httpx import AsyncClient
+
+from boaviztapi.main import app
+
+pytest_plugins = ('pytest_asyncio',)
+
+
+@pytest.mark.asyncio
+async def test_batch_matches_single_routes():
+    async with AsyncClient(app=app, base_url="http://test") as ac:
+        server = await ac.get('/v1/server/?verbose=false&criteria=gwp')
+        cloud = await ac.post('/v1/cloud/instance?verbose=false&criteria=gwp&duration=8760', json={
+            "provider": "aws", "instance_type": "a1.4xlarge", "usage": {"time_workload": 50}})
+        res = await ac.post('/v1/batch', json=[
+            {"id": "server-1", "type": "server", "criteria": ["gwp"]},
+            {"id": "cloud-1", "type": "cloud_instance", "criteria": ["gwp"], "duration": 8760,
+             "data": {"provider": "aws", "instance_type": "a1.4xlarge", "usage": {"time_workload": 50}}}
+        ])
+
+    assert res.status_code == 200
+    items = res.json()["items"]
+    assert [item["id"] for item in items] == ["server-1", "cloud-1"]
+    assert items[0]["impacts"] == server.json()["impacts"]
+    assert items[1]["impacts"] == cloud.json()["impacts"]
+
+    aggregate = res.json()["aggregate"]
+    assert list(aggregate) == ["gwp"]
+    for bound in ("min", "max"):
+        assert aggregate["gwp"]["embedded"][bound] == pytest.approx(
+            server.json()["impacts"]["gwp"]["embedded"][bound] + cloud.json()["impacts"]["gwp"]["embedded"][bound],
+            rel=1e-3)
+
+
+@pytest.mark.asyncio
+async def test_batch_item_errors_do_not_fail_the_batch():
+    async with AsyncClient(app=app, base_url="http://test") as ac:
+        res = await ac.post('/v1/batch', json=[
+            {"id": "unknown-type", "type": "mainframe"},
+            {"id": "unknown-archetype", "type": "server", "archetype": "not_an_archetype"},
+            {"id": "unknown-instance", "type": "cloud_instance", "data": {"provider": "aws", "instance_type": "xx"}},
+            {"id": "laptop", "type": "laptop", "criteria": ["gwp"]}
+        ])
+
+    assert res.status_code == 200
+    items = res.json()["items"]
+    assert items[0] == {"id": "unknown-type", "type": "mainframe",
+                        "error": items[0]["error"]} and items[0]["error"].startswith("Unknown item type mainframe")
+    assert items[1]["error"] == "not_an_archetype not found"
+    assert items[2]["error"] == "xx at aws not found"
+    assert "impacts" in items[3]
+    assert res.json()["aggregate"]["gwp"]["embedded"] == items[3]["impacts"]["gwp"]["embedded"]
+
+
+@pytest.mark.asyncio
+async def test_batch_identical_items_are_computed_once(monkeypatch):
+    import boaviztapi.service.batch_computation as batch_computation
+    computed = []
+    compute_batch_item = batch_computation.compute_batch_item
+
+    def counted_compute_batch_item(item, dto=None):
+        computed.append(item.id)
+        return compute_batch_item(item, dto)
+
+    monkeypatch.setattr(batch_computation, "compute_batch_item", counted_compute_batch_item)
+
+    async with AsyncClient(app=app, base_url="http://test") as ac:
+        res = await ac.post('/v1/batch', json=[
+            {"id": "a", "type": "cloud_instance", "data": {"provider": "aws", "instance_type": "a1.large"}},
+            {"id": "b", "type": "cloud_instance", "data": {"instance_type": "a1.large", "provider": "aws"}},
+            {"id": "c", "type": "cloud_instance", "data": {"provider": "aws", "instance_type": "a1.large"},
+             "units": 3},
+            {"id": "d", "type": "server"},
+        ])
+
+    assert sorted(computed) == ["a", "d"]
+    items = res.json()["items"]
+    assert [item["id"] for item in items] == ["a", "b", "c", "d"]
+    assert items[0]["impacts"] == items[1]["impacts"]
+
+    single = items[0]["impacts"]["gwp"]["embedded"]
+    assert items[2]["impacts"]["gwp"]["embedded"]["min"] == pytest.approx(3 * single["min"], rel=1e-3)
+
+    server = items[3]["impacts"]["gwp"]["embedded"]
+    assert res.json()["aggregate"]["gwp"]["embedded"]["max"] == pytest.approx(5 * single["max"] + server["max"],
+                                                                               rel=1e-3)
+
+
+@pytest.mark.asyncio
+async def test_batch_rejects_zero_units():
+    async with AsyncClient(app=app, base_url="http://test") as ac:
+        res = await ac.post('/v1/batch', json=[{"id": "none", "type": "server", "units": 0}])
+
+    assert res.status_code == 422
+    assert res.json()["detail"][0]["loc"] == ["body", 0, "units"]
+
+
+@pytest.mark.asyncio
+async def test_batch_items_run_in_worker_processes(monkeypatch):
+    from boaviztapi.service import execution
+    batch = [
+        {"id": "server", "type": "server", "criteria": ["gwp", "pe"]},
+        {"id": "laptop", "type": "laptop", "units": 2},
+        {"id": "cpu", "type": "cpu", "data": {"core_units": 24, "die_size_per_core": 24.5}},
+    ]
+    async with AsyncClient(app=app, base_url="http://test") as ac:
+        inline = await ac.post('/v1/batch', json=batch)
+
+        executor = execution.ComputeExecutor(strategy=execution.PROCESS, workers=2)
+        monkeypatch.setattr(execution, "compute_executor", executor)
+        try:
+            res = await ac.post('/v1/batch', json=batch)
+        finally:
+            executor.shutdown()
+
+    assert res.status_code == 200
+    assert res.json() == inline.json()
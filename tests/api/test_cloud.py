@@ -1270,3 +1270,83 @@ async def test_verbose():
             }
         }
     }
+
+
+@pytest.mark.asyncio
+async def test_get_served_from_cloud_impact_table(monkeypatch):
+    from boaviztapi.routers import cloud_router
+    from boaviztapi.service.cloud_impact_table import CloudImpactTable
+
+    table = CloudImpactTable()
+    table.build(instances=[("aws", "a1.large")])
+    monkeypatch.setattr(cloud_router, "cloud_impact_table", table)
+
+    async with AsyncClient(app=app, base_url="http://test") as ac:
+        res = await ac.get('/v1/cloud/instance?provider=aws&instance_type=a1.large&verbose=false')
+        res_verbose = await ac.get('/v1/cloud/instance?provider=aws&instance_type=a1.large&verbose=true')
+
+    assert res.json() == {"impacts": table.get("aws", "a1.large", ["gwp", "adp", "pe"])}
+    assert res.json()["impacts"] == res_verbose.json()["impacts"]
+
+
+@pytest.mark.asyncio
+async def test_cloud_durations():
+    async with AsyncClient(app=app, base_url="http://test") as ac:
+        res = await ac.get('/v1/cloud/instance?provider=aws&instance_type=a1.4xlarge&verbose=false'
+                           '&duration=8760&duration=17520')
+
+        assert len(res.json()) == 2
+        for result in res.json():
+            single = await ac.get('/v1/cloud/instance?provider=aws&instance_type=a1.4xlarge&verbose=false'
+                                  f'&duration={result["duration"]}')
+            assert result["impacts"] == single.json()["impacts"]
+
+
+@pytest.mark.asyncio
+async def test_cloud_usage_locations():
+    async with AsyncClient(app=app, base_url="http://test") as ac:
+        res = await ac.post('/v1/cloud/instance?verbose=false&usage_locations=FRA&usage_locations=DEU'
+                            '&criteria=gwp&criteria=ir',
+                            json={"provider": "aws", "instance_type": "a1.4xlarge"})
+        results = res.json()
+
+        assert list(results["use"]) == ["FRA", "DEU"]
+        for usage_location, use in results["use"].items():
+            single = await ac.post('/v1/cloud/instance?verbose=false&criteria=gwp&criteria=ir',
+                                   json={"provider": "aws", "instance_type": "a1.4xlarge",
+                                         "usage": {"usage_location": usage_location}})
+            for criteria, impacts in single.json()["impacts"].items():
+                assert use[criteria] == impacts["use"]
+                assert results["impacts"][criteria]["embedded"] == impacts["embedded"]
+
+
+@pytest.mark.asyncio
+async def test_cloud_all_usage_locations():
+    async with AsyncClient(app=app, base_url="http://test") as ac:
+        res = await ac.get('/v1/cloud/instance?provider=aws&instance_type=a1.4xlarge&verbose=false'
+                           '&usage_locations=all')
+
+        assert len(res.json()["use"]) > 100
+        assert "use" not in res.json()["impacts"]["gwp"]
+
+
+@pytest.mark.asyncio
+async def test_cloud_usage_locations_errors():
+    async with AsyncClient(app=app, base_url="http://test") as ac:
+        res = await ac.get('/v1/cloud/instance?verbose=false&usage_locations=FRA&usage_locations=XYZ')
+        assert res.status_code == 400
+        assert "XYZ" in res.json()["detail"]
+
+        res = await ac.get('/v1/cloud/instance?verbose=true&usage_locations=FRA')
+        assert res.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_all_instances_pagination():
+    async with AsyncClient(app=app, base_url="http://test") as ac:
+        instances = (await ac.get('/v1/cloud/instance/all_instances?provider=aws')).json()
+        res = await ac.get('/v1/cloud/instance/all_instances?provider=aws&prefix=C5.&offset=2&limit=3')
+
+        c5 = [instance for instance in instances if instance.startswith("c5.")]
+        assert res.json() == c5[2:5]
+        assert res.headers["x-total-count"] == str(len(c5))
@@ -706,4 +706,27 @@ async def test_empty_blade():
                                                           'warnings': ['End of life is not included in the '
                                                                        'calculation']},
                                              'unit': 'MJ',
-                                             'use': 'not implemented'}}}
\ No newline at end of file
+                                             'use': 'not implemented'}}}
+
+@pytest.mark.asyncio
+async def test_cpu_durations():
+    async with AsyncClient(app=app, base_url="http://test") as ac:
+        res = await ac.post('/v1/component/cpu?verbose=false&duration=1000&duration=2000&duration=4000',
+                            json={"core_units": 12, "die_size_per_core": 24.5})
+
+        for result in res.json():
+            single = await ac.post(f'/v1/component/cpu?verbose=false&duration={result["duration"]}',
+                                   json={"core_units": 12, "die_size_per_core": 24.5})
+            assert result == {"duration": result["duration"], **single.json()}
+
+
+@pytest.mark.asyncio
+async def test_cpu_durations_verbose_beyond_life_time():
+    async with AsyncClient(app=app, base_url="http://test") as ac:
+        res = await ac.get('/v1/component/cpu?verbose=true&duration=100&duration=50000&criteria=gwp&criteria=pe')
+
+        for result in res.json():
+            single = await ac.get(f'/v1/component/cpu?verbose=true&duration={result["duration"]}'
+                                  f'&criteria=gwp&criteria=pe')
+            assert result == {"duration": result["duration"], **single.json()}
+            assert set(result["verbose"]["impacts"]) == {"gwp", "pe"}
@@ -0,0 +1,16 @@
+import pytest
+from httpx import AsyncClient
+
+from boaviztapi.main import app
+
+pytest_plugins = ('pytest_asyncio',)
+
+
+@pytest.mark.asyncio
+async def test_monitor_duration():
+    async with AsyncClient(app=app, base_url="http://test") as ac:
+        res = await ac.get('/v1/peripheral/monitor?verbose=false&duration=100')
+        assert res.status_code == 200
+
+        res = await ac.get('/v1/peripheral/monitor?verbose=false&duration=100&duration=200')
+        assert [result["duration"] for result in res.json()] == [100, 200]
@@ -2,6 +2,7 @@ import pytest
 from httpx import AsyncClient
 
 from boaviztapi.main import app
+from boaviztapi.service.response_cache import response_cache
 
 pytest_plugins = ('pytest_asyncio',)
 
@@ -482,4 +483,90 @@ async def test_empty_config_server_generic_criteria():
                       'unit': 'MJ',
                       'use': {'max': 6660000.0,
                               'min': 85.67,
-                              'value': 200000.0}}}}
\ No newline at end of file
+                              'value': 200000.0}}}}
+
+@pytest.mark.asyncio
+async def test_server_durations():
+    async with AsyncClient(app=app, base_url="http://test") as ac:
+        res = await ac.get('/v1/server/?verbose=true&duration=8760&duration=100000&criteria=gwp&criteria=pe')
+        results = res.json()
+
+        assert [result["duration"] for result in results] == [8760, 100000]
+        for result in results:
+            single = await ac.get(f'/v1/server/?verbose=true&duration={result["duration"]}&criteria=gwp&criteria=pe')
+            assert result["impacts"] == single.json()["impacts"]
+            assert result["verbose"] == single.json()["verbose"]
+
+
+@pytest.mark.asyncio
+async def test_server_samples():
+    async with AsyncClient(app=app, base_url="http://test") as ac:
+        res = await ac.get('/v1/server/?verbose=false&samples=1000&criteria=gwp')
+
+        assert res.json()["uncertainty"]["samples"] == 1000
+        assert set(res.json()["uncertainty"]["impacts"]["gwp"]["use"]) == {"p5", "p50", "p95"}
+
+        res = await ac.get('/v1/server/?verbose=false&samples=1000&duration=1&duration=2')
+        assert res.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_server_response_cache():
+    async with AsyncClient(app=app, base_url="http://test") as ac:
+        first = await ac.get('/v1/server/?verbose=false&criteria=ir')
+        hits = response_cache.hits
+        second = await ac.get('/v1/server/?verbose=false&criteria=ir')
+
+        assert response_cache.hits == hits + 1
+        assert second.json() == first.json()
+
+
+@pytest.mark.asyncio
+async def test_server_archetypes_etag():
+    async with AsyncClient(app=app, base_url="http://test") as ac:
+        res = await ac.get('/v1/server/archetypes')
+        etag = res.headers["etag"]
+
+        assert res.headers["cache-control"] == "public, max-age=3600"
+        not_modified = await ac.get('/v1/server/archetypes', headers={"If-None-Match": etag})
+        assert not_modified.status_code == 304
+        assert not_modified.content == b""
+
+        other = await ac.get('/v1/server/?verbose=false&criteria=gwp', headers={"If-None-Match": etag})
+        assert other.status_code == 200
+        assert other.headers["etag"] != etag
+
+        res = await ac.post('/v1/server/?verbose=false', json={})
+        assert "etag" not in res.headers
+
+
+@pytest.mark.asyncio
+async def test_if_none_match_any_does_not_skip_the_route():
+    async with AsyncClient(app=app, base_url="http://test") as ac:
+        res = await ac.get('/v1/server/archetype_config?archetype=unknown', headers={"If-None-Match": "*"})
+        assert res.status_code == 404
+
+        res = await ac.get('/v1/server/archetypes', headers={"If-None-Match": "*"})
+        assert res.status_code == 200
+
+
+@pytest.mark.asyncio
+async def test_etag_does_not_walk_the_data_on_each_request(monkeypatch):
+    from boaviztapi.utils import data_version
+    walks = []
+    stat_signature = data_version._stat_signature
+
+    def counted_stat_signature(directory):
+        walks.append(directory)
+        return stat_signature(directory)
+
+    monkeypatch.setattr(data_version, "_stat_signature", counted_stat_signature)
+    data_version.reload_data()
+    async with AsyncClient(app=app, base_url="http://test") as ac:
+        res = await ac.get('/v1/server/?verbose=false&criteria=gwp')
+        await ac.get('/v1/server/?verbose=false&criteria=gwp')
+        not_modified = await ac.get('/v1/server/?verbose=false&criteria=gwp',
+                                    headers={"If-None-Match": res.headers["etag"]})
+
+    assert not_modified.status_code == 304
+    assert len(walks) == 1
@@ -21,3 +21,21 @@ def test_allocate_():
     assert i2.value == 50
     assert i3.value == 0
     assert i4.value == 100
+
+
+def test_allocate_durations_leaves_life_time_bounds_unset():
+    import numpy as np
+
+    component = Component()
+    component.usage = ModelUsage(archetype={})
+    component.usage.hours_life_time.value = 2000
+
+    impact = Impact(value=100, min=100, max=100)
+    impact.allocate(np.array([1000., 4000.]), component.usage.hours_life_time)
+
+    assert list(impact.value) == [50, 100]
+    assert component.usage.hours_life_time.bounds() == (2000, 2000)
+    assert (component.usage.hours_life_time._min, component.usage.hours_life_time._max) == (None, None)
+    with component.usage.hours_life_time.read_bounds():
+        assert (component.usage.hours_life_time._min, component.usage.hours_life_time._max) == (2000, 2000)
+    assert (component.usage.hours_life_time._min, component.usage.hours_life_time._max) == (None, None)
@@ -1,8 +1,9 @@
 import os
+import pickle
 
 import pytest
 
-from boaviztapi.service.archetype import get_archetype
+from boaviztapi.service.archetype import get_archetype, get_arch_component
 from tests.unit import data_dir
 
 pytest_plugins = ('pytest_asyncio',)
@@ -42,3 +43,71 @@ async def test_get_server_archetype_dellr740():
                   'use_time_ratio': {'default': 1.0}},
         'WARNINGS': {},
         'manufacturer': {'default': 'Dell'}}
+
+
+def test_archetype_registry_loads_each_file_once(monkeypatch):
+    import boaviztapi.service.archetype as archetype_service
+
+    registry = archetype_service.ArchetypeRegistry()
+    calls = []
+    load = archetype_service.load_archetype_index
+    monkeypatch.setattr(archetype_service, "load_archetype_index", lambda path: calls.append(path) or load(path))
+
+    csv_path = os.path.join(data_dir, "archetypes/server.csv")
+    assert registry.get("dellR740", csv_path)
+    assert registry.get("dellR740", csv_path) is registry.get("dellR740", csv_path)
+    assert not registry.get("nothing", csv_path)
+    assert calls == [csv_path]
+
+
+def test_archetype_registry_ids():
+    from boaviztapi.service.archetype import ArchetypeRegistry
+
+    csv_path = os.path.join(data_dir, "archetypes/server.csv")
+    ids = ArchetypeRegistry().ids(csv_path)
+    assert "dellR740" in ids
+    assert len(ids) == len(set(ids))
+
+
+def test_get_archetype_is_shared_and_read_only():
+    csv_path = os.path.join(data_dir, "archetypes/server.csv")
+    archetype = get_archetype("dellR740", csv_path=csv_path)
+    assert archetype is get_archetype("dellR740", csv_path=csv_path)
+    with pytest.raises(TypeError):
+        archetype["CPU"]["USAGE"] = {}
+    with pytest.raises(TypeError):
+        archetype["CPU"]["units"].update({"default": 4})
+
+
+def test_get_arch_component_does_not_mutate_archetype():
+    archetype = get_archetype("dellR740", csv_path=os.path.join(data_dir, "archetypes/server.csv"))
+    cpu = get_arch_component(archetype, "CPU")
+    assert cpu["USAGE"] is archetype["USAGE"]
+    assert cpu["units"] == archetype["CPU"]["units"]
+    assert "USAGE" not in archetype["CPU"]
+
+
+def test_frozen_archetype_can_be_pickled():
+    archetype = get_archetype("dellR740", csv_path=os.path.join(data_dir, "archetypes/server.csv"))
+    assert pickle.loads(pickle.dumps(archetype)) == archetype
+
+
+def test_lazy_archetype_is_resolved_once_on_first_use():
+    from boaviztapi.service.archetype import LazyArchetype, resolve_archetype
+
+    lookups = []
+    lazy = LazyArchetype(lambda: lookups.append(1) or {"units": {"default": 1}})
+    assert lookups == []
+    assert resolve_archetype(lazy) == {"units": {"default": 1}}
+    assert resolve_archetype(lazy) is resolve_archetype(lazy)
+    assert lookups == [1]
+    assert resolve_archetype(None) is None
+    assert resolve_archetype(False) is False
+
+
+def test_default_archetype_matches_config():
+    from boaviztapi import config
+    from boaviztapi.model.device.server import DeviceServer
+
+    assert DeviceServer().archetype == get_archetype(config["default_server"],
+                                                     csv_path=os.path.join(data_dir, "archetypes/server.csv"))
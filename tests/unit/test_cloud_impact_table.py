@@ -0,0 +1,85 @@
+import pytest
+
+from boaviztapi.dto.device import Cloud
+from boaviztapi.dto.device.device import mapper_cloud_instance
+from boaviztapi.service.archetype import get_cloud_instance_archetype
+from boaviztapi.service.cloud_impact_table import CloudImpactTable
+from boaviztapi.service.impacts_computation import compute_impacts
+from boaviztapi.utils import data_version
+
+
+@pytest.fixture
+def small_cloud_impact_table():
+    table = CloudImpactTable()
+    table.build(instances=[("aws", "a1.4xlarge"), ("aws", "a1.large")])
+    return table
+
+
+def test_cloud_impact_table_matches_impact_engine(small_cloud_impact_table):
+    criteria = ["gwp", "adp", "pe", "ir"]
+    instance = mapper_cloud_instance(Cloud(), archetype=get_cloud_instance_archetype("a1.large", "aws"))
+    impacts = compute_impacts(instance, selected_criteria=criteria,
+                              duration=instance.platform.usage.hours_life_time.value)
+
+    assert small_cloud_impact_table.is_ready()
+    assert small_cloud_impact_table.get("aws", "a1.large", criteria) == impacts
+
+
+def test_cloud_impact_table_misses_fall_through(small_cloud_impact_table):
+    assert small_cloud_impact_table.get("aws", "m5.xlarge", ["gwp"]) is None
+    assert small_cloud_impact_table.get("aws", "a1.4xlarge", ["gwp", "not_a_criteria"]) is None
+
+
+def test_cloud_impact_table_persistence(small_cloud_impact_table, tmp_path, monkeypatch):
+    path = str(tmp_path / "cloud_impacts.json")
+    small_cloud_impact_table.save(path)
+
+    loaded = CloudImpactTable()
+    assert loaded.load(path)
+    assert loaded.get("aws", "a1.4xlarge", ["gwp"]) == small_cloud_impact_table.get("aws", "a1.4xlarge", ["gwp"])
+
+    monkeypatch.setattr("boaviztapi.service.cloud_impact_table.data_fingerprint", lambda: "other data")
+    stale = CloudImpactTable()
+    assert not stale.load(path)
+    assert not stale.is_ready()
+
+
+def test_stale_cloud_impact_table_is_not_used(small_cloud_impact_table, monkeypatch):
+    monkeypatch.setattr("boaviztapi.service.cloud_impact_table.current_data_fingerprint", lambda: "other data")
+    assert small_cloud_impact_table.get("aws", "a1.large", ["gwp"]) is None
+    assert small_cloud_impact_table.get_verbose("aws", "a1.large") is None
+
+
+@pytest.mark.asyncio
+async def test_cloud_impact_table_serves_the_default_requests(small_cloud_impact_table, tmp_path, monkeypatch):
+    from httpx import AsyncClient
+    from boaviztapi.main import app
+    from boaviztapi.service.cloud_impact_table import precompute_cloud_impact_table
+    from boaviztapi.service.response_cache import response_cache
+    urls = ['/v1/cloud/instance?provider=aws&instance_type=a1.large',
+            '/v1/cloud/instance?provider=aws&instance_type=a1.large&verbose=false&criteria=gwp']
+    response_cache.clear()
+    async with AsyncClient(app=app, base_url="http://test") as ac:
+        computed = [await ac.get(url) for url in urls]
+
+        path = str(tmp_path / "cloud_impacts.json")
+        small_cloud_impact_table.save(path)
+        table = CloudImpactTable()
+        monkeypatch.setattr("boaviztapi.service.cloud_impact_table.cloud_impact_table", table)
+        monkeypatch.setattr("boaviztapi.routers.cloud_router.cloud_impact_table", table)
+        assert precompute_cloud_impact_table(path, precompute=False) is None and table.is_ready()
+        response_cache.clear()
+        served = [await ac.get(url) for url in urls]
+
+    assert response_cache.stats()["misses"] == 0
+    for computed_response, served_response in zip(computed, served):
+        assert served_response.json() == computed_response.json()
+
+
+def test_data_fingerprint_changes_with_content(tmp_path):
+    (tmp_path / "factors.yml").write_text("a: 1")
+    fingerprint = data_version.data_fingerprint(str(tmp_path))
+    assert data_version.data_fingerprint(str(tmp_path)) == fingerprint
+
+    (tmp_path / "factors.yml").write_text("a: 2")
+    assert data_version.data_fingerprint(str(tmp_path)) != fingerprint
@@ -197,4 +197,50 @@ def test_ram_with_capacity(capacity: int, expected_model_params: Dict[str, float
     ram_cp.compute_consumption_profile_model(capacity)
     expected_model = RAMConsumptionProfileModel()
     expected_model.params.value = expected_model_params
-    validate_models_approx(ram_cp, expected_model)
\ No newline at end of file
+    validate_models_approx(ram_cp, expected_model)
+
+@pytest.fixture
+def empty_tdp_fit_cache():
+    from boaviztapi.model.consumption_profile.consumption_profile import tdp_fit_cache
+    tdp_fit_cache.clear()
+    yield tdp_fit_cache
+    tdp_fit_cache.clear()
+
+
+def test_cpu_tdp_fit_is_memoized(empty_tdp_fit_cache, monkeypatch):
+    first = CPUConsumptionProfileModel().compute_consumption_profile_model(cpu_model_range="Xeon Gold", cpu_tdp=150)
+    assert len(empty_tdp_fit_cache) == 1
+
+    monkeypatch.setattr("scipy.optimize.curve_fit", None)  # any new fit would fail
+    cpu_cp = CPUConsumptionProfileModel()
+    assert cpu_cp.compute_consumption_profile_model(cpu_model_range="Xeon Gold", cpu_tdp=150.0) == first
+    assert cpu_cp.workloads.is_set()
+
+
+def test_cpu_tdp_fit_cache_persistence(empty_tdp_fit_cache, tmp_path):
+    from boaviztapi.model.consumption_profile.consumption_profile import TDPFitCache, prewarm_tdp_fit_cache
+
+    cache_path = str(tmp_path / "tdp_fits.json")
+    computed = prewarm_tdp_fit_cache(cache_path=cache_path, fit_cpu_specs=True)
+    assert computed == len(empty_tdp_fit_cache) > 0
+
+    reloaded = TDPFitCache()
+    reloaded.load(cache_path)
+    assert len(reloaded) == computed
+    assert prewarm_tdp_fit_cache(cache_path=cache_path, fit_cpu_specs=True) == 0
+
+
+def test_cpu_tdp_fit_cache_is_bounded():
+    from boaviztapi.model.consumption_profile.consumption_profile import TDPFitCache
+
+    base_model = {"a": 1, "b": 2, "c": 3, "d": 4}
+    cache = TDPFitCache(max_size=2)
+    cache.set(base_model, 100, {"a": 100})
+    cache.pin_all()
+    for tdp in (101, 102, 103):
+        cache.set(base_model, tdp, {"a": tdp})
+
+    assert len(cache) == 3
+    assert cache.get(base_model, 100) == {"a": 100}
+    assert cache.get(base_model, 101) is None
+    assert cache.get(base_model, 103) == {"a": 103}
@@ -0,0 +1,65 @@
+import os
+
+import pandas as pd
+import pytest
+
+from boaviztapi import data_dir
+from boaviztapi.service.archetype import load_archetype_index
+from boaviztapi.utils import data_snapshot
+
+
+@pytest.fixture
+def snapshot_file(tmp_path, monkeypatch):
+    path = str(tmp_path / "data_snapshot.pickle")
+    data_snapshot.build_snapshot(path)
+    monkeypatch.setenv("BOAVIZTAPI_DATA_SNAPSHOT", path)
+    data_snapshot.reset_snapshot()
+    yield path
+    data_snapshot.reset_snapshot()
+
+
+def test_snapshot_matches_data_files(snapshot_file):
+    assert data_snapshot.get_snapshot() is not None
+
+    cpu_specs = os.path.join(data_dir, 'crowdsourcing/cpu_specs.csv')
+    pd.testing.assert_frame_equal(data_snapshot.read_csv(cpu_specs), pd.read_csv(cpu_specs))
+
+    factors = os.path.join(data_dir, 'factors.yml')
+    assert data_snapshot.load_yaml(factors) == data_snapshot._parse_yaml(factors)
+
+    server = os.path.join(data_dir, 'archetypes/server.csv')
+    assert data_snapshot.snapshot_archetype_index(server) == load_archetype_index(server)
+
+
+def test_stale_snapshot_falls_back_to_data_files(snapshot_file, monkeypatch):
+    monkeypatch.setattr("boaviztapi.utils.data_snapshot.data_fingerprint", lambda directory: "other data")
+    assert data_snapshot.load_snapshot(snapshot_file) is None
+    assert data_snapshot.get_snapshot() is None
+
+    server = os.path.join(data_dir, 'archetypes/server.csv')
+    assert data_snapshot.snapshot_archetype_index(server) is None
+    assert not data_snapshot.read_csv(server).empty
+
+
+def test_missing_or_unreadable_snapshot(tmp_path):
+    assert data_snapshot.load_snapshot(str(tmp_path / "missing.pickle")) is None
+    (tmp_path / "broken.pickle").write_bytes(b"not a pickle")
+    assert data_snapshot.load_snapshot(str(tmp_path / "broken.pickle")) is None
+
+
+def test_data_change_clears_loaded_data(monkeypatch):
+    from boaviztapi.service.archetype import archetype_registry, get_server_archetype
+    from boaviztapi.service.factor_provider import get_impact_factor_value
+    from boaviztapi.utils import data_version
+
+    get_server_archetype("dellR740")
+    get_impact_factor_value("cpu", "gwp", "die_impact")
+    generation = archetype_registry.generation
+    fingerprint = data_version.data_fingerprint()
+
+    # as if the files had been modified since the previous fingerprint
+    monkeypatch.setitem(data_version._fingerprints, data_dir, ((), "previous data"))
+    assert data_version.data_fingerprint() == fingerprint
+    assert archetype_registry.generation == generation + 1
+    assert archetype_registry._indexes == {}
+    assert data_snapshot.data_table.cache_info().currsize == 0
@@ -0,0 +1,95 @@
+import asyncio
+import threading
+
+import pytest
+from fastapi import HTTPException
+
+from boaviztapi.service.execution import ComputeExecutor, INLINE, THREAD, PROCESS, SingleFlight
+
+pytest_plugins = ('pytest_asyncio',)
+
+
+def _thread_name(value):
+    return value, threading.current_thread().name
+
+
+@pytest.mark.asyncio
+async def test_inline_runs_on_the_event_loop_thread():
+    executor = ComputeExecutor(strategy=INLINE)
+    assert await executor.run(_thread_name, 1) == (1, threading.current_thread().name)
+
+
+@pytest.mark.asyncio
+async def test_thread_runs_in_the_pool():
+    executor = ComputeExecutor(strategy=THREAD, workers=2)
+    value, thread_name = await executor.run(_thread_name, 1)
+    executor.shutdown()
+
+    assert value == 1
+    assert thread_name.startswith("compute")
+
+
+@pytest.mark.asyncio
+async def test_full_queue_is_rejected():
+    executor = ComputeExecutor(strategy=THREAD, workers=1, queue_depth=1)
+    release = threading.Event()
+
+    running = [asyncio.ensure_future(executor.run(release.wait)) for _ in range(2)]
+    await asyncio.sleep(0)
+    with pytest.raises(HTTPException) as e:
+        await executor.run(release.wait)
+    assert e.value.status_code == 503
+
+    release.set()
+    await asyncio.gather(*running)
+    assert executor.pending == 0
+    executor.shutdown()
+
+
+def test_executor_from_env(monkeypatch):
+    monkeypatch.setenv("BOAVIZTAPI_EXECUTION_STRATEGY", "PROCESS")
+    monkeypatch.setenv("BOAVIZTAPI_WORKERS", "3")
+    monkeypatch.setenv("BOAVIZTAPI_QUEUE_DEPTH", "10")
+    executor = ComputeExecutor.from_env()
+
+    assert (executor.strategy, executor.workers, executor.queue_depth) == (PROCESS, 3, 10)
+
+    with pytest.raises(ValueError):
+        ComputeExecutor(strategy="fibers")
+
+
+@pytest.mark.asyncio
+async def test_single_flight_coalesces_identical_computations():
+    flights = SingleFlight()
+    release = asyncio.Event()
+    calls = []
+
+    async def compute(value):
+        calls.append(value)
+        await release.wait()
+        return {"value": value}
+
+    requests = [asyncio.ensure_future(flights.run("key", compute, 1)) for _ in range(3)]
+    other = asyncio.ensure_future(flights.run("other", compute, 2))
+    await asyncio.sleep(0)
+    release.set()
+    results = await asyncio.gather(*requests, other)
+
+    assert calls == [1, 2]
+    assert results[0] is results[1] is results[2]
+    assert flights.coalesced == 2
+    assert flights.in_flight() == 0
+
+
+@pytest.mark.asyncio
+async def test_single_flight_shares_errors():
+    flights = SingleFlight()
+
+    async def fail():
+        await asyncio.sleep(0)
+        raise HTTPException(status_code=404)
+
+    results = await asyncio.gather(flights.run("key", fail), flights.run("key", fail), return_exceptions=True)
+
+    assert all(isinstance(result, HTTPException) for result in results)
+    assert flights.in_flight() == 0
@@ -0,0 +1,33 @@
+import pytest
+
+from boaviztapi.service.factor_provider import get_impact_factor_value, get_iot_impact_factor, impact_factors, \
+    get_electrical_factor_matrix
+
+
+def test_get_impact_factor_value():
+    assert get_impact_factor_value('cpu', 'gwp', 'die_impact') == impact_factors['cpu']['gwp']['die_impact']
+    assert get_impact_factor_value('case', 'pe', 'blade', 'impact_blade_server') == \
+           impact_factors['case']['pe']['blade']['impact_blade_server']
+
+
+def test_get_impact_factor_value_not_implemented():
+    with pytest.raises(NotImplementedError):
+        get_impact_factor_value('cpu', 'fw', 'die_impact')
+    with pytest.raises(NotImplementedError):
+        get_impact_factor_value('cpu', 'gwp', 'source')
+
+
+def test_get_iot_impact_factor():
+    factors = impact_factors['IoT']['actuators']['HSL-1']
+    assert get_iot_impact_factor('actuators', 'HSL-1', 'gwp') == factors['manufacture']['gwp'] + factors['eol']['gwp']
+    with pytest.raises(NotImplementedError):
+        get_iot_impact_factor('actuators', 'HSL-1', 'adp')
+
+
+def test_get_electrical_factor_matrix():
+    matrix = get_electrical_factor_matrix()
+    row = matrix.locations.index("FRA")
+
+    assert matrix.factors[row, matrix.criteria["gwp"]] == impact_factors['electricity']['FRA']['gwp']['value']
+    assert "country" not in matrix.criteria
+    assert matrix.factors.shape == (len(impact_factors['electricity']['available_countries']), len(matrix.criteria))
@@ -0,0 +1,117 @@
+import math
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from boaviztapi.model.component import ComponentSSD, ComponentHDD
+from boaviztapi.model.device.server import DeviceServer
+from boaviztapi.model.impact import IMPACT_CRITERIAS, IMPACT_PHASES
+from boaviztapi.service.archetype import get_arch_component
+from boaviztapi.service.fleet_computation import compute_fleet_impacts
+from boaviztapi.service.impacts_computation import compute_single_impact
+
+CRITERIA = [c for c in IMPACT_CRITERIAS if c == IMPACT_CRITERIAS[c].name]
+
+
+def object_server(row: dict) -> DeviceServer:
+    server = DeviceServer()
+    server.disk = [ComponentSSD(archetype=get_arch_component(server.archetype, "SSD")),
+                   ComponentHDD(archetype=get_arch_component(server.archetype, "HDD"))]
+    attributes = {
+        "units": server.units,
+        "CPU.units": server.cpu.units,
+        "CPU.die_size": server.cpu.die_size,
+        "RAM.units": server.ram[0].units,
+        "RAM.capacity": server.ram[0].capacity,
+        "RAM.density": server.ram[0].density,
+        "SSD.units": server.disk[0].units,
+        "SSD.capacity": server.disk[0].capacity,
+        "SSD.density": server.disk[0].density,
+        "HDD.units": server.disk[1].units,
+        "POWER_SUPPLY.units": server.power_supply.units,
+        "POWER_SUPPLY.unit_weight": server.power_supply.unit_weight,
+        "CASE.case_type": server.case.case_type,
+        "USAGE.avg_power": server.usage.avg_power,
+        "USAGE.use_time_ratio": server.usage.use_time_ratio,
+        "USAGE.hours_life_time": server.usage.hours_life_time,
+        "USAGE.usage_location": server.usage.usage_location,
+    }
+    for column, value in row.items():
+        if column in attributes and not pd.isna(value):
+            attributes[column].set_input(value)
+    return server
+
+
+def assert_same_impacts(row: dict, fleet_impacts: pd.Series, duration: float, phases=IMPACT_PHASES):
+    server = object_server(row)
+    for criteria in CRITERIA:
+        for phase in phases:
+            try:
+                impact = compute_single_impact(server, phase, criteria, duration)
+            except KeyError:
+                impact = None  # criteria without electricity factors
+            if impact is None:
+                assert math.isnan(fleet_impacts[f"{criteria}.{phase}.value"]), (criteria, phase)
+                continue
+            for stat in ("value", "min", "max"):
+                assert fleet_impacts[f"{criteria}.{phase}.{stat}"] == pytest.approx(getattr(impact, stat), rel=1e-9), \
+                    (criteria, phase, stat)
+
+
+def random_fleet(size: int) -> pd.DataFrame:
+    rng = np.random.default_rng(42)
+    return pd.DataFrame({
+        "units": rng.integers(1, 4, size),
+        "CPU.units": rng.integers(1, 4, size),
+        "CPU.die_size": rng.uniform(50, 800, size),
+        "RAM.units": rng.integers(1, 24, size),
+        "RAM.capacity": rng.choice([16, 32, 64], size),
+        "RAM.density": rng.uniform(0.5, 2.5, size),
+        "SSD.units": rng.integers(0, 4, size),
+        "SSD.capacity": rng.choice([400, 1000, 4000], size),
+        "SSD.density": rng.uniform(20, 120, size),
+        "HDD.units": rng.integers(0, 3, size),
+        "POWER_SUPPLY.units": rng.integers(1, 3, size),
+        "POWER_SUPPLY.unit_weight": rng.uniform(1, 5, size),
+        "CASE.case_type": rng.choice(["rack", "blade"], size),
+        "USAGE.avg_power": rng.uniform(100, 800, size),
+        "USAGE.use_time_ratio": rng.uniform(0.2, 1, size),
+        "USAGE.hours_life_time": rng.choice([26280, 35040, 43800], size),
+        "USAGE.usage_location": rng.choice(["FRA", "USA", "DEU", "XXX"], size),
+        "duration": rng.choice([8760, 35040, 50000], size),
+    })
+
+
+def test_fleet_same_impacts_as_object_engine():
+    fleet = random_fleet(40)
+    impacts = compute_fleet_impacts(fleet, CRITERIA)
+
+    assert len(impacts) == len(fleet)
+    for (_, row), (_, row_impacts) in zip(fleet.iterrows(), impacts.iterrows()):
+        assert_same_impacts(row.to_dict(), row_impacts, row["duration"])
+
+
+def test_fleet_missing_values_from_archetype():
+    fleet = pd.DataFrame({"USAGE.avg_power": [300, np.nan], "CPU.die_size": [np.nan, 400]})
+    impacts = compute_fleet_impacts(fleet, CRITERIA, duration=8760)
+
+    assert_same_impacts({"USAGE.avg_power": 300}, impacts.iloc[0], 8760)
+    assert_same_impacts({"CPU.die_size": 400}, impacts.iloc[1], 8760)
+
+
+def test_fleet_modeled_power_consumption():
+    fleet = random_fleet(12).drop(columns="USAGE.avg_power")
+    fleet.loc[::3, "RAM.capacity"] = np.nan
+    fleet.loc[1::4, "CPU.units"] = np.nan
+    impacts = compute_fleet_impacts(fleet, CRITERIA)
+
+    for (_, row), (_, row_impacts) in zip(fleet.iterrows(), impacts.iterrows()):
+        assert_same_impacts(row.to_dict(), row_impacts, row["duration"])
+
+
+def test_fleet_duration_defaults_to_life_time():
+    fleet = pd.DataFrame({"USAGE.hours_life_time": [20000, 40000], "USAGE.avg_power": [100, 100]})
+    impacts = compute_fleet_impacts(fleet, ["gwp"])
+
+    assert impacts["gwp.use.value"][1] == pytest.approx(2 * impacts["gwp.use.value"][0])
@@ -1,4 +1,5 @@
-from boaviztapi.utils.fuzzymatch import fuzzymatch_attr_from_pdf, fuzzymatch_attr_from_cpu_name
+from boaviztapi.utils.fuzzymatch import fuzzymatch_attr_from_pdf, fuzzymatch_attr_from_cpu_name, CPUNameIndex, \
+    cpu_name_index
 import pytest
 
 
@@ -32,4 +33,65 @@ def test_fuzzymatch_ssd(ssd_dataframe):
 
 def test_fuzzymatch_ram(ram_dataframe):
     assert "samsung" == fuzzymatch_attr_from_pdf("samesung", "manufacturer", ram_dataframe).lower()
-    assert fuzzymatch_attr_from_pdf("4R", "manufacturer", ram_dataframe) is None
\ No newline at end of file
+    assert fuzzymatch_attr_from_pdf("4R", "manufacturer", ram_dataframe) is None
+
+
+def test_cpu_name_index_match_many(cpu_specs_dataframe):
+    index = CPUNameIndex(cpu_specs_dataframe)
+    names = ["AMD EPYC 7R32 48-Core Processor", "Intel(R) Xeon(R) CPU E5-2660 0 @ 2.20GHz", "cevevvreceerf"]
+    assert index.match_many(names, workers=2) == [index.match(name) for name in names]
+    assert index.match("cevevvreceerf") is None
+    assert index.match_many([]) == []
+
+
+def test_cpu_name_index_returns_python_types(cpu_specs_dataframe):
+    name, manufacturer, _, _, tdp, cores, threads, _, _, _ = CPUNameIndex(cpu_specs_dataframe).match(
+        "AMD EPYC 7R32 48-Core Processor")
+    assert (name, manufacturer, tdp, cores, threads) == ("AMD EPYC 7R32", "AMD", 280, 48, 96)
+    assert all(type(value) is int for value in (tdp, cores, threads))
+
+
+@pytest.fixture
+def counted_cpu_name_matches(monkeypatch):
+    import boaviztapi.model.component.cpu as cpu_module
+
+    matched = []
+    index = cpu_module._cpu_name_index()
+
+    class CountingIndex:
+        def match(self, cpu_name):
+            matched.append(cpu_name)
+            return index.match(cpu_name)
+
+    monkeypatch.setattr(cpu_module, "_cpu_name_index", CountingIndex)
+    cpu_module._attributes_from_normalized_cpu_name.cache_clear()
+    yield matched
+    cpu_module._attributes_from_normalized_cpu_name.cache_clear()
+
+
+def test_cpu_name_resolution_runs_once_per_distinct_name(counted_cpu_name_matches):
+    from boaviztapi.model.component import ComponentCPU
+
+    for _ in range(2):
+        cpu = ComponentCPU()
+        cpu.name.set_input("Intel Xeon Gold 6134")
+        cpu.core_units.value, cpu.family.value, cpu.tdp.value, cpu.threads.value, cpu.die_size.value
+
+    assert counted_cpu_name_matches == ["intel xeon gold 6134"]
+
+
+def test_cpu_name_resolution_caches_no_match(counted_cpu_name_matches):
+    from boaviztapi.model.component import ComponentCPU
+
+    for name in ("cevevvreceerf", " CEVEVVRECEERF  "):
+        cpu = ComponentCPU()
+        cpu.name.set_input(name)
+        cpu.core_units.value, cpu.family.value, cpu.tdp.value, cpu.threads.value
+
+    assert counted_cpu_name_matches == ["cevevvreceerf"]
+
+
+def test_cpu_name_index_is_built_once_per_dataframe(cpu_specs_dataframe):
+    index = cpu_name_index(cpu_specs_dataframe)
+    assert cpu_name_index(cpu_specs_dataframe) is index
+    assert cpu_name_index(cpu_specs_dataframe.copy()) is not index
@@ -0,0 +1,79 @@
+import pytest
+
+from boaviztapi.dto.device.device import mapper_server
+from boaviztapi.model.component import ComponentPowerSupply
+from boaviztapi.model.impact import IMPACT_CRITERIAS, IMPACT_PHASES, NOT_IMPLEMENTED
+from boaviztapi.service import impacts_computation
+from boaviztapi.service.impacts_computation import compute_single_impact, impact_capabilities, impacts_functions
+
+
+def test_impact_capabilities():
+    capabilities = impact_capabilities()
+
+    assert capabilities[("CPU", "embedded")] == {"gwp", "pe", "adp"}
+    assert capabilities[("POWER_SUPPLY", "use")] == set()
+    assert "gwp" in capabilities[("SERVER", "use")]
+    assert "fw" not in capabilities[("SERVER", "use")]
+    assert "mips" in capabilities[("SERVER", "embedded")]
+    assert ("IOT_DEVICE", "embedded") not in capabilities
+
+
+def test_not_implemented_criteria_skips_impact_function(monkeypatch):
+    def impact_function(impact_type, duration, model):
+        pytest.fail("impact function called for a criteria without factors")
+
+    monkeypatch.setitem(impacts_functions["POWER_SUPPLY"], "use", impact_function)
+    power_supply = ComponentPowerSupply()
+
+    assert compute_single_impact(power_supply, "use", "gwp", 8760) is None
+    assert compute_single_impact(ComponentPowerSupply(), "embedded", "gwp", 8760) is not None
+    assert power_supply.get_impacts(["gwp"])["gwp"]["use"] == NOT_IMPLEMENTED
+
+
+@pytest.mark.parametrize("criteria", [c for c in IMPACT_CRITERIAS if c == IMPACT_CRITERIAS[c].name])
+def test_impact_capabilities_same_impacts(monkeypatch, dell_r740_dto, criteria):
+    def compute(server):
+        impacts = {}
+        for phase in IMPACT_PHASES:
+            try:
+                impacts[phase] = compute_single_impact(server, phase, criteria, 8760)
+            except KeyError:
+                # criteria without electricity factors, e.g. fw, used to fail on the use phase
+                impacts[phase] = None
+        return impacts
+
+    with_capabilities = compute(mapper_server(dell_r740_dto))
+    monkeypatch.setattr(impacts_computation, "is_implemented", lambda model, phase, criteria: True)
+    without_capabilities = compute(mapper_server(dell_r740_dto))
+
+    for phase in IMPACT_PHASES:
+        if without_capabilities[phase] is None:
+            assert with_capabilities[phase] is None
+        else:
+            assert with_capabilities[phase].to_json() == without_capabilities[phase].to_json()
+
+
+def test_electricity_consumption_leaves_model_unchanged(dell_r740_dto):
+    server = mapper_server(dell_r740_dto)
+    impacts_computation.compute_impacts(server, ["gwp"], 8760)
+    impacts = server.get_impacts(["gwp"])
+    cpu_impacts = server.cpu.get_impacts(["gwp"])
+
+    consumption = impacts_computation.electricity_consumption(server, 8760)
+    gwp_factor = server.usage.elec_factors["gwp"]
+
+    assert consumption.value * gwp_factor.value == pytest.approx(server.impacts["gwp"]["use"].value)
+    assert server.get_impacts(["gwp"]) == impacts
+    assert server.cpu.get_impacts(["gwp"]) == cpu_impacts
+
+
+def test_electricity_consumption_raises_errors(dell_r740_dto, monkeypatch):
+    server = mapper_server(dell_r740_dto)
+
+    def fail(impact_factor, duration, model):
+        raise AttributeError("broken formula")
+
+    monkeypatch.setitem(impacts_computation.electricity_impact_functions, impacts_computation.server_impact_use,
+                        fail)
+    with pytest.raises(AttributeError):
+        impacts_computation.electricity_consumption(server, 8760)
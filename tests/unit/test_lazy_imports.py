@@ -0,0 +1,24 @@
+import os
+import subprocess
+import sys
+
+ROOT = os.path.join(os.path.dirname(__file__), '../..')
+
+
+def test_heavy_libraries_are_not_imported_with_the_app():
+    code = ("import sys\n"
+            "import boaviztapi.main\n"
+            "print(' '.join(m for m in ('pandas', 'numpy', 'scipy', 'rapidfuzz', 'markdown', 'toml') "
+            "if m in sys.modules))")
+    result = subprocess.run([sys.executable, "-c", code], env=dict(os.environ, PYTHONPATH=ROOT), cwd=ROOT,
+                            capture_output=True, text=True, check=True)
+    assert result.stdout.strip() == ""
+
+
+def test_no_archetype_file_is_read_with_the_app():
+    code = ("import boaviztapi.main\n"
+            "from boaviztapi.service.archetype import archetype_registry\n"
+            "print(len(archetype_registry._indexes))")
+    result = subprocess.run([sys.executable, "-c", code], env=dict(os.environ, PYTHONPATH=ROOT), cwd=ROOT,
+                            capture_output=True, text=True, check=True)
+    assert result.stdout.strip() == "0"
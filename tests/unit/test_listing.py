@@ -0,0 +1,32 @@
+import json
+
+from boaviztapi.service import listing
+from boaviztapi.service.listing import get_listing, listing_response, make_listing
+
+
+def test_listing_response():
+    names = make_listing(["Intel Xeon Gold 6138", "AMD EPYC 7502", "intel Xeon Silver 4114", "Intel Core i7"])
+
+    assert listing_response(names).body == json.dumps(list(names.items), separators=(",", ":")).encode()
+    res = listing_response(names, prefix="INTEL xeon", offset=1)
+    assert json.loads(res.body) == ["intel Xeon Silver 4114"]
+    assert res.headers["x-total-count"] == "2"
+    assert json.loads(listing_response(names, limit=2).body) == ["Intel Xeon Gold 6138", "AMD EPYC 7502"]
+
+
+def test_listing_built_once_per_data_version(monkeypatch):
+    builds = []
+
+    def build():
+        builds.append(1)
+        return ["a", "b"]
+
+    listing.clear_listings()
+    monkeypatch.setattr(listing, "current_data_fingerprint", lambda: "v1")
+    assert get_listing("test", build) is get_listing("test", build)
+    assert len(builds) == 1
+
+    monkeypatch.setattr(listing, "current_data_fingerprint", lambda: "v2")
+    get_listing("test", build)
+    assert len(builds) == 2
+    listing.clear_listings()
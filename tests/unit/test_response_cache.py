@@ -0,0 +1,85 @@
+import asyncio
+
+from boaviztapi.service.response_cache import ResponseCache, response_key
+from boaviztapi.utils import data_version
+
+
+def test_response_cache_lru():
+    cache = ResponseCache(max_size=2)
+    cache.put("a", "v1", 1)
+    cache.put("b", "v1", 2)
+    assert cache.get("a", "v1") == 1
+    cache.put("c", "v1", 3)
+
+    assert cache.get("b", "v1") is None
+    assert cache.get("a", "v1") == 1
+    assert cache.get("c", "v1") == 3
+    assert (cache.hits, cache.misses) == (3, 1)
+
+
+def test_response_cache_ttl(monkeypatch):
+    now = [100.0]
+    monkeypatch.setattr("boaviztapi.service.response_cache.time.monotonic", lambda: now[0])
+    cache = ResponseCache(max_size=2, ttl=10)
+    cache.put("a", "v1", 1)
+
+    now[0] = 105.0
+    assert cache.get("a", "v1") == 1
+    now[0] = 111.0
+    assert cache.get("a", "v1") is None
+
+
+def test_response_cache_data_version():
+    cache = ResponseCache(max_size=2)
+    cache.put("a", "v1", 1)
+    assert cache.get("a", "v1") == 1
+
+    assert cache.get("a", "v2") is None
+    cache.put("a", "v2", 2)
+    assert cache.get("a", "v1") is None
+    assert cache.stats()["size"] == 0
+
+
+def test_response_cache_run():
+    cache = ResponseCache(max_size=2)
+    calls = []
+
+    async def compute(value):
+        calls.append(value)
+        return {"value": value}
+
+    key = response_key("server", None, verbose=False, criteria=["gwp"])
+    assert asyncio.run(cache.run(key, compute, 1)) == {"value": 1}
+    assert asyncio.run(cache.run(key, compute, 1)) == {"value": 1}
+    assert asyncio.run(cache.run(None, compute, 1)) == {"value": 1}
+    assert calls == [1, 1]
+
+
+def test_response_cache_hits_do_not_walk_the_data(monkeypatch):
+    cache = ResponseCache(max_size=2)
+    walks = []
+    stat_signature = data_version._stat_signature
+
+    def counted_stat_signature(directory):
+        walks.append(directory)
+        return stat_signature(directory)
+
+    async def compute(value):
+        return {"value": value}
+
+    monkeypatch.setattr(data_version, "_stat_signature", counted_stat_signature)
+    data_version.reload_data()
+    for _ in range(3):
+        asyncio.run(cache.run("a", compute, 1))
+    assert len(walks) == 1
+
+    data_version.reload_data()
+    asyncio.run(cache.run("a", compute, 1))
+    assert len(walks) == 2
+
+
+def test_response_key():
+    assert response_key("server", None, verbose=False, criteria=["gwp"]) == \
+           response_key("server", None, criteria=["gwp"], verbose=False)
+    assert response_key("server", None, verbose=False, criteria=["gwp"]) != \
+           response_key("server", None, verbose=True, criteria=["gwp"])
@@ -0,0 +1,26 @@
+import json
+
+import numpy as np
+import pytest
+from fastapi.encoders import jsonable_encoder
+
+from boaviztapi.dto.device.device import mapper_server
+from boaviztapi.service import serialization
+from boaviztapi.service.impacts_computation import compute_impacts
+from boaviztapi.service.verbose import verbose_device
+
+encoders = [serialization.dumps_json] + ([serialization.dumps_orjson] if serialization.orjson is not None else [])
+
+
+@pytest.mark.parametrize("dumps", encoders)
+def test_same_content_as_jsonable_encoder(dell_r740_dto, dumps):
+    server = mapper_server(dell_r740_dto)
+    content = {"impacts": compute_impacts(server, ["gwp", "pe"], 8760), "verbose": verbose_device(server, ["gwp"])}
+
+    assert json.loads(dumps(content)) == jsonable_encoder(content)
+
+
+@pytest.mark.parametrize("dumps", encoders)
+def test_numpy_values(dumps):
+    assert json.loads(dumps({"value": np.float64(1.5), "units": np.int64(2), "values": np.array([1.0, 2.0])})) == \
+           {"value": 1.5, "units": 2, "values": [1.0, 2.0]}
@@ -0,0 +1,61 @@
+import pytest
+
+from boaviztapi.dto.device.device import mapper_server
+from boaviztapi.service import uncertainty
+from boaviztapi.service.impacts_computation import compute_impacts, compute_single_impact
+from boaviztapi.service.uncertainty import compute_impact_distributions
+from boaviztapi.service.verbose import verbose_device
+
+
+def test_impact_distributions_within_min_max(dell_r740_dto):
+    server = mapper_server(dell_r740_dto)
+    impacts = compute_impacts(server, ["gwp", "pe"], 8760)
+
+    distributions = compute_impact_distributions(server, ["gwp", "pe"], 8760, 1000)
+
+    assert distributions["samples"] == 1000
+    for criteria in ("gwp", "pe"):
+        for phase in ("embedded", "use"):
+            percentiles = distributions["impacts"][criteria][phase]
+            assert impacts[criteria][phase]["min"] <= percentiles["p5"] <= percentiles["p50"]
+            assert percentiles["p50"] <= percentiles["p95"] <= impacts[criteria][phase]["max"]
+
+
+def test_impact_distributions_leave_model_unchanged(dell_r740_dto):
+    server = mapper_server(dell_r740_dto)
+    impacts = compute_impacts(server, ["gwp"], 8760)
+    verbose = verbose_device(server, ["gwp"], 8760)
+
+    first = compute_impact_distributions(server, ["gwp"], 8760, 500)
+
+    assert server.get_impacts(["gwp"]) == impacts
+    assert verbose_device(server, ["gwp"], 8760) == verbose
+    assert compute_impact_distributions(server, ["gwp"], 8760, 500) == first
+
+
+def test_impact_distributions_keep_units(dell_r740_dto, monkeypatch):
+    server = mapper_server(dell_r740_dto)
+    server.cpu.units.set_completed(2, min=1, max=4)
+    compute_impacts(server, ["gwp"], 8760)
+    drawn = []
+
+    def record_units(model, phase, criteria, duration):
+        drawn.append(server.cpu.units.value)
+        return compute_single_impact(model, phase, criteria, duration)
+
+    monkeypatch.setattr(uncertainty, "compute_single_impact", record_units)
+    compute_impact_distributions(server, ["gwp"], 8760, 100)
+
+    assert drawn and all(units == 2 for units in drawn)
+
+
+def test_impact_distributions_raise_errors(dell_r740_dto, monkeypatch):
+    server = mapper_server(dell_r740_dto)
+    compute_impacts(server, ["gwp"], 8760)
+
+    def fail(model, phase, criteria, duration):
+        raise ValueError("broken formula")
+
+    monkeypatch.setattr(uncertainty, "compute_single_impact", fail)
+    with pytest.raises(ValueError):
+        compute_impact_distributions(server, ["gwp"], 8760, 100)
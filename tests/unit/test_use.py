@@ -1,4 +1,6 @@
 from boaviztapi.dto.usage.usage import mapper_usage_server
+from boaviztapi.model.component import ComponentCPU
+from boaviztapi.model.consumption_profile import CPUConsumptionProfileModel
 from boaviztapi.model.device.server import DeviceServer
 from boaviztapi.service.impacts_computation import compute_single_impact
 
@@ -36,3 +38,52 @@ def test_usage_server_empty_usage(empty_usage_dto):
                                                                                               'be interpreted with caution (see min and max values)']}
     assert compute_single_impact(server, 'use', 'gwp', duration=365 * 24).to_json() == {'max': 64320.0, 'min': 38.55,
                                                                                           'value': 3000.0}
+
+
+def test_server_power_model_computed_once(monkeypatch):
+    fits = []
+    compute = CPUConsumptionProfileModel.compute_consumption_profile_model
+
+    def counted_compute(self, *args, **kwargs):
+        fits.append(kwargs)
+        return compute(self, *args, **kwargs)
+
+    monkeypatch.setattr(CPUConsumptionProfileModel, "compute_consumption_profile_model", counted_compute)
+    server = DeviceServer()
+
+    power = server.model_power_consumption()
+    assert server.model_power_consumption().value == power.value
+    assert len(fits) == 1
+
+
+def test_cpu_power_model_invalidated_on_input_change():
+    cpu = ComponentCPU()
+    cpu.tdp.set_input(100)
+    power_100 = cpu.model_power_consumption().value
+
+    cpu.tdp.set_input(200)
+    assert cpu.model_power_consumption().value > power_100
+
+    cpu.usage.time_workload.set_input(0)
+    assert cpu.model_power_consumption().value < power_100
+
+
+def test_elec_factors_are_created_on_first_use():
+    server = DeviceServer()
+    assert list(server.usage.elec_factors) == []
+    assert "gwp" in server.usage.elec_factors
+
+    compute_single_impact(server, 'use', 'gwp', duration=365 * 24)
+    assert list(server.usage.elec_factors) == ["gwp"]
+    assert server.usage.elec_factors["gwp"].unit == "kg CO2eq/kWh"
+    assert server.usage.elec_factors.get("not_a_criteria") is None
+
+
+def test_boattribute_warnings_are_allocated_on_first_warning():
+    from boaviztapi.model.boattribute import Boattribute
+
+    attribute = Boattribute(default=1)
+    assert not hasattr(attribute, "__dict__")
+    assert attribute.warnings == [] and "warnings" not in attribute.to_json()
+    attribute.add_warning("warning")
+    assert attribute.warnings == ["warning"]